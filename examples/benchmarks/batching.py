@@ -0,0 +1,109 @@
+"""
+Benchmark of the coalescing of concurrent inference calls by the BatchScheduler.
+
+Simulates concurrent scenarios that each score the candidate replies of a turn with a model whose latency is a fixed
+cost per call plus a cost per input, as for a forward pass of NSP or GODEL, with and without the scheduler:
+
+    python examples/benchmarks/batching.py --scenarios 8 --max-wait 0.005 --max-batch 32 --output results.json
+
+Reports the latency per turn as p50/p95/p99 in milliseconds, the throughput in turns per second and the fill rate of
+the batches.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from cltl.reply_generation.utils.batching import BatchScheduler
+
+
+class SimulatedModel(object):
+    """Serializes calls like a single model instance, the latency of a call grows with the size of the batch."""
+
+    def __init__(self, call_latency, input_latency):
+        self._call_latency = call_latency
+        self._input_latency = input_latency
+        self._lock = threading.Lock()
+
+    def __call__(self, inputs):
+        with self._lock:
+            time.sleep(self._call_latency + self._input_latency * len(inputs))
+
+        return [len(input) for input in inputs]
+
+
+def run(score, scenarios, turns, candidates):
+    durations = []
+    lock = threading.Lock()
+
+    def scenario(index):
+        for turn in range(turns):
+            inputs = [f"scenario {index} turn {turn} candidate {candidate}" for candidate in range(candidates)]
+            start = time.perf_counter()
+            score(inputs)
+            with lock:
+                durations.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=scenario, args=(index,)) for index in range(scenarios)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(np.array(durations) * 1000, [50, 95, 99])
+
+    return {"turns": len(durations), "turns_per_sec": len(durations) / elapsed,
+            "mean_ms": float(np.mean(durations) * 1000), "p50_ms": float(p50), "p95_ms": float(p95),
+            "p99_ms": float(p99)}
+
+
+def main(args):
+    model = SimulatedModel(args.call_latency, args.input_latency)
+
+    results = {"unbatched": run(model, args.scenarios, args.turns, args.candidates)}
+
+    scheduler = BatchScheduler(model, max_wait=args.max_wait, max_batch=args.max_batch, name="simulated")
+    try:
+        results["batched"] = run(scheduler.map, args.scenarios, args.turns, args.candidates)
+        results["batched"]["fill_rate"] = scheduler.fill_rate
+    finally:
+        scheduler.stop()
+
+    for name, result in results.items():
+        fill_rate = f"  fill rate {result['fill_rate']:.2f}" if "fill_rate" in result else ""
+        print(f"{name:<10} {result['turns_per_sec']:8.1f} turns/sec  p50 {result['p50_ms']:8.2f} ms  "
+              f"p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms{fill_rate}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": {"timestamp": datetime.datetime.now().isoformat(), "scenarios": args.scenarios,
+                                    "turns": args.turns, "candidates": args.candidates,
+                                    "call_latency": args.call_latency, "input_latency": args.input_latency,
+                                    "max_wait": args.max_wait, "max_batch": args.max_batch},
+                       "results": results}, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of concurrent inference calls with and without batching")
+    parser.add_argument("--scenarios", type=int, default=8, help="Number of concurrent scenarios")
+    parser.add_argument("--turns", type=int, default=20, help="Number of turns per scenario")
+    parser.add_argument("--candidates", type=int, default=4, help="Number of inputs scored per turn")
+    parser.add_argument("--call-latency", type=float, default=0.02, help="Latency of a model call in seconds")
+    parser.add_argument("--input-latency", type=float, default=0.001, help="Latency per input in seconds")
+    parser.add_argument("--max-wait", type=float, default=0.005, help="Maximum wait of the scheduler in seconds")
+    parser.add_argument("--max-batch", type=int, default=32, help="Maximum batch size of the scheduler")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    main(args)
@@ -0,0 +1,142 @@
+"""
+Latency benchmark of GODEL generation on CPU.
+
+Builds GODEL queries from the statements in examples/data, with the previous utterances as dialog context and the
+phrased thought as knowledge, and generates the replies with the unbounded sampling of the original GodelReplier
+(max_length=128, without inference mode) and with the GodelBackend for each decoding strategy. Each configuration
+runs two passes over the queries, the second pass reuses the cached encoder outputs:
+
+    python examples/benchmarks/godel.py --limit 20 --threads 4 --output results.json
+
+Reports the latency per reply as mean and p50/p95 in milliseconds, and the mean number of generated tokens.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from cltl.reply_generation.backends.godel_backend import GodelBackend, DECODING_STRATEGIES, GODEL_MODEL
+from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
+from cltl.reply_generation.utils.capsule_utils import casefolded
+from cltl.reply_generation.utils.thought_utils import thoughts_from_brain
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+DATA_FILES = ["basic-statements-responses.json", "carl-responses.json"]
+
+THOUGHT_OPTIONS = ['_complement_conflict', '_negation_conflicts', '_statement_novelty', '_entity_novelty',
+                   '_subject_gaps', '_complement_gaps', '_overlaps', '_trust']
+
+INSTRUCTION = 'Instruction: given a dialog context, you need to make a strong statement.'
+
+
+def load_queries(filenames, context_length, limit):
+    """GODEL query and thought type per statement, the dialog context are the preceding utterances."""
+    phraser = PatternPhraser()
+    queries = []
+    for filename in filenames:
+        with open(os.path.join(DATA_DIR, filename)) as file:
+            capsules = [capsule for capsule in json.load(file) if "statement" in capsule and capsule.get("thoughts")]
+
+        dialog = []
+        for capsule in capsules:
+            utterance = casefolded(capsule, "statement")
+            dialog = (dialog + [utterance["utterance"]])[-context_length:]
+            thoughts = thoughts_from_brain(utterance, casefolded(capsule, "thoughts"), filter=THOUGHT_OPTIONS)
+            for thought_type, thought_info in thoughts.values():
+                knowledge = phraser.phrase_correct_thought(utterance, thought_type, thought_info)
+                if knowledge:
+                    queries.append((f"{INSTRUCTION} [CONTEXT] {' EOS '.join(dialog)} [KNOWLEDGE] {knowledge}",
+                                    thought_type))
+                    break
+
+    return queries[:limit] if limit else queries
+
+
+def original_generate(tokenizer, model):
+    """Generation of the GodelReplier before the GodelBackend."""
+    def generate(queries, thought_types):
+        replies = []
+        for query in queries:
+            input_ids = tokenizer(query, return_tensors="pt").input_ids
+            outputs = model.generate(input_ids, max_length=128, min_length=8, top_p=0.9, do_sample=True)
+            replies.append(tokenizer.decode(outputs[0], skip_special_tokens=True))
+
+        return replies
+
+    return generate
+
+
+def run(name, generate, tokenizer, queries, passes):
+    results = []
+    for index in range(passes):
+        durations = []
+        tokens = []
+        for query, thought_type in queries:
+            start = time.perf_counter()
+            reply = generate([query], [thought_type])[0]
+            durations.append(time.perf_counter() - start)
+            tokens.append(len(tokenizer(reply).input_ids))
+
+        p50, p95 = np.percentile(np.array(durations) * 1000, [50, 95])
+        results.append({"name": name, "pass": index + 1, "replies": len(durations),
+                        "mean_ms": float(np.mean(durations) * 1000), "p50_ms": float(p50), "p95_ms": float(p95),
+                        "tokens": float(np.mean(tokens))})
+
+    return results
+
+
+def main(args):
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(args.seed)
+
+    queries = load_queries(args.data, args.context, args.limit)
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModelForSeq2SeqLM.from_pretrained(args.model).eval()
+
+    results = run("original", original_generate(tokenizer, model), tokenizer, queries, 1)
+    for decoding in args.decoding:
+        backend = GodelBackend(decoding=decoding, tokenizer=tokenizer, model=model)
+        results.extend(run(decoding, backend.generate, tokenizer, queries, 2))
+
+    for result in results:
+        print(f"{result['name']:<10} pass {result['pass']}  mean {result['mean_ms']:9.1f} ms  "
+              f"p50 {result['p50_ms']:9.1f} ms  p95 {result['p95_ms']:9.1f} ms  "
+              f"{result['tokens']:5.1f} tokens/reply  (n={result['replies']})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": {"timestamp": datetime.datetime.now().isoformat(), "data": args.data,
+                                    "model": args.model, "threads": torch.get_num_threads(),
+                                    "context": args.context, "queries": len(queries), "seed": args.seed},
+                       "results": results}, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latency of GODEL generation per decoding strategy")
+    parser.add_argument("--model", default=GODEL_MODEL, help="Name or path of the GODEL model")
+    parser.add_argument("--decoding", nargs="+", default=list(DECODING_STRATEGIES), choices=DECODING_STRATEGIES,
+                        help="Decoding strategies to compare")
+    parser.add_argument("--data", nargs="+", default=DATA_FILES, help="Files in examples/data to build queries from")
+    parser.add_argument("--context", type=int, default=3, help="Number of utterances in the dialog context")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of queries")
+    parser.add_argument("--threads", type=int, help="Number of torch threads")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for sampling")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("cltl").setLevel(logging.ERROR)
+
+    main(args)
@@ -0,0 +1,167 @@
+"""
+Parity and latency benchmark of the NSP inference engines.
+
+Phrases the thoughts of the statements in examples/data as the NSPReplier does, and scores the replies of each turn
+with every NSP engine (fp32, int8, onnx, onnx-int8), each in a fresh process. Download the pretrained NSP model first,
+see src/cltl/reply_generation/thought_selectors/README.md:
+
+    python examples/benchmarks/nsp_engines.py --model src/cltl/reply_generation/thought_selectors/nsp_model \\
+        --repeat 3 --output results.json
+
+Checks the parity of the scores with the fp32 engine (maximum absolute difference and agreement of the selected
+reply) and reports the load time, the resident memory after loading and the latency per turn as p50/p95/p99 in
+milliseconds. Exits with status 1 if an engine exceeds the tolerance.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
+from cltl.reply_generation.thought_selectors.nsp_engines import ENGINES, FP32, ONNX, ONNX_INT8
+from cltl.reply_generation.utils.capsule_utils import casefolded
+from cltl.reply_generation.utils.thought_utils import thoughts_from_brain
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+DATA_FILES = ["basic-statements-responses.json", "carl-responses.json"]
+
+THOUGHT_OPTIONS = ['_complement_conflict', '_negation_conflicts', '_statement_novelty', '_entity_novelty',
+                   '_subject_gaps', '_complement_gaps', '_overlaps', '_trust']
+
+
+def load_turns(filenames):
+    """Context and phrased replies of each statement, as scored by the NSPReplier."""
+    phraser = PatternPhraser()
+    turns = []
+    for filename in filenames:
+        with open(os.path.join(DATA_DIR, filename)) as file:
+            capsules = [capsule for capsule in json.load(file) if "statement" in capsule and capsule.get("thoughts")]
+
+        for capsule in capsules:
+            utterance = casefolded(capsule, "statement")
+            thoughts = thoughts_from_brain(utterance, casefolded(capsule, "thoughts"), filter=THOUGHT_OPTIONS)
+            replies = [phraser.phrase_correct_thought(utterance, thought_type, thought_info)
+                       for thought_type, thought_info in thoughts.values()]
+            replies = [reply for reply in replies if reply]
+            if replies:
+                turns.append((utterance["utterance"], replies))
+
+    return turns
+
+
+def resident_memory_mb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() / 2 ** 20
+    except OSError:
+        # Peak resident set size, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def run_engine(engine, model, turns, repeat, threads):
+    """Runs in a fresh process, such that the memory of the engines is measured separately."""
+    # Import the libraries before the baseline memory is measured
+    import torch
+    import transformers
+    from cltl.reply_generation.thought_selectors.nsp_selector import NSP
+
+    if threads:
+        torch.set_num_threads(threads)
+
+    baseline = resident_memory_mb()
+    start = time.perf_counter()
+    options = {"threads": threads} if engine in (ONNX, ONNX_INT8) and threads else {}
+    nsp = NSP(model, engine=engine, **options)
+    load_seconds = time.perf_counter() - start
+    memory = resident_memory_mb() - baseline
+
+    # Warm up
+    nsp.score_responses(*turns[0])
+
+    durations = []
+    scores = None
+    for _ in range(repeat):
+        scores = []
+        for context, replies in turns:
+            start = time.perf_counter()
+            scores.append([float(score) for score in nsp.score_responses(context, replies)])
+            durations.append(time.perf_counter() - start)
+
+    p50, p95, p99 = np.percentile(np.array(durations) * 1000, [50, 95, 99])
+
+    return {"engine": engine, "load_seconds": load_seconds, "memory_mb": memory,
+            "mean_ms": float(np.mean(durations) * 1000), "p50_ms": float(p50), "p95_ms": float(p95),
+            "p99_ms": float(p99), "scores": scores}
+
+
+def parity(result, reference):
+    differences = [abs(score - reference_score)
+                   for scores, reference_scores in zip(result["scores"], reference["scores"])
+                   for score, reference_score in zip(scores, reference_scores)]
+    agreement = np.mean([np.argmax(scores) == np.argmax(reference_scores)
+                         for scores, reference_scores in zip(result["scores"], reference["scores"])])
+
+    return {"max_abs_diff": float(np.max(differences)), "mean_abs_diff": float(np.mean(differences)),
+            "selection_agreement": float(agreement)}
+
+
+def main(args):
+    turns = load_turns(args.data)
+    print(f"{len(turns)} turns, {sum(len(replies) for _, replies in turns)} replies")
+
+    results = []
+    for engine in [FP32] + [engine for engine in args.engines if engine != FP32]:
+        # A fresh process per engine, started with spawn to not inherit the memory of the previous engine
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results.append(executor.submit(run_engine, engine, args.model, turns, args.repeat, args.threads).result())
+
+    reference = results[0]
+    failed = False
+    for result in results:
+        result.update(parity(result, reference))
+        result["passed"] = result["max_abs_diff"] <= args.tolerance
+        failed |= not result["passed"]
+
+        print(f"{result['engine']:<10} load {result['load_seconds']:6.2f} s  memory {result['memory_mb']:8.1f} MB  "
+              f"p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+              f"max diff {result['max_abs_diff']:.4f}  agreement {result['selection_agreement']:.2f}  "
+              f"{'PASS' if result['passed'] else 'FAIL'}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": {"timestamp": datetime.datetime.now().isoformat(), "data": args.data,
+                                    "model": args.model, "repeat": args.repeat, "threads": args.threads,
+                                    "tolerance": args.tolerance, "turns": len(turns)},
+                       "results": [{key: value for key, value in result.items() if key != "scores"}
+                                   for result in results]}, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parity and latency of the NSP inference engines")
+    parser.add_argument("--model", required=True, help="Path to the pretrained NSP model")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES, help="Engines to compare")
+    parser.add_argument("--data", nargs="+", default=DATA_FILES, help="Files in examples/data to score")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of passes over the turns")
+    parser.add_argument("--threads", type=int, help="Number of threads per forward pass")
+    parser.add_argument("--tolerance", type=float, default=0.05,
+                        help="Maximum absolute difference of the scores with the fp32 engine")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("cltl").setLevel(logging.ERROR)
+
+    sys.exit(main(args))
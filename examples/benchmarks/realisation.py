@@ -0,0 +1,146 @@
+"""
+Micro-benchmark of the SimpleNLG realisation in the SimplenlgPhraser.
+
+Records the clauses the SimplenlgPhraser realises when phrasing all thoughts of the statements and mentions in
+examples/data, and realises them without cache, with an initially empty cache, with a warm cache and in batches:
+
+    python examples/benchmarks/realisation.py --repeat 5 --output results.json
+
+Reports the throughput in realisations per second and the hit rate of the realisation cache.
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from cltl.commons.casefolding import casefold_capsule
+
+from cltl.reply_generation.phrasers import simplenlg_phraser
+from cltl.reply_generation.phrasers.simplenlg_phraser import SimplenlgPhraser
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+DATA_FILES = ["basic-statements-responses.json", "basic-mentions-responses.json", "carl-responses.json"]
+
+THOUGHT_TYPES = ['_complement_conflict', '_negation_conflicts', '_statement_novelty', '_entity_novelty',
+                 '_subject_gaps', '_complement_gaps', '_overlaps', '_trust']
+
+ARGUMENTS = ("subject", "predicate", "complement", "modifier", "negation", "question", "tense", "perfect")
+
+
+def load_capsules(filenames):
+    capsules = []
+    for filename in filenames:
+        with open(os.path.join(DATA_DIR, filename)) as file:
+            capsules.extend(json.load(file))
+
+    return capsules
+
+
+def record_clauses(capsules, seed):
+    """Phrase all thoughts of the capsules and record the arguments of each realisation, in order."""
+    clauses = []
+    realise = simplenlg_phraser._realise
+
+    def recording_realise(*args):
+        clauses.append(dict(zip(ARGUMENTS, args)))
+        return realise(*args)
+
+    simplenlg_phraser._realise = recording_realise
+    try:
+        random.seed(seed)
+        phraser = SimplenlgPhraser()
+        for capsule in capsules:
+            key = "statement" if "statement" in capsule else "mention"
+            if key not in capsule or not capsule.get("thoughts"):
+                continue
+            utterance = casefold_capsule(copy.deepcopy(capsule[key]), format="natural")
+            thoughts = casefold_capsule(copy.deepcopy(capsule["thoughts"]), format="natural")
+            for thought_type in THOUGHT_TYPES:
+                try:
+                    phraser.phrase_correct_thought(utterance, thought_type, thoughts.get(thought_type))
+                except Exception:
+                    logging.debug("Failed to phrase %s", thought_type, exc_info=True)
+    finally:
+        simplenlg_phraser._realise = realise
+
+    return clauses
+
+
+def throughput(name, realise, clauses, repeat, clear=False):
+    elapsed = 0.0
+    for _ in range(repeat):
+        if clear:
+            simplenlg_phraser.clear_realisation_cache()
+        start = time.perf_counter()
+        realise(clauses)
+        elapsed += time.perf_counter() - start
+
+    realisations = len(clauses) * repeat
+
+    return {"name": name, "realisations": realisations, "realisations_per_sec": realisations / elapsed}
+
+
+def uncached(clauses):
+    for clause in clauses:
+        simplenlg_phraser._realise.__wrapped__(*(clause.get(argument) for argument in ARGUMENTS))
+
+
+def cached(clauses):
+    for clause in clauses:
+        simplenlg_phraser.simple_nlg(**clause)
+
+
+def batched(batch_size):
+    def realise(clauses):
+        for start in range(0, len(clauses), batch_size):
+            simplenlg_phraser.simple_nlg_batch(clauses[start:start + batch_size])
+
+    return realise
+
+
+def main(args):
+    clauses = record_clauses(load_capsules(args.data), args.seed)
+
+    simplenlg_phraser.clear_realisation_cache()
+    results = [throughput("uncached", uncached, clauses, args.repeat),
+               throughput("cold cache", cached, clauses, args.repeat, clear=True)]
+    cold = simplenlg_phraser.realisation_cache_info()
+    results += [throughput("warm cache", cached, clauses, args.repeat),
+                throughput(f"batch of {args.batch_size}, cold", batched(args.batch_size), clauses, args.repeat,
+                           clear=True)]
+    hit_rate = cold.hits / (cold.hits + cold.misses) if cold.hits + cold.misses else None
+
+    print(f"{len(clauses)} clauses, {len(set(tuple(clause.values()) for clause in clauses))} distinct, "
+          f"cold cache hit rate {hit_rate:.2f}")
+    for result in results:
+        print(f"    {result['name']:<20} {result['realisations_per_sec']:12.1f} realisations/sec")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": {"timestamp": datetime.datetime.now().isoformat(), "data": args.data,
+                                    "repeat": args.repeat, "clauses": len(clauses),
+                                    "cache_size": simplenlg_phraser.REALISATION_CACHE_SIZE},
+                       "hit_rate": hit_rate, "results": results}, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the SimpleNLG realisation")
+    parser.add_argument("--data", nargs="+", default=DATA_FILES, help="Files in examples/data to phrase")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of passes over the clauses")
+    parser.add_argument("--batch-size", type=int, default=8, help="Number of clauses per batch")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the phrasing")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("cltl").setLevel(logging.ERROR)
+
+    main(args)
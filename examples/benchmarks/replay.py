@@ -0,0 +1,254 @@
+"""
+Replay benchmark of the repliers over the brain responses in examples/data.
+
+Replays the statement, mention and question capsules through the LenkaReplier, SimpleNLGReplier, RLReplier (without a
+brain) and ReplyGenerationService._best_response. LLM backends are replaced by a stub that echoes the prompt, no
+models or servers are needed. Reports the latency per stage (casefold, thought extraction, selection, phrasing,
+paraphrase) and per reply as p50/p95/p99 in milliseconds, and the throughput in replies per second:
+
+    python examples/benchmarks/replay.py --repeat 5 --output results.json
+
+The results are saved as JSON to compare runs across commits.
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from cltl.reply_generation import lenka_replier, rl_replier
+from cltl.reply_generation.lenka_replier import LenkaReplier
+from cltl.reply_generation.prompts.instruct import system_message
+from cltl.reply_generation.rl_replier import RLReplier
+from cltl.reply_generation.simplenlg_replier import SimpleNLGReplier
+from cltl.reply_generation.utils.capsule_utils import BrainResponse
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+DATA_FILES = ["basic-statements-responses.json", "basic-mentions-responses.json",
+              "basic-questions-responses.json", "carl-responses.json"]
+
+THOUGHT_OPTIONS = ['_complement_conflict', '_negation_conflicts', '_statement_novelty', '_entity_novelty',
+                   '_subject_gaps', '_complement_gaps', '_overlaps', '_trust']
+
+
+class StubBackend(object):
+    """Stands in for the LLM backends, the paraphrase is the last message."""
+
+    def __init__(self, latency=0.0):
+        self._latency = latency
+
+    def chat_sync(self, model, messages, timeout=None, **options):
+        time.sleep(self._latency)
+
+        return messages[-1]["content"]
+
+    def stream_chat_sync(self, model, messages, timeout=None, **options):
+        yield self.chat_sync(model, messages, timeout=timeout, **options)
+
+
+class StageTimer(object):
+    """Accumulates the time spent per stage for the reply that is currently computed."""
+
+    def __init__(self):
+        self.current = None
+
+    def timed(self, stage, function):
+        if getattr(function, "_timed_stage", None):
+            return function
+
+        def timed_function(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                if self.current is not None:
+                    self.current[stage] += time.perf_counter() - start
+
+        timed_function._timed_stage = stage
+
+        return timed_function
+
+    def instrument_modules(self):
+        for module in (lenka_replier, rl_replier):
+            module.casefolded = self.timed("casefold", module.casefolded)
+        rl_replier.thoughts_from_brain = self.timed("thought extraction", rl_replier.thoughts_from_brain)
+
+    def instrument_replier(self, replier):
+        selector, phraser = replier._thought_selector, replier._phraser
+        selector.select = self.timed("selection", selector.select)
+        phraser.phrase_correct_thought = self.timed("phrasing", phraser.phrase_correct_thought)
+        if hasattr(replier, "call_llm"):
+            replier.call_llm = self.timed("paraphrase", replier.call_llm)
+
+
+def load_capsules(filenames):
+    capsules = []
+    for filename in filenames:
+        with open(os.path.join(DATA_DIR, filename)) as file:
+            capsules.extend(json.load(file))
+
+    return capsules
+
+
+def reply(replier, capsule):
+    if "statement" in capsule:
+        return replier.reply_to_statement(capsule, persist=True, thought_options=THOUGHT_OPTIONS)
+    if "question" in capsule:
+        return replier.reply_to_question(capsule)
+    if "mention" in capsule:
+        return replier.reply_to_mention(capsule, persist=True)
+
+    return None
+
+
+def create_service(repliers):
+    """The service depends on the combot infrastructure, skip it if that is not available."""
+    try:
+        from cltl.commons.discrete import UtteranceType
+        from cltl_service.reply_generation.service import ReplyGenerationService
+    except Exception as e:
+        logging.warning("Skipping the service benchmark: %s", e)
+        return None
+
+    utterance_types = [UtteranceType.QUESTION, UtteranceType.STATEMENT, UtteranceType.TEXT_MENTION]
+
+    return ReplyGenerationService("input", "output", [], None, repliers, utterance_types, THOUGHT_OPTIONS,
+                                  None, None, None)
+
+
+def replay(name, respond, capsules, repeat, timer):
+    durations = defaultdict(list)
+    errors = 0
+    elapsed = 0.0
+    for _ in range(repeat):
+        for capsule in capsules:
+            # Fresh copy per reply, such that nothing is cached across replies
+            capsule = copy.deepcopy(capsule)
+
+            timer.current = defaultdict(float)
+            start = time.perf_counter()
+            try:
+                respond(capsule)
+            except Exception:
+                logging.debug("%s failed to reply to %s", name, capsule, exc_info=True)
+                errors += 1
+            duration = time.perf_counter() - start
+            elapsed += duration
+
+            for stage, stage_duration in timer.current.items():
+                durations[stage].append(stage_duration)
+            durations["reply"].append(duration)
+            timer.current = None
+
+    return {
+        "replies": len(durations["reply"]),
+        "errors": errors,
+        "replies_per_sec": len(durations["reply"]) / elapsed if elapsed else None,
+        "stages": {stage: statistics(values) for stage, values in durations.items()},
+    }
+
+
+def statistics(durations):
+    p50, p95, p99 = np.percentile(np.array(durations) * 1000, [50, 95, 99])
+
+    return {"count": len(durations), "mean_ms": float(np.mean(durations) * 1000),
+            "p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def create_replier(cls, llamalize, llm_latency):
+    replier = cls(None) if cls is RLReplier else cls()
+    if llamalize:
+        # Not all repliers take the paraphrase options, set them as LenkaReplier(llamalize=True) does
+        replier._llamalize = True
+        replier._model = lenka_replier.LLAMA_MODEL
+        replier._temperature = 0.2
+        replier._max_tokens = 250
+        replier._backend = StubBackend(llm_latency)
+        replier._cache_options = {}
+        replier._instruction = system_message(replier._instruct)
+
+    return replier
+
+
+def main(args):
+    random.seed(args.seed)
+    capsules = load_capsules(args.data)
+
+    timer = StageTimer()
+    timer.instrument_modules()
+
+    benchmarks = dict()
+    for cls in (LenkaReplier, SimpleNLGReplier, RLReplier):
+        replier = create_replier(cls, args.llamalize, args.llm_latency)
+        timer.instrument_replier(replier)
+        benchmarks[cls.__name__] = lambda capsule, replier=replier: reply(replier, capsule)
+
+    service_repliers = [create_replier(cls, args.llamalize, args.llm_latency)
+                        for cls in (LenkaReplier, SimpleNLGReplier)]
+    for replier in service_repliers:
+        timer.instrument_replier(replier)
+    service = create_service(service_repliers)
+    if service:
+        benchmarks["ReplyGenerationService"] = lambda capsule: service._best_response([BrainResponse(capsule)])
+
+    results = {
+        "metadata": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "capsules": len(capsules),
+            "data": args.data,
+            "repeat": args.repeat,
+            "llamalize": args.llamalize,
+            "llm_latency": args.llm_latency,
+        },
+        "results": {name: replay(name, benchmark, capsules, args.repeat, timer)
+                    for name, benchmark in benchmarks.items()},
+    }
+
+    for name, result in results["results"].items():
+        print(f"{name}: {result['replies']} replies, {result['errors']} errors, "
+              f"{result['replies_per_sec']:.1f} replies/sec")
+        for stage, stats in result["stages"].items():
+            print(f"    {stage:<20} p50 {stats['p50_ms']:8.3f} ms  p95 {stats['p95_ms']:8.3f} ms  "
+                  f"p99 {stats['p99_ms']:8.3f} ms  (n={stats['count']})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay the example brain responses through the repliers")
+    parser.add_argument("--data", nargs="+", default=DATA_FILES, help="Files in examples/data to replay")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of passes over the data")
+    parser.add_argument("--llamalize", action="store_true", help="Paraphrase the replies with the stub LLM")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Latency in seconds of the stub LLM")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the thought selection")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("cltl").setLevel(logging.ERROR)
+
+    main(args)
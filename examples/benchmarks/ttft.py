@@ -0,0 +1,120 @@
+"""
+Time-to-first-token benchmark of the LlamaReplier prompt layouts against the fake LLM server.
+
+Replays the statements in examples/data as a conversation through the LlamaReplier prompts, with the instruction
+layout (a system instruction per prompt type) and the shared prefix layout (one system instruction per language), each
+with and without asking the server to cache the prompt. The fake server simulates the encoding of the prompt with a
+latency per prompt word that is not in its prompt cache:
+
+    python examples/benchmarks/ttft.py --prefill-latency 0.002 --output results.json
+
+Reports the time to the first streamed token as mean and p50/p95/p99 in milliseconds and the mean number of encoded prompt
+words per turn.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cltl.reply_generation.llama_replier import LlamaReplier
+from cltl.reply_generation.prompts.response_processor import INSTRUCTION_LAYOUT, SHARED_PREFIX_LAYOUT
+from fake_llm_server import serve
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+DATA_FILES = ["basic-statements-responses.json", "carl-responses.json"]
+
+CONFIGURATIONS = [(INSTRUCTION_LAYOUT, False), (INSTRUCTION_LAYOUT, True),
+                  (SHARED_PREFIX_LAYOUT, False), (SHARED_PREFIX_LAYOUT, True)]
+
+
+def load_capsules(filenames):
+    """Statements with thoughts, each is replayed as one turn."""
+    capsules = []
+    for filename in filenames:
+        with open(os.path.join(DATA_DIR, filename)) as file:
+            capsules.extend(capsule for capsule in json.load(file) if "statement" in capsule and capsule.get("thoughts"))
+
+    return capsules
+
+
+def time_to_first_token(replier, prompt):
+    # Consume the complete reply, as the replier does, such that the next turn starts on an idle server
+    start = time.perf_counter()
+    first_token = None
+    for _ in replier._stream_from_prompt(prompt, temperature=0, max_tokens=150):
+        if first_token is None:
+            first_token = time.perf_counter() - start
+
+    return first_token
+
+
+def run(server, capsules, layout, cache_prompt, seed):
+    replier = LlamaReplier(llama_server="http://localhost", port=str(server.server_port), prompt_layout=layout,
+                           cache_prompt=cache_prompt)
+    rng = random.Random(seed)
+
+    # Start with an empty prompt cache
+    server.cached_prompt = []
+    del server.prefills[:]
+
+    durations = []
+    for capsule in capsules:
+        prompts = replier._processor.get_all_prompt_input_from_response(capsule)
+        if prompts:
+            durations.append(time_to_first_token(replier, rng.choice(prompts)))
+
+    p50, p95, p99 = np.percentile(np.array(durations) * 1000, [50, 95, 99])
+
+    return {"layout": layout, "cache_prompt": cache_prompt, "turns": len(durations),
+            "mean_ms": float(np.mean(durations) * 1000), "p50_ms": float(p50), "p95_ms": float(p95),
+            "p99_ms": float(p99), "prefill_words": float(np.mean(server.prefills))}
+
+
+def main(args):
+    capsules = load_capsules(args.data)
+    server = serve(latency=args.latency, token_latency=args.token_latency, prefill_latency=args.prefill_latency)
+    try:
+        results = [run(server, capsules, layout, cache_prompt, args.seed) for layout, cache_prompt in CONFIGURATIONS]
+    finally:
+        server.shutdown()
+
+    for result in results:
+        print(f"{result['layout']:<14} cache_prompt={str(result['cache_prompt']):<5}  "
+              f"mean {result['mean_ms']:8.2f} ms  p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  "
+              f"p99 {result['p99_ms']:8.2f} ms  "
+              f"prefill {result['prefill_words']:6.1f} words/turn  (n={result['turns']})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": {"timestamp": datetime.datetime.now().isoformat(), "data": args.data,
+                                    "latency": args.latency, "token_latency": args.token_latency,
+                                    "prefill_latency": args.prefill_latency},
+                       "results": results}, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time to first token of the prompt layouts")
+    parser.add_argument("--data", nargs="+", default=DATA_FILES, help="Files in examples/data to replay")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed delay of the server before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.001, help="Delay of the server per token")
+    parser.add_argument("--prefill-latency", type=float, default=0.002,
+                        help="Delay of the server per prompt word that is not cached")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the choice of the prompt")
+    parser.add_argument("--output", help="File to save the results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("cltl").setLevel(logging.ERROR)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    main(args)
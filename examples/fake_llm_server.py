@@ -0,0 +1,161 @@
+"""
+Local stand-in for an LLM server, to run the LLM based repliers without a model.
+
+Implements the chat endpoints of OpenAI compatible servers (/v1/chat/completions, as served by llama.cpp) and of
+Ollama (/api/chat), both streaming and non-streaming, with HTTP keep-alive. The reply paraphrases the last message
+word by word, with configurable latencies:
+
+    python fake_llm_server.py --port 9001 --latency 0.2 --token-latency 0.01 --prefill-latency 0.001
+
+The prefill latency simulates the encoding of the prompt per word. Like llama.cpp (cache_prompt) and Ollama
+(keep_alive) the server keeps the last prompt in a single cache slot if the request asks for it, the words of the
+common prefix with the cached prompt are not encoded again.
+
+and point the replier to it, e.g. LlamaReplier(llama_server="http://localhost", port="9001") or
+LenkaReplier(model_name="fake", model_server="local", model_url="http://localhost:9001", llamalize=True).
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Set on the server class by serve()
+    latency = 0.0
+    token_latency = 0.0
+    prefill_latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length))
+
+        self.server.requests.append(request)
+        time.sleep(self.latency + self.prefill_latency * self.prefill(request))
+
+        tokens = self.reply_tokens(request)
+        if self.path.endswith("/chat/completions"):
+            self.openai_response(request, tokens)
+        elif self.path.endswith("/api/chat"):
+            self.ollama_response(request, tokens)
+        else:
+            self.send_error(404)
+
+    def prefill(self, request):
+        """Number of prompt words that are not in the prompt cache, updates the cache."""
+        words = " ".join(f"{message['role']}: {message['content']}" for message in request.get("messages", [])).split()
+        cache_prompt = request.get("cache_prompt") or "keep_alive" in request
+        with self.server.cache_lock:
+            cached = self.server.cached_prompt if cache_prompt else []
+            common = 0
+            for cached_word, word in zip(cached, words):
+                if cached_word != word:
+                    break
+                common += 1
+            self.server.cached_prompt = words if cache_prompt else []
+            self.server.prefills.append(len(words) - common)
+
+        return len(words) - common
+
+    def reply_tokens(self, request):
+        content = request["messages"][-1]["content"] if request.get("messages") else ""
+        words = ("In other words: " + content).split()
+
+        return [word + " " for word in words[:request.get("max_tokens", len(words))]]
+
+    def openai_response(self, request, tokens):
+        if not request.get("stream"):
+            time.sleep(self.token_latency * len(tokens))
+            message = {"role": "assistant", "content": "".join(tokens).strip()}
+            self.send_json({"object": "chat.completion", "model": request.get("model"),
+                            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}]})
+            return
+
+        self.start_chunked("text/event-stream")
+        for token in tokens:
+            time.sleep(self.token_latency)
+            chunk = {"object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {"content": token}}]}
+            self.write_chunk("data: " + json.dumps(chunk) + "\n\n")
+        self.write_chunk("data: [DONE]\n\n")
+        self.end_chunked()
+
+    def ollama_response(self, request, tokens):
+        if not request.get("stream", True):
+            time.sleep(self.token_latency * len(tokens))
+            message = {"role": "assistant", "content": "".join(tokens).strip()}
+            self.send_json({"model": request.get("model"), "message": message, "done": True})
+            return
+
+        self.start_chunked("application/x-ndjson")
+        for token in tokens:
+            time.sleep(self.token_latency)
+            chunk = {"model": request.get("model"), "message": {"role": "assistant", "content": token}, "done": False}
+            self.write_chunk(json.dumps(chunk) + "\n")
+        self.write_chunk(json.dumps({"model": request.get("model"), "done": True}) + "\n")
+        self.end_chunked()
+
+    def send_json(self, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def start_chunked(self, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def end_chunked(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def serve(port=0, latency=0.0, token_latency=0.0, prefill_latency=0.0, handler=FakeLLMHandler):
+    """Start the fake server in a background thread.
+
+    returns: the server, the port is available as server.server_port, received requests in server.requests and
+             the number of encoded prompt words per request in server.prefills
+    """
+    handler = type(handler.__name__, (handler,), {"latency": latency, "token_latency": token_latency,
+                                                  "prefill_latency": prefill_latency})
+    server = ThreadingHTTPServer(("localhost", port), handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.cached_prompt = []
+    server.prefills = []
+    server.cache_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI/Ollama chat server")
+    parser.add_argument("--port", type=int, default=9001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay in seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Delay in seconds per token")
+    parser.add_argument("--prefill-latency", type=float, default=0.0,
+                        help="Delay in seconds per prompt word that is not cached")
+    args = parser.parse_args()
+
+    server = serve(args.port, args.latency, args.token_latency, args.prefill_latency)
+    print(f"Fake LLM server listening on http://localhost:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
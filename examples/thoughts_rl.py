@@ -14,7 +14,7 @@ scenario = json.load(f)
 replier = RLReplier(None, './../src/cltl/reply_generation/thought_selectors/rl_model/thoughts.json')
 
 for brain_response in tqdm(scenario):
-    replier.reward_thought()
+    replier.reward_thought(brain_response)
 
     print(f"\n\n---------------------------------------------------------------\n")
     reply = replier.reply_to_statement(brain_response, persist=True)
@@ -35,10 +35,11 @@ setup(
             'torch~=1.10.2',
             'transformers~=4.16.2',
         ],
+        "onnx": [
+            'onnxruntime',
+        ],
         "llama": [
-            'openai',
-            'ollama~=0.3.3',
-            'langchain_ollama~=0.2.0',
+            'httpx',
         ],
         "service": [
             "cltl.brain",
@@ -1,9 +1,11 @@
 import random
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Optional
 
 from cltl.commons.language_data.sentences import TRUST, NO_TRUST
 
 from cltl.reply_generation import logger
+from cltl.reply_generation.utils.instrumentation import timer
 
 
 class ThoughtSelector(object):
@@ -12,33 +14,59 @@ class ThoughtSelector(object):
         raise NotImplementedError()
 
 
-class Phraser(object):
-
-    def phrase_correct_thought(self, utterance, thought_type, thought_info, fallback=False) -> Optional[str]:
-        reply = None
-        if thought_type == "_complement_conflict":
-            reply = self._phrase_cardinality_conflicts(thought_info, utterance)
+def phrase_with(method_name: str) -> Callable[["Phraser", object, dict], Optional[str]]:
+    """Thought type handler that calls the phrasing method `method_name` of the phraser, such that subclasses can
+    override the method."""
+    def handler(phraser, thought_info, utterance):
+        return getattr(phraser, method_name)(thought_info, utterance)
 
-        elif thought_type == "_negation_conflicts":
-            reply = self._phrase_negation_conflicts(thought_info, utterance)
+    handler.__name__ = method_name
 
-        elif thought_type == "_statement_novelty":
-            reply = self._phrase_statement_novelty(thought_info, utterance)
+    return handler
 
-        elif thought_type == "_entity_novelty":
-            reply = self._phrase_type_novelty(thought_info, utterance)
 
-        elif thought_type == "_complement_gaps":
-            reply = self._phrase_complement_gaps(thought_info, utterance)
+class Phraser(object):
+    # Handlers per thought type, called with the phraser, the thought info and the utterance
+    _thought_handlers = {
+        "_complement_conflict": phrase_with("_phrase_cardinality_conflicts"),
+        "_negation_conflicts": phrase_with("_phrase_negation_conflicts"),
+        "_statement_novelty": phrase_with("_phrase_statement_novelty"),
+        "_entity_novelty": phrase_with("_phrase_type_novelty"),
+        "_complement_gaps": phrase_with("_phrase_complement_gaps"),
+        "_subject_gaps": phrase_with("_phrase_subject_gaps"),
+        "_overlaps": phrase_with("_phrase_overlaps"),
+        "_trust": phrase_with("_phrase_trust"),
+    }
+
+    @classmethod
+    def register_thought_type(cls, thought_type: str, handler: Callable[["Phraser", object, dict], Optional[str]]):
+        """Register the handler that phrases a thought type for this phraser class and its subclasses.
+
+        Registering on a subclass does not affect its base classes, handlers registered on a base class after a
+        subclass registered its own handlers are not seen by that subclass.
+
+        params
+        str thought_type:  thought type, e.g. '_subject_gaps'
+        handler:           called with the phraser, the thought info and the utterance, returns the phrase or None,
+                           e.g. phrase_with("_phrase_my_thought") to call a method of the phraser
+
+        returns: None
+        """
+        if "_thought_handlers" not in cls.__dict__:
+            cls._thought_handlers = dict(cls._thought_handlers)
+        cls._thought_handlers[thought_type] = handler
 
-        elif thought_type == "_subject_gaps":
-            reply = self._phrase_subject_gaps(thought_info, utterance)
+    @classmethod
+    def thought_types(cls):
+        return tuple(cls._thought_handlers)
 
-        elif thought_type == "_overlaps":
-            reply = self._phrase_overlaps(thought_info, utterance)
+    def phrase_correct_thought(self, utterance, thought_type, thought_info, fallback=False) -> Optional[str]:
+        with timer("phrase", thought_type=thought_type):
+            return self._phrase_correct_thought(utterance, thought_type, thought_info, fallback=fallback)
 
-        elif thought_type == "_trust":
-            reply = self._phrase_trust(thought_info, utterance)
+    def _phrase_correct_thought(self, utterance, thought_type, thought_info, fallback=False) -> Optional[str]:
+        handler = self._thought_handlers.get(thought_type)
+        reply = handler(self, thought_info, utterance) if handler else None
 
         if fallback and reply is None:  # Fallback strategy
             reply = self.phrase_fallback()
@@ -117,6 +145,28 @@ class BasicReplier(object):
     def phraser(self):
         return self._phraser
 
+    def conversation_state(self):
+        """State the replier keeps about the conversation, e.g. to learn from the response to its last reply.
+        Repliers with such state override this method and restore_conversation_state().
+
+        returns: the state, None for repliers without state
+        """
+        return None
+
+    def restore_conversation_state(self, state):
+        """Restore a state returned by conversation_state()."""
+        pass
+
+    @contextmanager
+    def preserved_state(self):
+        """Replies in the enclosed block do not change the state the replier keeps about the conversation, e.g.
+        when the replier is warmed up."""
+        state = self.conversation_state()
+        try:
+            yield
+        finally:
+            self.restore_conversation_state(state)
+
 
     def llamalize_reply(self, text_response):
         raise NotImplementedError()
@@ -129,3 +179,21 @@ class BasicReplier(object):
 
     def reply_to_mention(self, brain_response, persist=False, thought_options=None):
         raise NotImplementedError()
+
+    def stream_reply_to_question(self, brain_response):
+        """Yield the reply to a question in parts as soon as they are available, by default the complete reply."""
+        reply = self.reply_to_question(brain_response)
+        if reply:
+            yield reply
+
+    def stream_reply_to_statement(self, brain_response, persist=False, thought_options=None):
+        """Yield the reply to a statement in parts as soon as they are available, by default the complete reply."""
+        reply = self.reply_to_statement(brain_response, persist=persist, thought_options=thought_options)
+        if reply:
+            yield reply
+
+    def stream_reply_to_mention(self, brain_response, persist=False, thought_options=None):
+        """Yield the reply to a mention in parts as soon as they are available, by default the complete reply."""
+        reply = self.reply_to_mention(brain_response, persist=persist, thought_options=thought_options)
+        if reply:
+            yield reply
@@ -0,0 +1,226 @@
+"""
+Generation with the GODEL sequence-to-sequence model.
+
+Replies are decoded greedily, with beam search or by nucleus sampling, with a budget of new tokens per thought type,
+such that e.g. a trust reply is not generated up to the length of a conflict. Generation runs under
+torch.inference_mode.
+
+The encoder outputs of recent queries are cached. GODEL encodes the instruction, dialog context and knowledge as one
+sequence with bidirectional attention, so the encoding of the context depends on the knowledge and only the encoder
+outputs of the complete query can be reused, e.g. when the same thought is phrased again in a retry, in another
+scenario or with another decoding strategy.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Mapping
+
+from cltl.reply_generation.utils.instrumentation import count, timer
+from cltl.reply_generation.utils.model_registry import acquire_pretrained_model, acquire_tokenizer
+
+logger = logging.getLogger(__name__)
+
+GODEL_MODEL = "microsoft/GODEL-v1_1-large-seq2seq"
+
+GREEDY = "greedy"
+BEAM = "beam"
+SAMPLE = "sample"
+
+DECODING_STRATEGIES = (GREEDY, BEAM, SAMPLE)
+
+# Maximum number of new tokens per thought type
+DEFAULT_TOKEN_BUDGETS = {
+    '_complement_conflict': 48,
+    '_negation_conflicts': 48,
+    '_statement_novelty': 40,
+    '_entity_novelty': 32,
+    '_subject_gaps': 32,
+    '_complement_gaps': 32,
+    '_overlaps': 40,
+    '_trust': 24,
+}
+DEFAULT_MAX_NEW_TOKENS = 128
+
+
+class GodelBackend(object):
+    """Generates replies for GODEL queries in padded batches."""
+
+    def __init__(self, model_name: str = GODEL_MODEL, decoding: str = SAMPLE, num_beams: int = 4, top_p: float = 0.9,
+                 token_budgets: Mapping[str, int] = None, max_new_tokens: int = DEFAULT_MAX_NEW_TOKENS,
+                 min_length: int = 8, encoder_cache_size: int = 128, dtype: str = None, device: str = None,
+                 tokenizer=None, model=None):
+        """
+        Parameters
+        ----------
+        model_name: str
+            Name or path of the pretrained GODEL model
+        decoding: str
+            Decoding strategy, one of 'greedy', 'beam' or 'sample'
+        num_beams: int
+            Number of beams of beam search
+        top_p: float
+            Probability mass of the tokens sampled from
+        token_budgets: Mapping[str, int]
+            Maximum number of new tokens per thought type, by default DEFAULT_TOKEN_BUDGETS
+        max_new_tokens: int
+            Maximum number of new tokens for thought types without budget
+        min_length: int
+            Minimum length of the generated sequence
+        encoder_cache_size: int
+            Number of queries for which the encoder outputs are cached, 0 to disable the cache
+        dtype: str
+            torch data type of the weights, e.g. 'bfloat16', by default the data type of the checkpoint
+        device: str
+            Device of the model, by default the CPU
+        tokenizer, model:
+            Loaded tokenizer and model to use instead of the shared model_name of the model registry
+        """
+        if decoding not in DECODING_STRATEGIES:
+            raise ValueError(f"Unsupported decoding strategy {decoding}, expected one of {DECODING_STRATEGIES}")
+
+        self._handles = []
+        if tokenizer is None or model is None:
+            from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+            self._handles = [acquire_tokenizer(AutoTokenizer, model_name),
+                             acquire_pretrained_model(AutoModelForSeq2SeqLM, model_name, dtype=dtype, device=device)]
+            tokenizer, model = (handle.model for handle in self._handles)
+
+        self._tokenizer = tokenizer
+        self._model = model.eval()
+
+        self._decoding = decoding
+        self._generate_options = self._decoding_options(decoding, num_beams, top_p)
+        self._generate_options["min_length"] = min_length
+        self._token_budgets = dict(DEFAULT_TOKEN_BUDGETS if token_budgets is None else token_budgets)
+        self._max_new_tokens = max_new_tokens
+
+        self._encoder_cache_size = encoder_cache_size
+        self._encoder_cache = OrderedDict()
+        self._encoder_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _decoding_options(decoding, num_beams, top_p):
+        if decoding == GREEDY:
+            return {"do_sample": False, "num_beams": 1}
+        if decoding == BEAM:
+            return {"do_sample": False, "num_beams": num_beams, "early_stopping": True}
+
+        return {"do_sample": True, "top_p": top_p}
+
+    @property
+    def decoding(self) -> str:
+        return self._decoding
+
+    def token_budget(self, thought_type: str = None) -> int:
+        return self._token_budgets.get(thought_type, self._max_new_tokens)
+
+    def generate(self, queries: List[str], thought_types: Iterable[str] = None) -> List[str]:
+        """Generate a reply for each query.
+
+        Queries with the same token budget are generated in one padded batch.
+
+        Parameters
+        ----------
+        queries: List[str]
+            GODEL queries ('<instruction> [CONTEXT] <dialog> [KNOWLEDGE] <knowledge>')
+        thought_types: Iterable[str]
+            Thought type of each query, determines its token budget
+
+        Returns
+        -------
+        List[str]
+            The replies in the order of the queries
+        """
+        thought_types = list(thought_types) if thought_types is not None else [None] * len(queries)
+
+        batches = dict()
+        for index, thought_type in enumerate(thought_types):
+            batches.setdefault(self.token_budget(thought_type), []).append(index)
+
+        replies = [None] * len(queries)
+        for budget, indices in batches.items():
+            with timer("generate", decoding=self._decoding):
+                batch_replies = self._generate_batch([queries[index] for index in indices], budget)
+            for index, reply in zip(indices, batch_replies):
+                replies[index] = reply
+
+        return replies
+
+    def _generate_batch(self, queries, max_new_tokens):
+        import torch
+        from transformers.modeling_outputs import BaseModelOutput
+
+        with torch.inference_mode():
+            hidden_states, attention_mask = self._encode(queries)
+            outputs = self._model.generate(encoder_outputs=BaseModelOutput(last_hidden_state=hidden_states),
+                                           attention_mask=attention_mask, max_new_tokens=max_new_tokens,
+                                           **self._generate_options)
+
+        return self._tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    def _encode(self, queries):
+        """Encoder outputs of the queries, padded to the longest query.
+
+        Returns
+        -------
+        Tuple[torch.Tensor, torch.Tensor]
+            Hidden states (batch, length, hidden) and attention mask (batch, length)
+        """
+        import torch
+
+        encoded = {query: self._cached_encoding(query) for query in queries}
+        missing = [query for query, hidden_states in encoded.items() if hidden_states is None]
+        count("encoder_cache", len(encoded) - len(missing), hit=True)
+        count("encoder_cache", len(missing), hit=False)
+
+        if missing:
+            inputs = self._tokenizer(missing, return_tensors="pt", padding=True).to(self._model.device)
+            with timer("encode"):
+                hidden_states = self._model.get_encoder()(**inputs).last_hidden_state
+            for query, query_hidden_states, mask in zip(missing, hidden_states, inputs["attention_mask"]):
+                # Drop the padding of the query
+                encoded[query] = query_hidden_states[mask.bool()]
+                self._cache_encoding(query, encoded[query])
+
+        length = max(hidden_states.shape[0] for hidden_states in encoded.values())
+        hidden_size = next(iter(encoded.values())).shape[1]
+        dtype = next(iter(encoded.values())).dtype
+
+        batch_hidden_states = torch.zeros((len(queries), length, hidden_size), dtype=dtype, device=self._model.device)
+        attention_mask = torch.zeros((len(queries), length), dtype=torch.long, device=self._model.device)
+        for index, query in enumerate(queries):
+            query_length = encoded[query].shape[0]
+            batch_hidden_states[index, :query_length] = encoded[query]
+            attention_mask[index, :query_length] = 1
+
+        return batch_hidden_states, attention_mask
+
+    def _cached_encoding(self, query):
+        with self._encoder_cache_lock:
+            hidden_states = self._encoder_cache.get(query)
+            if hidden_states is not None:
+                self._encoder_cache.move_to_end(query)
+
+            return hidden_states
+
+    def _cache_encoding(self, query, hidden_states):
+        if not self._encoder_cache_size:
+            return
+
+        with self._encoder_cache_lock:
+            self._encoder_cache[query] = hidden_states
+            while len(self._encoder_cache) > self._encoder_cache_size:
+                self._encoder_cache.popitem(last=False)
+
+    def clear_encoder_cache(self):
+        with self._encoder_cache_lock:
+            self._encoder_cache.clear()
+
+    def release(self):
+        """Release the shared model, the backend cannot be used afterwards."""
+        self.clear_encoder_cache()
+        self._tokenizer = self._model = None
+        for handle in self._handles:
+            handle.release()
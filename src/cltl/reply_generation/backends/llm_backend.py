@@ -0,0 +1,389 @@
+"""
+Asynchronous clients for LLM servers (llama.cpp/OpenAI compatible servers and Ollama).
+
+All backends run on a single event loop in a background thread. Each backend keeps a pool of keep-alive
+connections to its server and limits the number of concurrent requests, backends for the same server are
+shared between repliers. The blocking repliers use the *_sync methods, which can be called from any thread.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+from typing import AsyncIterator, Iterator, Iterable, Mapping
+
+from cltl.reply_generation.utils.budget import remaining_budget
+
+logger = logging.getLogger(__name__)
+
+
+class _EventLoopThread(object):
+    """Event loop running in a daemon thread, shared by all backends."""
+
+    _lock = threading.Lock()
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+
+        return cls._instance
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="LLMBackendLoop", daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+
+async def _first_content(stream: AsyncIterator[str]):
+    """Read the chunks of a stream up to the first chunk with content.
+
+    returns: the chunks read, None if the stream ends without content
+    """
+    head = []
+    async for chunk in stream:
+        head.append(chunk)
+        if chunk.strip():
+            return head
+
+    return None
+
+
+class LLMBackend(object):
+    """Chat completion client for a single LLM server.
+
+    Subclasses implement the wire format of the server in _payload, _parse and _parse_chunk.
+    """
+
+    _shared = dict()
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, base_url: str, headers: Mapping[str, str] = None, **kwargs):
+        """Get the backend for the server at `base_url`, create it if it does not exist yet.
+
+        params
+        str base_url:  url of the server
+        dict headers:  additional HTTP headers, e.g. for authorization
+        kwargs:        options of the backend, e.g. timeout or keep_alive
+
+        returns: backend shared with all other callers for the same server, headers and options
+        """
+        key = (cls, base_url.rstrip("/"), tuple(sorted((headers or {}).items())), tuple(sorted(kwargs.items())))
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(base_url, headers=headers, **kwargs)
+
+            return cls._shared[key]
+
+    def __init__(self, base_url: str, headers: Mapping[str, str] = None, max_connections: int = 4,
+                 max_concurrent_requests: int = 4, keepalive_expiry: float = 60.0, timeout: float = 120.0):
+        """
+        params
+        str base_url:                 url of the server
+        dict headers:                 additional HTTP headers, e.g. for authorization
+        int max_connections:          maximum number of open connections to the server
+        int max_concurrent_requests:  maximum number of requests in flight, further requests wait
+        float keepalive_expiry:       time in seconds idle connections are kept open
+        float timeout:                default timeout in seconds per request
+
+        returns: None
+        """
+        self._base_url = base_url.rstrip("/")
+        self._headers = dict(headers or {})
+        self._max_connections = max_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._max_concurrent_requests = max_concurrent_requests
+        self._timeout = timeout
+
+        # Created on the event loop on first use
+        self._client = None
+        self._semaphore = None
+
+    @property
+    def base_url(self):
+        return self._base_url
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            limits = httpx.Limits(max_connections=self._max_connections,
+                                  max_keepalive_connections=self._max_connections,
+                                  keepalive_expiry=self._keepalive_expiry)
+            self._client = httpx.AsyncClient(base_url=self._base_url, headers=self._headers, limits=limits,
+                                             timeout=self._timeout)
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        return self._client
+
+    async def chat(self, model: str, messages: Iterable[Mapping], timeout: float = None, **options) -> str:
+        """Request a chat completion.
+
+        params
+        str model:      name of the model on the server
+        list messages:  chat messages with role and content
+        float timeout:  timeout of the request in seconds, defaults to the timeout of the backend
+        options:        generation options, e.g. temperature, max_tokens
+
+        returns: content of the completion
+        """
+        client = self._get_client()
+        async with self._semaphore:
+            response = await client.post(self._path, json=self._payload(model, messages, False, options),
+                                         timeout=timeout if timeout is not None else self._timeout)
+            response.raise_for_status()
+
+            return self._parse(response.json())
+
+    async def stream_chat(self, model: str, messages: Iterable[Mapping], timeout: float = None,
+                          **options) -> AsyncIterator[str]:
+        """Request a chat completion and iterate over the content chunks as they arrive.
+
+        See chat() for the parameters.
+        """
+        client = self._get_client()
+        async with self._semaphore:
+            async with client.stream("POST", self._path, json=self._payload(model, messages, True, options),
+                                     timeout=timeout if timeout is not None else self._timeout) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    content = self._parse_chunk(line)
+                    if content is StopIteration:
+                        break
+                    if content:
+                        yield content
+
+    async def first_stream_chat(self, model: str, prompts: Iterable[Iterable[Mapping]], timeout: float = None,
+                                **options) -> AsyncIterator[str]:
+        """Request chat completions for several prompts concurrently and iterate over the content chunks of the first
+        completion with content, the other requests are cancelled as soon as it is known.
+
+        params
+        list prompts:   chat messages per prompt
+        See chat() for the other parameters.
+
+        returns: the chunks of the first completion that is not empty, no chunks if all completions are empty
+        """
+        streams = dict()
+        for messages in prompts:
+            stream = self.stream_chat(model, messages, timeout=timeout, **options)
+            streams[asyncio.ensure_future(_first_content(stream))] = stream
+
+        winner, head = None, None
+        try:
+            pending = set(streams)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        logger.warning("Chat completion failed: %s", task.exception())
+                    elif task.result() and winner is None:
+                        winner, head = streams[task], task.result()
+        finally:
+            losers = [(task, stream) for task, stream in streams.items() if stream is not winner]
+            for task, _ in losers:
+                task.cancel()
+            # The streams can only be closed when their tasks are no longer reading from them
+            await asyncio.gather(*(task for task, _ in losers), return_exceptions=True)
+            for _, stream in losers:
+                await stream.aclose()
+
+        if winner is None:
+            return
+
+        try:
+            for chunk in head:
+                yield chunk
+            async for chunk in winner:
+                yield chunk
+        finally:
+            await winner.aclose()
+
+    def chat_sync(self, model: str, messages: Iterable[Mapping], timeout: float = None, **options) -> str:
+        """Blocking version of chat(), the timeout defaults to the remaining time budget of the turn."""
+        timeout = timeout if timeout is not None else remaining_budget()
+        future = _EventLoopThread.instance().submit(self.chat(model, messages, timeout=timeout, **options))
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            future.cancel()
+
+    def stream_chat_sync(self, model: str, messages: Iterable[Mapping], timeout: float = None,
+                         **options) -> Iterator[str]:
+        """Blocking version of stream_chat(), the timeout defaults to the remaining time budget of the turn.
+
+        Closing the returned iterator cancels the request.
+        """
+        timeout = timeout if timeout is not None else remaining_budget()
+
+        return self._iterate_sync(self.stream_chat(model, messages, timeout=timeout, **options))
+
+    def first_stream_chat_sync(self, model: str, prompts: Iterable[Iterable[Mapping]], timeout: float = None,
+                               **options) -> Iterator[str]:
+        """Blocking version of first_stream_chat(), the timeout defaults to the remaining time budget of the turn.
+
+        Closing the returned iterator cancels the requests.
+        """
+        timeout = timeout if timeout is not None else remaining_budget()
+
+        return self._iterate_sync(self.first_stream_chat(model, list(prompts), timeout=timeout, **options))
+
+    @staticmethod
+    def _iterate_sync(stream: AsyncIterator[str]) -> Iterator[str]:
+        chunks = queue.Queue()
+
+        async def produce():
+            try:
+                async for chunk in stream:
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(StopIteration)
+
+        future = _EventLoopThread.instance().submit(produce())
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is StopIteration:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            future.cancel()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def close(self):
+        _EventLoopThread.instance().submit(self.aclose()).result()
+
+    def cache_options(self) -> dict:
+        """Request options that ask the server to keep the encoded prompt for subsequent requests, such that it only
+        encodes the part of the next prompt that differs. Pass them with the options of chat and stream_chat.
+
+        returns: options for this server
+        """
+        return {}
+
+    @property
+    def _path(self) -> str:
+        raise NotImplementedError()
+
+    def _payload(self, model, messages, stream, options) -> dict:
+        raise NotImplementedError()
+
+    def _parse(self, response: dict) -> str:
+        raise NotImplementedError()
+
+    def _parse_chunk(self, line: str):
+        """Content of a line of a streamed response, None if there is no content and StopIteration if the server
+        marks the end of the response."""
+        raise NotImplementedError()
+
+
+class OpenAIBackend(LLMBackend):
+    """Backend for OpenAI compatible servers, e.g. the llama.cpp server. The base_url includes the version, e.g.
+    http://localhost:9001/v1."""
+
+    @classmethod
+    def shared(cls, base_url: str, api_key: str = None, headers: Mapping[str, str] = None, **kwargs):
+        headers = dict(headers or {})
+        if api_key:
+            headers["Authorization"] = "Bearer " + api_key
+
+        return super(OpenAIBackend, cls).shared(base_url, headers=headers, **kwargs)
+
+    def cache_options(self):
+        # Reuse of the KV cache of the previous request with a common prefix, supported by the llama.cpp server
+        return {"cache_prompt": True}
+
+    @property
+    def _path(self):
+        return "/chat/completions"
+
+    def _payload(self, model, messages, stream, options):
+        payload = {"model": model, "messages": [dict(message) for message in messages], "stream": stream}
+        payload.update(options)
+
+        return payload
+
+    def _parse(self, response):
+        return response["choices"][0]["message"]["content"]
+
+    def _parse_chunk(self, line):
+        if not line.startswith("data:"):
+            return None
+
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return StopIteration
+
+        choices = json.loads(data)["choices"]
+
+        return choices[0]["delta"].get("content") if choices else None
+
+
+class OllamaBackend(LLMBackend):
+    """Backend for the Ollama chat API, both for local servers and ollama.com. The base_url is the host of the
+    server, e.g. http://localhost:11434."""
+
+    # Generation options passed as model options to Ollama, all other options are passed on the top level
+    _OPTION_NAMES = {"temperature": "temperature", "max_tokens": "num_predict", "top_p": "top_p", "seed": "seed",
+                     "stop": "stop"}
+
+    def __init__(self, base_url: str, keep_alive: str = "30m", **kwargs):
+        """
+        params
+        str base_url:    url of the server
+        str keep_alive:  time the server keeps the model and its prompt cache loaded after a request with
+                         cache_options, e.g. "30m"
+
+        returns: None
+        """
+        super(OllamaBackend, self).__init__(base_url, **kwargs)
+        self._keep_alive = keep_alive
+
+    def cache_options(self):
+        # Ollama reuses the cached prompt prefix as long as the model stays loaded
+        return {"keep_alive": self._keep_alive}
+
+    @property
+    def _path(self):
+        return "/api/chat"
+
+    def _payload(self, model, messages, stream, options):
+        payload = {"model": model, "messages": [dict(message) for message in messages], "stream": stream}
+        model_options = dict(options.pop("options", {}))
+        for name, value in options.items():
+            if name in self._OPTION_NAMES:
+                model_options[self._OPTION_NAMES[name]] = value
+            else:
+                payload[name] = value
+        if model_options:
+            payload["options"] = model_options
+
+        return payload
+
+    def _parse(self, response):
+        return response["message"]["content"]
+
+    def _parse_chunk(self, line):
+        if not line.strip():
+            return None
+
+        chunk = json.loads(line)
+        if "error" in chunk:
+            raise ValueError("Ollama error: " + chunk["error"])
+
+        return chunk.get("message", {}).get("content")
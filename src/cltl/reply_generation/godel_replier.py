@@ -1,20 +1,22 @@
 import random
 
-from cltl.commons.casefolding import casefold_capsule
 from cltl.commons.language_data.sentences import NO_ANSWER
 from cltl.commons.language_helpers import lexicon_lookup
 from cltl.commons.triple_helpers import filtered_types_names
 
 from cltl.reply_generation.api import BasicReplier
+from cltl.reply_generation.backends.godel_backend import GodelBackend, SAMPLE
 from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
 from cltl.reply_generation.thought_selectors.random_selector import RandomSelector
+from cltl.reply_generation.utils.batching import BatchScheduler
+from cltl.reply_generation.utils.capsule_utils import casefolded
 from cltl.reply_generation.utils.phraser_utils import replace_pronouns, assign_spo, deal_with_authors, fix_entity
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
 
 class GodelReplier(BasicReplier):
-    def __init__(self, thought_selector=RandomSelector()):
-        # type: (ThoughtSelector) -> None
+    def __init__(self, thought_selector=RandomSelector(), max_wait=None, max_batch=8, decoding=SAMPLE,
+                 token_budgets=None, encoder_cache_size=128):
+        # type: (ThoughtSelector, float, int, str, dict, int) -> None
         """
         Generate natural language based on structured data
 
@@ -22,25 +24,52 @@ class GodelReplier(BasicReplier):
         ----------
         thought_selector: ThoughtSelector
             Thought selector to pick thought type for the reply.
+        max_wait: float
+            If set, queries of concurrent turns generated within max_wait seconds share a call of the model.
+        max_batch: int
+            Maximum number of queries in a shared call of the model.
+        decoding: str
+            Decoding strategy of GODEL, one of 'greedy', 'beam' or 'sample'.
+        token_budgets: dict
+            Maximum number of new tokens per thought type, see godel_backend.DEFAULT_TOKEN_BUDGETS.
+        encoder_cache_size: int
+            Number of queries for which the encoder outputs are cached.
         """
         super(GodelReplier, self).__init__()
         self._thought_selector = thought_selector
         self._log.debug(f"Random Selector ready")
-        self._tokenizer = AutoTokenizer.from_pretrained("microsoft/GODEL-v1_1-large-seq2seq")
-        self._model = AutoModelForSeq2SeqLM.from_pretrained("microsoft/GODEL-v1_1-large-seq2seq")
+        self._backend = GodelBackend(decoding=decoding, token_budgets=token_budgets,
+                                     encoder_cache_size=encoder_cache_size)
         self._phraser = PatternPhraser()
         self._log.debug(f"Pattern phraser ready")
 
+        self._scheduler = None
+        if max_wait is not None:
+            self._scheduler = BatchScheduler(self._generate_batch, max_wait=max_wait, max_batch=max_batch,
+                                             name="godel")
 
-    def _generate(self, instruction, knowledge, dialog):
+
+    def _generate(self, instruction, knowledge, dialog, thought_type=None):
         if knowledge != '':
             knowledge = '[KNOWLEDGE] ' + knowledge
         dialog = ' EOS '.join(dialog)
         query = f"{instruction} [CONTEXT] {dialog} {knowledge}"
-        input_ids = self._tokenizer(f"{query}", return_tensors="pt").input_ids
-        outputs = self._model.generate(input_ids, max_length=128, min_length=8, top_p=0.9, do_sample=True)
-        output = self._tokenizer.decode(outputs[0], skip_special_tokens=True)
-        return output
+        if self._scheduler:
+            return self._scheduler.submit((query, thought_type)).result()
+
+        return self._generate_batch([(query, thought_type)])[0]
+
+
+    def _generate_batch(self, inputs):
+        queries, thought_types = zip(*inputs)
+        return self._backend.generate(list(queries), thought_types)
+
+
+    def release(self):
+        """Stop the batch scheduler and release the shared GODEL model."""
+        if self._scheduler:
+            self._scheduler.stop()
+        self._backend.release()
 
 
     def reply_to_question(self, brain_response):
@@ -49,7 +78,7 @@ class GodelReplier(BasicReplier):
             return self._phrase_no_answer_to_question(brain_response['question'])
 
         # TODO revise (we conjugate the predicate by doing this)
-        utterance = casefold_capsule(brain_response['question'], format='natural')
+        utterance = casefolded(brain_response, 'question')
 
         # Each triple is hashed, so we can figure out when we are about the say things double
         handled_items = set()
@@ -179,8 +208,8 @@ class GodelReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['statement'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'statement')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         thought_options = [option for option in thought_options if thoughts[option] is not None]
@@ -199,7 +228,7 @@ class GodelReplier(BasicReplier):
             instruction = f'Instruction: given a dialog context, you need to make a strong statement.'
             # else if thought is question:
             instruction = f'Instruction: given a dialog context, you need to ask a question.'
-            reply = self._generate(instruction, knowledge, dialog)
+            reply = self._generate(instruction, knowledge, dialog, thought_type=thought_type)
 
             # Generate reply
             #reply = self._phraser.phrase_correct_thought(utterance, thought_type, thoughts[thought_type],
@@ -237,8 +266,8 @@ class GodelReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['mention'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'mention')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         options = [option for option in thought_options if thoughts[option] is not None]
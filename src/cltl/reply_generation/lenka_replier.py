@@ -1,18 +1,18 @@
 import random
 import time
 import json
-import ollama
-from langchain_ollama import ChatOllama
-from cltl.commons.casefolding import casefold_capsule
 from cltl.commons.language_data.sentences import NO_ANSWER
 from cltl.commons.language_helpers import lexicon_lookup
 from cltl.commons.triple_helpers import filtered_types_names
 
 from cltl.reply_generation.api import BasicReplier
+from cltl.reply_generation.backends.llm_backend import OllamaBackend, OpenAIBackend
 from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
+from cltl.reply_generation.prompts.instruct import system_message
 from cltl.reply_generation.thought_selectors.random_selector import RandomSelector
+from cltl.reply_generation.utils.capsule_utils import casefolded
+from cltl.reply_generation.utils.instrumentation import timed
 from cltl.reply_generation.utils.phraser_utils import replace_pronouns, assign_spo, deal_with_authors, fix_entity
-from ollama import Client
 
 # to use ollama pull the model from the terminal in the venv: ollama pull <model-name>
 LLAMA_MODEL = "llama3.2:1b"
@@ -22,8 +22,9 @@ INSTRUCT = 'Paraphrase the user input in plain simple English. The input can be
 CONTENT_TYPE_SEPARATOR = ';'
 
 class LenkaReplier(BasicReplier):
-    def __init__(self, model_name:str, model_server="cloud", model_url = "https://ollama.com", model_port = "9001", model_key = "", instruct=INSTRUCT, llamalize=False,
-                 temperature=0.2, max_tokens=250, show_lenka=False, thought_selector=RandomSelector()):
+    def __init__(self, model_name:str=None, model_server="cloud", model_url = "https://ollama.com", model_port = "9001", model_key = "", instruct=INSTRUCT, llamalize=False,
+                 temperature=0.2, max_tokens=250, show_lenka=False, thought_selector=RandomSelector(),
+                 paraphrase_cache=None, cache_prompt=False):
     #def __init__(self,  model=None, instruct=None, llamalize= False, temperature=0.1, max_tokens=250, show_lenka=False, thought_selector = RandomSelector()):
         # type: (ThoughtSelector) -> None
         """
@@ -34,6 +35,15 @@ class LenkaReplier(BasicReplier):
         thought_selector: ThoughtSelector
             Thought selector to pick thought type for the reply.
             :type llama_model: object
+        model_server: str
+            Type of LLM server used to paraphrase replies: "server" for OpenAI compatible servers (e.g. llama.cpp),
+            "local" for a local Ollama server and "cloud" for ollama.com. Repliers for the same server share
+            the connections to it.
+        paraphrase_cache: ParaphraseCache
+            Optional cache for paraphrases of replies, keyed by model, instruction, temperature and reply.
+        cache_prompt: bool
+            Ask the LLM server to keep the encoded prompt for the next request. All paraphrase prompts start with the
+            same instruction, the server then only encodes the reply.
         """
         super(LenkaReplier, self).__init__()
         self._thought_selector = thought_selector
@@ -43,6 +53,7 @@ class LenkaReplier(BasicReplier):
         self._llamalize = False
         self._show_original = show_lenka
         self._instruct = INSTRUCT
+        self._paraphrase_cache = paraphrase_cache
         if llamalize:
             self._log.info("Initializing LLM paraphraser: %s, %s, %s", model_server, model_url, model_name)
             self._llamalize = True
@@ -52,63 +63,58 @@ class LenkaReplier(BasicReplier):
                 self._model = LLAMA_MODEL
             if instruct:
                 self._instruct = instruct
+            self._temperature = temperature
+            self._max_tokens = max_tokens
             self._SERVER = model_server
             if self._SERVER == "server":
-                self._client = OpenAI(base_url=model_url, api_key="not-needed")
+                self._backend = OpenAIBackend.shared(model_url, api_key="not-needed")
             elif self._SERVER == "local":
-                self._client = ChatOllama(
-                    model=self._model_name,
-                    temperature=self._temperature,
-                    base_url=url
-                    # other params ...
-                )
+                self._backend = OllamaBackend.shared(model_url)
             elif self._SERVER == "cloud":
-                self._client = Client(
-                    host=model_url,
-                    headers={'Authorization': 'Bearer ' + model_key})
+                self._backend = OllamaBackend.shared(model_url, headers={'Authorization': 'Bearer ' + model_key})
             else:
                 raise ValueError("Unknown server type")
+            self._cache_options = self._backend.cache_options() if cache_prompt else {}
+            self._instruction = system_message(self._instruct)
 
     def call_llm(self, prompt):
-        response = ''
-        if self._SERVER=="cloud":
-            self._log.info("Prompt to LLM: %s", prompt)
-            result = self._client.chat(model=self._model, messages=prompt)
-            #Arguments: (ChatResponse(model='gpt-oss:120b',
-            # created_at='2025-11-06T18:23:49.682240702Z',
-            # done=True, done_reason='stop',
-            # total_duration=2664602614,
-            # load_duration=None, p
-            # rompt_eval_count=572,
-            # prompt_eval_duration=None,
-            # eval_count=312,
-            # eval_duration=None,
-            # message=Message(role='assistant',
-            # content='Joe is a 40‑year‑old unmarried stock trader from New\u202fYork who likes dogs, pizza, robots, and has a brother named Kerem, along with parents, siblings, and even a grandchild. He is curious and confident, but doesn’t trust the speaker.', images=None, tool_calls=None)),)
-
-            # for part in self._client.chat(model=self._model, messages=prompt, stream=True):
-            response = result['message']['content']
-        elif self._SERVER=="local":
-            response = self._client.invoke(prompt)
-        elif self._SERVER=="server":
-            response = self._client.chat.completions.create(model=self._model, messages=prompt)
-        else:
-            raise ValueError("Unknown server type")
+        self._log.info("Prompt to LLM: %s", prompt)
+        response = self._backend.chat_sync(self._model, prompt, temperature=self._temperature,
+                                           max_tokens=self._max_tokens, **self._cache_options)
         self._log.info('LLM response %s: %s', type(response), response)
         return response
 
+    @property
+    def paraphrase_cache(self):
+        return self._paraphrase_cache
+
+    def _paraphrase(self, prompt, reply):
+        if self._paraphrase_cache is None:
+            return self.call_llm(prompt)
+
+        key = self._paraphrase_cache.key(self._model, self._instruct, self._temperature, reply)
+        paraphrase = self._paraphrase_cache.get(key)
+        if paraphrase is None:
+            paraphrase = self.call_llm(prompt)
+            if paraphrase:
+                self._paraphrase_cache.put(key, paraphrase)
+        else:
+            self._log.debug("Paraphrase cache hit for: %s", reply)
+
+        return paraphrase
+
+    @timed("paraphrase")
     def llamalize_reply(self, reply):
         response = reply
         if self._llamalize:
             self._log.info(f"Before llamatize: {response}")
-            instruction = {'role': 'system', 'content': self._instruct}
             input = {'role': 'user', 'content': reply}
-            prompt = [instruction, input]
+            prompt = (self._instruction, input)
             self._log.info(f"Paraphrase prompt input for the LLM: {input}")
             if reply:
                 if self._show_original:
                     response = "My original response was: "+reply+". "
-                paraphrase = self.call_llm(prompt)
+                paraphrase = self._paraphrase(prompt, reply)
                 if self._show_original:
                     response += "This is how the LLM paraphrased it: " + paraphrase
                 else:
@@ -124,7 +130,7 @@ class LenkaReplier(BasicReplier):
             return self._phrase_no_answer_to_question(brain_response['question'])
 
         # TODO revise (we conjugate the predicate by doing this)
-        utterance = casefold_capsule(brain_response['question'], format='natural')
+        utterance = casefolded(brain_response, 'question')
 
         # Each triple is hashed, so we can figure out when we are about the say things double
         handled_items = set()
@@ -348,8 +354,8 @@ class LenkaReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['statement'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'statement')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         thought_options = [option for option in thought_options if thoughts[option] is not None]
@@ -397,8 +403,8 @@ class LenkaReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['mention'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'mention')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         options = [option for option in thought_options if thoughts[option] is not None]
@@ -1,7 +1,6 @@
 import random
 import json
 
-from cltl.commons.casefolding import casefold_capsule
 from cltl.commons.language_data.sentences import NO_ANSWER
 from cltl.commons.language_helpers import lexicon_lookup
 from cltl.commons.triple_helpers import filtered_types_names
@@ -9,16 +8,20 @@ from cltl.reply_generation.api import Phraser
 from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
 
 from cltl.reply_generation.api import BasicReplier
-from cltl.reply_generation.prompts.response_processor import PromptProcessor
+from cltl.reply_generation.backends.llm_backend import OpenAIBackend
+from cltl.reply_generation.prompts.response_processor import PromptProcessor, INSTRUCTION_LAYOUT
 from cltl.reply_generation.thought_selectors.random_selector import RandomSelector
+from cltl.reply_generation.utils.budget import budget_exceeded
+from cltl.reply_generation.utils.capsule_utils import casefolded
+from cltl.reply_generation.utils.stream_utils import text_parts
 from cltl.reply_generation.utils.phraser_utils import replace_pronouns, assign_spo, deal_with_authors, fix_entity
-from openai import OpenAI
 
 
 TEST_RESPONSE = [{'response': '204', 'statement': {'chat': '6952a7c1-d6f2-4b65-a906-6d0801b769cb', 'turn': '82a67e33-f80a-4fe1-83cc-edcf6a5eff43', 'author': {'label': 'Human', 'type': ['person'], 'uri': 'http://cltl.nl/leolani/world/human'}, 'utterance': 'I like cats', 'utterance_type': 'STATEMENT', 'position': '0-11', 'subject': {'label': 'leolani', 'type': ['robot'], 'uri': 'http://cltl.nl/leolani/world/leolani'}, 'predicate': {'label': 'like', 'type': [], 'uri': 'http://cltl.nl/leolani/n2mu/like'}, 'object': {'label': 'cats', 'type': ['cats'], 'uri': 'http://cltl.nl/leolani/world/cats'}, 'perspective': {'_certainty': 'CERTAIN', '_polarity': 'POSITIVE', '_sentiment': 'UNDERSPECIFIED', '_time': None, '_emotion': 'UNDERSPECIFIED'}, 'context_id': '6952a7c1-d6f2-4b65-a906-6d0801b769cb', 'timestamp': 1725516574704, 'triple': {'_subject': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/like', '_label': 'like', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_complement': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}}}, 'thoughts': {'_statement_novelty': [], '_entity_novelty': {'_subject': False, '_complement': False}, '_negation_conflicts': [], '_complement_conflict': [], '_subject_gaps': {'_subject': [{'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-colleague-of', '_label': 'be-colleague-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/know', '_label': 'know', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-friends-with', '_label': 'be-friends-with', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/born-in', '_label': 'born-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-from', '_label': 'be-from', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['musical-work']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/live-in', '_label': 'live-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/love', '_label': 'love', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/like', '_label': 'like', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/manufacture-in', '_label': 'manufacture-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['musical-work']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/own', '_label': 'own', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['drink']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['drink']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['book']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/study-at', '_label': 'study-at', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-member-of', '_label': 'be-member-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/travel-to', '_label': 'travel-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/visit', '_label': 'visit', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/watch', '_label': 'watch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/watch', '_label': 'watch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['movie']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/work-as', '_label': 'work-as', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['profession']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/work-at', '_label': 'work-at', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['book']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/sport', '_label': 'sport', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/sport', '_label': 'sport', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['sport']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-inside', '_label': 'be-inside', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-inside', '_label': 'be-inside', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-inside', '_label': 'be-inside', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['container']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-inside', '_label': 'be-inside', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}], '_complement': [{'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-colleague-of', '_label': 'be-colleague-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/know', '_label': 'know', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-friends-with', '_label': 'be-friends-with', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/love', '_label': 'love', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/like', '_label': 'like', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/visit', '_label': 'visit', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-inside', '_label': 'be-inside', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/own', '_label': 'own', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/leolani', '_label': 'leolani', '_offset': None, '_confidence': 0.0, '_types': ['robot', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}]}, '_complement_gaps': {'_subject': [{'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-colleague-of', '_label': 'be-colleague-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-friends-with', '_label': 'be-friends-with', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/born-in', '_label': 'born-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-from', '_label': 'be-from', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/cook', '_label': 'cook', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/create', '_label': 'create', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/eat', '_label': 'eat', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-breakfast', '_label': 'have-breakfast', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-dinner', '_label': 'have-dinner', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/have-lunch', '_label': 'have-lunch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['food']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['musical-work']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/listen-to', '_label': 'listen-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/live-in', '_label': 'live-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/love', '_label': 'love', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/manufacture-in', '_label': 'manufacture-in', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['musical-work']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/music', '_label': 'music', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/own', '_label': 'own', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/perform', '_label': 'perform', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['drink']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/prepare-drink', '_label': 'prepare-drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/drink', '_label': 'drink', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['drink']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/program', '_label': 'program', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['book']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/read', '_label': 'read', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/study-at', '_label': 'study-at', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-member-of', '_label': 'be-member-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/travel-to', '_label': 'travel-to', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['location']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/visit', '_label': 'visit', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/watch', '_label': 'watch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/watch', '_label': 'watch', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['movie']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/work-as', '_label': 'work-as', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['profession']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/work-at', '_label': 'work-at', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['institution']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['book']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/write', '_label': 'write', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['artifact', 'object']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/sport', '_label': 'sport', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['interest']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/sport', '_label': 'sport', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['sport']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}], '_complement': [{'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-brother-of', '_label': 'be-brother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sibling-of', '_label': 'be-sibling-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-colleague-of', '_label': 'be-colleague-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-daughter-of', '_label': 'be-daughter-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-child-of', '_label': 'be-child-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-son-of', '_label': 'be-son-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-father-of', '_label': 'be-father-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-parent-of', '_label': 'be-parent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-mother-of', '_label': 'be-mother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-friends-with', '_label': 'be-friends-with', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandfather-of', '_label': 'be-grandfather-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandparent-of', '_label': 'be-grandparent-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-grandmother-of', '_label': 'be-grandmother-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-husband-of', '_label': 'be-husband-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-spouse-of', '_label': 'be-spouse-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-wife-of', '_label': 'be-wife-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-partner-of', '_label': 'be-partner-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-sister-of', '_label': 'be-sister-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/love', '_label': 'love', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/visit', '_label': 'visit', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-descendant-of', '_label': 'be-descendant-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-family-of', '_label': 'be-family-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['person']}}, {'_known_entity': {'_id': 'http://cltl.nl/leolani/world/cats', '_label': 'cats', '_offset': None, '_confidence': 0.0, '_types': ['cats', 'Instance']}, '_predicate': {'_id': 'http://cltl.nl/leolani/n2mu/be-ancestor-of', '_label': 'be-ancestor-of', '_offset': None, '_confidence': 0.0, '_cardinality': 1}, '_entity': {'_id': 'http://cltl.nl/leolani/n2mu/', '_label': '', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}]}, '_overlaps': {'_subject': [{'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/dogs', '_label': 'dogs', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'animal']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/dogs', '_label': 'dogs', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'animal']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/dogs', '_label': 'dogs', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'animal']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/flowers', '_label': 'flowers', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'antarctica']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/flowers', '_label': 'flowers', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'antarctica']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/flowers', '_label': 'flowers', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'antarctica']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cars', '_label': 'cars', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'cars']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cars', '_label': 'cars', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'cars']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cars', '_label': 'cars', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'cars']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/trees', '_label': 'trees', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'plant']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/trees', '_label': 'trees', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'plant']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/trees', '_label': 'trees', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'object', 'plant']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/jars', '_label': 'jars', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/jars', '_label': 'jars', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/jars', '_label': 'jars', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/bananas', '_label': 'bananas', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'bananas']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/bananas', '_label': 'bananas', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'bananas']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/bananas', '_label': 'bananas', '_offset': None, '_confidence': 0.0, '_types': ['agent', 'bananas']}}], '_complement': [{'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/carla', '_label': 'carla', '_offset': None, '_confidence': 0.0, '_types': ['person', 'agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/carla', '_label': 'carla', '_offset': None, '_confidence': 0.0, '_types': ['person', 'agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/carla', '_label': 'carla', '_offset': None, '_confidence': 0.0, '_types': ['person', 'agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cas', '_label': 'cas', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cas', '_label': 'cas', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/cas', '_label': 'cas', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-26'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/fred', '_label': 'fred', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-27'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/fred', '_label': 'fred', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}, {'_provenance': {'_author': {'_id': 'http://cltl.nl/leolani/friends/human', '_label': 'human', '_offset': None, '_confidence': 0.0, '_types': ['Source', 'Actor']}, '_date': '2024-06-28'}, '_entity': {'_id': 'http://cltl.nl/leolani/world/fred', '_label': 'fred', '_offset': None, '_confidence': 0.0, '_types': ['agent']}}]}, '_trust': 0.5}, 'rdf_log_path': 'storage/rdf/2024-09-05-08-08/brain_log_2024-09-05-08-09-36-515894'}]
 
 class LlamaReplier(BasicReplier):
-    def __init__(self, thought_selector=RandomSelector(), language="English", llama_server= "http://localhost", port= "9001"):
+    def __init__(self, thought_selector=RandomSelector(), language="English", llama_server= "http://localhost", port= "9001",
+                 prompt_layout=INSTRUCTION_LAYOUT, cache_prompt=False, parallel_prompts=None):
         # type: (ThoughtSelector) -> None
         """
         Generate natural language based on structured data
@@ -27,6 +30,15 @@ class LlamaReplier(BasicReplier):
         ----------
         thought_selector: ThoughtSelector
             Thought selector to pick thought type for the reply.
+        prompt_layout: str
+            Layout of the prompts, see PromptProcessor. Use SHARED_PREFIX_LAYOUT together with cache_prompt to let
+            the server reuse the encoded system prompt across turns.
+        cache_prompt: bool
+            Ask the server to keep the encoded prompt for the next request.
+        parallel_prompts: int
+            Send up to this number of different prompts for a statement concurrently and reply with the first
+            completion that has content, the other requests are cancelled. By default prompts are tried one after
+            another until a completion has content. Start the llama.cpp server with at least as many parallel slots.
 
         This requires a llama server to run in a terminal.
 
@@ -49,36 +61,62 @@ class LlamaReplier(BasicReplier):
 
             python -m llama_cpp.server --host 0.0.0.0 --model ./models/Meta-Llama-3-8B-Instruct.Q2_K.gguf --n_ctx 2048 --port 9001
 
-        The LlamaRepier creates an OPenAI client and will send the prompt request to the server for a response
+        The LlamaRepier uses an OpenAI compatible backend, shared by all repliers for the same server, and will send
+        the prompt request to the server for a response
 
         """
         super(LlamaReplier, self).__init__()
         self._language = language
         url = llama_server+ ":"+port+"/v1"
-        self._llama_client = OpenAI(base_url=url, api_key="not-needed")
+        self._backend = OpenAIBackend.shared(url, api_key="not-needed")
+        self._cache_options = self._backend.cache_options() if cache_prompt else {}
+        self._parallel_prompts = parallel_prompts
         self._thought_selector = thought_selector
         self._log.debug(f"Random Selector ready")
-        self._processor = PromptProcessor(language)
+        self._processor = PromptProcessor(language, layout=prompt_layout)
         self._phraser = PatternPhraser()
         self._log.debug(f"Pattern phraser ready")
 
 
-    def _generate_from_prompt(self, prompt):
-        completion = self._llama_client.chat.completions.create(
-            # completion = client.chatCompletions.create(
-            model="local-model",  # this field is currently unused
-            messages=prompt,
-            temperature=0.3,
-            max_tokens=100,
-            stream=True,
+    def _stream_from_prompt(self, prompt, temperature=0.3, max_tokens=100):
+        completion = self._backend.stream_chat_sync(
+            "local-model",  # this field is currently unused
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **self._cache_options,
         )
 
+        return self._stream_within_budget(completion)
+
+    def _stream_from_first_prompt(self, prompts, temperature=0.3, max_tokens=100):
+        completion = self._backend.first_stream_chat_sync(
+            "local-model",  # this field is currently unused
+            prompts,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **self._cache_options,
+        )
+
+        return self._stream_within_budget(completion)
+
+    def _stream_within_budget(self, completion):
+        try:
+            for chunk in completion:
+                if budget_exceeded():
+                    self._log.warning("Time budget exceeded, stop generation")
+                    break
+                yield chunk
+        finally:
+            # Cancels the request if the reply is not consumed completely
+            completion.close()
+
+    def _generate_from_prompt(self, prompt):
         #### In case we want to keep the previous conversation turns for Llama
         new_message = {"role": "assistant", "content": ""}
 
-        for chunk in completion:
-            if chunk.choices[0].delta.content:
-                new_message["content"] += chunk.choices[0].delta.content
+        for chunk in self._stream_from_prompt(prompt):
+            new_message["content"] += chunk
         return new_message["content"]
 
     def reply_to_question(self, brain_response):
@@ -104,7 +142,7 @@ class LlamaReplier(BasicReplier):
         #                       'context_id': 'f51d2acf-a7df-4156-90e4-1c00ee0ffbd5', 'timestamp': 1718888271633,
         #                       'triple': ?_like_music[_->_])}, 'rdf_log_path': None})
         # TODO revise (we conjugate the predicate by doing this)
-        utterance = casefold_capsule(brain_response['question'], format='natural')
+        utterance = casefolded(brain_response, 'question')
 
         # Quick check if there is anything to do here
         if not brain_response['response']:
@@ -239,30 +277,29 @@ class LlamaReplier(BasicReplier):
 
 
     def reply_to_statement(self, brain_response, persist=False, thought_options=None):
-        reply=""
+        return "".join(self.stream_reply_to_statement(brain_response, persist=persist, thought_options=thought_options))
+
+    def stream_reply_to_statement(self, brain_response, persist=False, thought_options=None):
+        """Yield the reply to a statement in sentence or clause sized parts while it is generated."""
+        replied = False
         prompts = self._processor.get_all_prompt_input_from_response(brain_response)
-        if prompts:
+        if prompts and self._parallel_prompts:
+            prompts = random.sample(prompts, min(self._parallel_prompts, len(prompts)))
+            for part in text_parts(self._stream_from_first_prompt(prompts, temperature=0, max_tokens=150)):
+                replied = True
+                yield part
+        elif prompts:
             attempts = 0
-            while reply=="" and attempts<10:
+            while not replied and attempts<10 and not budget_exceeded():
                 attempts+=1
                 prompt = random.choice(prompts)
-                completion = self._llama_client.chat.completions.create(
-                    # completion = client.chatCompletions.create(
-                    model="local-model",  # this field is currently unused
-                    messages=prompt,
-                    temperature=0,
-                    max_tokens=150,
-                    stream=True,
-                )
-                new_message = {"role": "assistant", "content": ""}
-                for chunk in completion:
-                    if chunk.choices[0].delta.content:
-                        #print(chunk.choices[0].delta.content, end="", flush=True)
-                        reply += chunk.choices[0].delta.content
-        if reply =="":
+                for part in text_parts(self._stream_from_prompt(prompt, temperature=0, max_tokens=150)):
+                    #print(part, end="", flush=True)
+                    replied = True
+                    yield part
+        if not replied:
             reply = self._phraser.phrase_fallback()
-            reply = self._generate_from_prompt(reply)
-        return reply
+            yield from text_parts(self._stream_from_prompt([{"role": "user", "content": reply}]))
 
     def reply_to_statement_old(self, brain_response, persist=False, thought_options=None, end_recursion=5):
         """
@@ -289,8 +326,8 @@ class LlamaReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['statement'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'statement')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         thought_options = [option for option in thought_options if thoughts[option] is not None]
@@ -343,8 +380,8 @@ class LlamaReplier(BasicReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['mention'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'mention')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Filter out None thoughts
         options = [option for option in thought_options if thoughts[option] is not None]
@@ -380,18 +417,15 @@ if __name__ == "__main__":
         new_message = ""
         for prompt in prompts:
             print("PROMPT", prompt)
-            completion = replier._llama_client.chat.completions.create(
-                # completion = client.chatCompletions.create(
-                model="local-model",  # this field is currently unused
-                messages=prompt,
+            completion = replier._backend.stream_chat_sync(
+                "local-model",  # this field is currently unused
+                prompt,
                 temperature=0,
                 max_tokens=150,
-                stream=True,
             )
             for chunk in completion:
-                if chunk.choices[0].delta.content:
-                    print(chunk.choices[0].delta.content, end="", flush=True)
-                    new_message += chunk.choices[0].delta.content
+                print(chunk, end="", flush=True)
+                new_message += chunk
         print(new_message)
 
 
@@ -6,32 +6,61 @@
     Date created: Nov. 11th, 2021
 """
 
-from cltl.commons.casefolding import (casefold_capsule)
-
 from cltl.reply_generation.lenka_replier import LenkaReplier
 from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
+from cltl.reply_generation.thought_selectors.nsp_engines import FP32
 from cltl.reply_generation.thought_selectors.nsp_selector import NSP
+from cltl.reply_generation.utils.capsule_utils import casefolded
 from cltl.reply_generation.utils.thought_utils import thoughts_from_brain
 
 
 class NSPReplier(LenkaReplier):
-    def __init__(self, model_filepath):
+    def __init__(self, model_filepath, max_thoughts_per_category=None, max_wait=None, max_batch=None,
+                 engine=FP32):
         """Creates a replier to respond to questions and statements by the
         user. Statements are replied to by phrasing a thought. Selection
         is performed through Next Sentence Prediction (NSP).
 
         params
         str model_filepath:  file with a pretrained BERT NSP nsp_model
+        int max_thoughts_per_category: if set, at most this many thoughts per
+                             thought type are phrased and scored
+        float max_wait:      if set, replies of concurrent turns scored within
+                             max_wait seconds share forward passes of the NSP model
+        int max_batch:       maximum number of replies in a shared forward pass
+        str engine:          inference engine of the NSP model, e.g. 'int8' or
+                             'onnx-int8' for faster scoring on CPU
 
         returns: None
         """
         super(NSPReplier, self).__init__()
-        self._thought_selector = NSP(model_filepath)
+        self._thought_selector = NSP(model_filepath, max_wait=max_wait, max_batch=max_batch, engine=engine)
         self._log.debug(f"NSP Selector ready")
 
         self._phraser = PatternPhraser()
         self._log.debug(f"Pattern phraser ready")
 
+        self._max_thoughts_per_category = max_thoughts_per_category
+
+    def _score_thoughts(self, utterance, thoughts):
+        """Phrases all thoughts and scores the replies w.r.t. the utterance in a single batch.
+
+        returns: list of (thought_type, reply, score) of the thoughts that could be phrased
+        """
+        phrased = []
+        for thought_type, thought_info in thoughts.values():
+            # Generate reply
+            reply = self._phraser.phrase_correct_thought(utterance, thought_type, thought_info)
+            # Thoughts that cannot be phrased are not scored
+            if reply:
+                phrased.append((thought_type, reply))
+
+        # Score responses w.r.t. context
+        context = utterance["utterance"]
+        scores = self._thought_selector.score_responses(context, [reply for _, reply in phrased])
+
+        return [(thought_type, reply, score) for (thought_type, reply), score in zip(phrased, scores)]
+
     def reply_to_statement(self, brain_response, persist=False, thought_options=None):
         """
         Phrase a thought based on the brain response
@@ -55,27 +84,17 @@ class NSPReplier(LenkaReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Csefold
-        utterance = casefold_capsule(brain_response['statement'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'statement')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Extract thoughts from brain response
-        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options)
+        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options,
+                                       max_per_category=self._max_thoughts_per_category)
 
         # Score phrasings of thoughts
-        data = []
-        for thought_type, thought_info in thoughts.values():
-            # preprocess
-            thought_info = {"thought": thought_info}
-            thought_info = casefold_capsule(thought_info, format="natural")
-            thought_info = thought_info["thought"]
-
-            # Generate reply
-            reply = self._phraser.phrase_correct_thought(utterance, thought_type, thought_info)
-
-            # Score response w.r.t. context
-            context = utterance["utterance"]
-            score = self._thought_selector.score_response(context, reply)
-            data.append((thought_type, reply, score))
+        data = self._score_thoughts(utterance, thoughts)
+        if not data:
+            return None
 
         # Select thought
         best = self._thought_selector.select(data)
@@ -107,27 +126,17 @@ class NSPReplier(LenkaReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['mention'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'mention')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Extract thoughts from brain response
-        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options)
+        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options,
+                                       max_per_category=self._max_thoughts_per_category)
 
         # Score phrasings of thoughts
-        data = []
-        for thought_type, thought_info in thoughts.values():
-            # preprocess
-            thought_info = {"thought": thought_info}
-            thought_info = casefold_capsule(thought_info, format="natural")
-            thought_info = thought_info["thought"]
-
-            # Generate reply
-            reply = self._phraser.phrase_correct_thought(utterance, thought_type, thought_info)
-
-            # Score response w.r.t. context
-            context = utterance["utterance"]
-            score = self._thought_selector.score_response(context, reply)
-            data.append((thought_type, reply, score))
+        data = self._score_thoughts(utterance, thoughts)
+        if not data:
+            return None
 
         # Select thought
         best = self._thought_selector.select(data)
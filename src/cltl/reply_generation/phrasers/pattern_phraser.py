@@ -3,10 +3,9 @@ from typing import Optional
 
 from cltl.commons.language_data.sentences import NEW_KNOWLEDGE, EXISTING_KNOWLEDGE, CONFLICTING_KNOWLEDGE, \
     CURIOSITY, HAPPY
-from cltl.commons.triple_helpers import filtered_types_names
 
 from cltl.reply_generation.api import Phraser
-from cltl.reply_generation.utils.phraser_utils import replace_pronouns
+from cltl.reply_generation.utils.phraser_utils import replace_pronouns, type_names
 from cltl.reply_generation.utils.thought_utils import clean_overlaps
 
 
@@ -91,9 +90,10 @@ class PatternPhraser(Phraser):
             say = random.choice(NEW_KNOWLEDGE)
 
             if entity_role == 'subject':
-                if 'person' in filtered_types_names(utterance['triple']['_complement']['_types']):
+                complement_types = type_names(utterance['triple']['_complement']['_types'])
+                if 'person' in complement_types:
                     any_type = 'anybody'
-                elif 'location' in filtered_types_names(utterance['triple']['_complement']['_types']):
+                elif 'location' in complement_types:
                     any_type = 'anywhere'
                 else:
                     any_type = 'anything'
@@ -173,41 +173,32 @@ class PatternPhraser(Phraser):
         gap = random.choice(gaps)
         say = random.choice(CURIOSITY)
 
+        types = type_names(gap['_entity']['_types'])
+        predicate = gap['_predicate']['_label']
+        known_entity = gap['_known_entity']['_label']
+
         if entity_role == 'subject':
-            if 'is ' in gap['_predicate']['_label'] or ' is' in gap['_predicate']['_label']:
-                say += ' Is there a %s that %s %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                       gap['_predicate']['_label'],
-                                                       gap['_known_entity']['_label'])
-            elif ' of' in gap['_predicate']['_label']:
-                say += ' Is there a %s that %s is %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                          gap['_known_entity']['_label'],
-                                                          gap['_predicate']['_label'])
-
-            elif ' ' in gap['_predicate']['_label']:
-                say += ' Is there a %s that is %s %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                          gap['_predicate']['_label'],
-                                                          gap['_known_entity']['_label'])
+            if 'is ' in predicate or ' is' in predicate:
+                say += ' Is there a %s that %s %s?' % (types, predicate, known_entity)
+            elif ' of' in predicate:
+                say += ' Is there a %s that %s is %s?' % (types, known_entity, predicate)
+
+            elif ' ' in predicate:
+                say += ' Is there a %s that is %s %s?' % (types, predicate, known_entity)
             else:
                 # Checked
-                say += ' Has %s %s %s?' % (gap['_known_entity']['_label'],
-                                           gap['_predicate']['_label'],
-                                           filtered_types_names(gap['_entity']['_types']))
+                say += ' Has %s %s %s?' % (known_entity, predicate, types)
 
         elif entity_role == 'object':
-            if '#' in filtered_types_names(gap['_entity']['_types']):
-                say += ' What is %s %s?' % (gap['_known_entity']['_label'],
-                                            gap['_predicate']['_label'])
-            elif ' ' in gap['_predicate']['_label']:
+            if '#' in types:
+                say += ' What is %s %s?' % (known_entity, predicate)
+            elif ' ' in predicate:
                 # Checked
-                say += ' Has %s ever %s %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                gap['_predicate']['_label'],
-                                                gap['_known_entity']['_label'])
+                say += ' Has %s ever %s %s?' % (types, predicate, known_entity)
 
             else:
                 # Checked
-                say += ' Has %s ever %s a %s?' % (gap['_known_entity']['_label'],
-                                                  gap['_predicate']['_label'],
-                                                  filtered_types_names(gap['_entity']['_types']))
+                say += ' Has %s ever %s a %s?' % (known_entity, predicate, types)
 
         return say
 
@@ -229,28 +220,23 @@ class PatternPhraser(Phraser):
         gap = random.choice(gaps)
         say = random.choice(CURIOSITY)
 
+        types = type_names(gap['_entity']['_types'])
+        predicate = gap['_predicate']['_label']
+        known_entity = gap['_known_entity']['_label']
+
         if entity_role == 'subject':
-            if ' in' in gap['_predicate']['_label']:  # ' by' in gap['_predicate']['_label']
-                say += ' Is there a %s %s %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                  gap['_predicate']['_label'],
-                                                  gap['_known_entity']['_label'])
+            if ' in' in predicate:  # ' by' in predicate
+                say += ' Is there a %s %s %s?' % (types, predicate, known_entity)
             else:
-                say += ' Has %s %s by a %s?' % (gap['_known_entity']['_label'],
-                                                gap['_predicate']['_label'],
-                                                filtered_types_names(gap['_entity']['_types']))
+                say += ' Has %s %s by a %s?' % (known_entity, predicate, types)
 
         elif entity_role == 'object':
-            if '#' in filtered_types_names(gap['_entity']['_types']):
-                say += ' What is %s %s?' % (gap['_known_entity']['_label'],
-                                            gap['_predicate']['_label'])
-            elif ' by' in gap['_predicate']['_label']:
-                say += ' Has %s ever %s a %s?' % (gap['_known_entity']['_label'],
-                                                  gap['_predicate']['_label'],
-                                                  filtered_types_names(gap['_entity']['_types']))
+            if '#' in types:
+                say += ' What is %s %s?' % (known_entity, predicate)
+            elif ' by' in predicate:
+                say += ' Has %s ever %s a %s?' % (known_entity, predicate, types)
             else:
-                say += ' Has a %s ever %s %s?' % (filtered_types_names(gap['_entity']['_types']),
-                                                  gap['_predicate']['_label'],
-                                                  gap['_known_entity']['_label'])
+                say += ' Has a %s ever %s %s?' % (types, predicate, known_entity)
 
         return say
 
@@ -289,7 +275,7 @@ class PatternPhraser(Phraser):
 
         elif entity_role == 'object':
             sample = random.sample(overlaps, 2)
-            types = filtered_types_names(sample[0]['_entity']['_types']) if sample[0]['_entity']['_types'] else 'things'
+            types = type_names(sample[0]['_entity']['_types']) if sample[0]['_entity']['_types'] else 'things'
             say += ' Now I know %s %s that %s %s, like %s and %s' % (len(overlaps), types,
                                                                      utterance['triple']['_predicate']['_label'],
                                                                      utterance['triple']['_complement']['_label'],
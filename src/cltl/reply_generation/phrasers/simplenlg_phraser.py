@@ -1,14 +1,14 @@
 import random
+from functools import lru_cache
 from typing import Optional
 
 from cltl.commons.language_data.sentences import NEW_KNOWLEDGE, EXISTING_KNOWLEDGE, CONFLICTING_KNOWLEDGE, \
     CURIOSITY, HAPPY
-from cltl.commons.triple_helpers import filtered_types_names
 from simplenlg.framework import *
 from simplenlg.realiser.english import *
 
 from cltl.reply_generation.api import Phraser
-from cltl.reply_generation.utils.phraser_utils import replace_pronouns
+from cltl.reply_generation.utils.phraser_utils import replace_pronouns, type_names
 from cltl.reply_generation.utils.thought_utils import clean_overlaps
 
 lexicon = Lexicon.getDefaultLexicon()
@@ -16,8 +16,52 @@ realiser = Realiser(lexicon)
 nlgFactory = NLGFactory(lexicon)
 
 
+# Maximum number of realised clauses kept in memory
+REALISATION_CACHE_SIZE = 4096
+
+
 def simple_nlg(subject, predicate, complement=None, modifier=None, negation=False, question=None, tense=None,
                perfect=False):
+    """Realise a clause as a sentence. Realisations are cached per argument tuple, as the same triples are phrased
+    repeatedly in a conversation.
+
+    returns: the realised sentence
+    """
+    return _realise(subject, predicate, complement, modifier, negation, question, tense, perfect)
+
+
+def simple_nlg_batch(clauses):
+    """Realise several clauses at once, e.g. the candidates for a reply. Equal clauses are realised once.
+
+    params
+    list clauses: keyword arguments of simple_nlg per clause
+
+    returns: the realised sentences in the order of the clauses
+    """
+    realised = dict()
+    keys = [_clause_key(**clause) for clause in clauses]
+    for key in keys:
+        if key not in realised:
+            realised[key] = _realise(*key)
+
+    return [realised[key] for key in keys]
+
+
+def realisation_cache_info():
+    return _realise.cache_info()
+
+
+def clear_realisation_cache():
+    _realise.cache_clear()
+
+
+def _clause_key(subject, predicate, complement=None, modifier=None, negation=False, question=None, tense=None,
+                perfect=False):
+    return subject, predicate, complement, modifier, negation, question, tense, perfect
+
+
+@lru_cache(maxsize=REALISATION_CACHE_SIZE)
+def _realise(subject, predicate, complement, modifier, negation, question, tense, perfect):
     p = nlgFactory.createClause()
     p.setSubject(subject)
     predicate = predicate.replace("-", " ")
@@ -70,11 +114,13 @@ class SimplenlgPhraser(Phraser):
                 else utterance['triple']['_subject']['_label']
 
             # Checked
+            before, now = simple_nlg_batch([
+                dict(subject=y, predicate=utterance['triple']['_predicate']['_label'],
+                     complement=conflict['_complement']['_label']),
+                dict(subject=y, predicate=utterance['triple']['_predicate']['_label'],
+                     complement=utterance['triple']['_complement']['_label'])])
             say += ' %s told me on %s that %s But now you tell me that %s' \
-                   % (x, conflict['_provenance']['_date'],
-                      simple_nlg(y, utterance['triple']['_predicate']['_label'], conflict['_complement']['_label']),
-                      simple_nlg(y, utterance['triple']['_predicate']['_label'],
-                                 utterance['triple']['_complement']['_label']))
+                   % (x, conflict['_provenance']['_date'], before, now)
 
             return say
 
@@ -98,17 +144,15 @@ class SimplenlgPhraser(Phraser):
                 affirmative_conflict = random.choice(affirmative_conflict)
                 negative_conflict = random.choice(negative_conflict)
 
+                clause = dict(subject=utterance['triple']['_subject']['_label'],
+                              predicate=utterance['triple']['_predicate']['_label'],
+                              complement=utterance['triple']['_complement']['_label'])
+                affirmative, negative = simple_nlg_batch([clause, dict(clause, negation=True)])
                 say += ' %s told me on %s that %s But on %s %s told me that %s' \
                        % (affirmative_conflict['_provenance']['_author']['_label'],
-                          affirmative_conflict['_provenance']['_date'],
-                          simple_nlg(utterance['triple']['_subject']['_label'],
-                                     utterance['triple']['_predicate']['_label'],
-                                     utterance['triple']['_complement']['_label']),
+                          affirmative_conflict['_provenance']['_date'], affirmative,
                           negative_conflict['_provenance']['_date'],
-                          negative_conflict['_provenance']['_author']['_label'],
-                          simple_nlg(utterance['triple']['_subject']['_label'],
-                                     utterance['triple']['_predicate']['_label'],
-                                     utterance['triple']['_complement']['_label'], negation=True))
+                          negative_conflict['_provenance']['_author']['_label'], negative)
 
                 return say
 
@@ -123,9 +167,9 @@ class SimplenlgPhraser(Phraser):
             say = random.choice(NEW_KNOWLEDGE)
 
             if entity_role == 'subject':
-                if 'person' in filtered_types_names(utterance['triple']['_complement']['_types']):
+                if 'person' in type_names(utterance['triple']['_complement']['_types']):
                     any_type = 'anybody'
-                elif 'location' in filtered_types_names(utterance['triple']['_complement']['_types']):
+                elif 'location' in type_names(utterance['triple']['_complement']['_types']):
                     any_type = 'anywhere'
                 else:
                     any_type = 'anything'
@@ -201,23 +245,23 @@ class SimplenlgPhraser(Phraser):
 
         if entity_role == 'subject':
             if 'is-' in gap['_predicate']['_label'] or ' is' in gap['_predicate']['_label']:
-                say += ' Is there a %s that %s %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Is there a %s that %s %s?' % (type_names(gap['_entity']['_types']),
                                                        gap['_predicate']['_label'],
                                                        gap['_known_entity']['_label'])
             elif 'be-' in gap['_predicate']['_label']:
                 # Be-question
                 say += ' %s' % (simple_nlg(gap['_known_entity']['_label'],
                                            gap['_predicate']['_label'],
-                                           filtered_types_names(gap['_entity']['_types']),
+                                           type_names(gap['_entity']['_types']),
                                            question=InterrogativeType.YES_NO, tense=Tense.PRESENT, perfect=True))
 
             elif '-of' in gap['_predicate']['_label']:
-                say += ' Is there a %s that %s is %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Is there a %s that %s is %s?' % (type_names(gap['_entity']['_types']),
                                                           gap['_known_entity']['_label'],
                                                           gap['_predicate']['_label'])
 
             elif ' ' in gap['_predicate']['_label']:
-                say += ' Is there a %s that is %s %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Is there a %s that is %s %s?' % (type_names(gap['_entity']['_types']),
                                                           gap['_predicate']['_label'],
                                                           gap['_known_entity']['_label'])
 
@@ -225,20 +269,20 @@ class SimplenlgPhraser(Phraser):
                 # Verb-question
                 say += ' Has %s?' % (simple_nlg(gap['_known_entity']['_label'],
                                                 gap['_predicate']['_label'],
-                                                filtered_types_names(gap['_entity']['_types']), tense=Tense.PAST))
+                                                type_names(gap['_entity']['_types']), tense=Tense.PAST))
 
         elif entity_role == 'object':
-            if '#' in filtered_types_names(gap['_entity']['_types']):
+            if '#' in type_names(gap['_entity']['_types']):
                 say += ' What is %s %s?' % (gap['_known_entity']['_label'],
                                             gap['_predicate']['_label'])
             elif ' ' in gap['_predicate']['_label']:
                 # Checked
-                say += ' Has %s ever %s %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Has %s ever %s %s?' % (type_names(gap['_entity']['_types']),
                                                 gap['_predicate']['_label'],
                                                 gap['_known_entity']['_label'])
             elif 'be-' in gap['_predicate']['_label']:  # [Lea] TODO NEXT / CHECKPOINT
                 # Checked
-                say += ' %s ' % (simple_nlg(filtered_types_names(gap['_entity']['_types']),
+                say += ' %s ' % (simple_nlg(type_names(gap['_entity']['_types']),
                                             gap['_predicate']['_label'],
                                             gap['_known_entity']['_label'],
                                             # modifier="ever",
@@ -247,7 +291,7 @@ class SimplenlgPhraser(Phraser):
                 # Checked
                 say += ' Has %s ever %s a %s?' % (gap['_known_entity']['_label'],
                                                   gap['_predicate']['_label'],
-                                                  filtered_types_names(gap['_entity']['_types']))
+                                                  type_names(gap['_entity']['_types']))
 
         return say
 
@@ -271,24 +315,24 @@ class SimplenlgPhraser(Phraser):
 
         if entity_role == 'subject':
             if ' in' in gap['_predicate']['_label']:  # ' by' in gap['_predicate']['_label']
-                say += ' Is there a %s %s %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Is there a %s %s %s?' % (type_names(gap['_entity']['_types']),
                                                   gap['_predicate']['_label'],
                                                   gap['_known_entity']['_label'])
             else:
                 say += ' Has %s %s by a %s?' % (gap['_known_entity']['_label'],
                                                 gap['_predicate']['_label'],
-                                                filtered_types_names(gap['_entity']['_types']))
+                                                type_names(gap['_entity']['_types']))
 
         elif entity_role == 'object':
-            if '#' in filtered_types_names(gap['_entity']['_types']):
+            if '#' in type_names(gap['_entity']['_types']):
                 say += ' What is %s %s?' % (gap['_known_entity']['_label'],
                                             gap['_predicate']['_label'])
             elif ' by' in gap['_predicate']['_label']:
                 say += ' Has %s ever %s a %s?' % (gap['_known_entity']['_label'],
                                                   gap['_predicate']['_label'],
-                                                  filtered_types_names(gap['_entity']['_types']))
+                                                  type_names(gap['_entity']['_types']))
             else:
-                say += ' Has a %s ever %s %s?' % (filtered_types_names(gap['_entity']['_types']),
+                say += ' Has a %s ever %s %s?' % (type_names(gap['_entity']['_types']),
                                                   gap['_predicate']['_label'],
                                                   gap['_known_entity']['_label'])
 
@@ -330,7 +374,7 @@ class SimplenlgPhraser(Phraser):
 
         elif entity_role == 'object':
             sample = random.sample(overlaps, 2)
-            types = filtered_types_names(sample[0]['_entity']['_types']) if sample[0]['_entity']['_types'] else 'things'
+            types = type_names(sample[0]['_entity']['_types']) if sample[0]['_entity']['_types'] else 'things'
             say += ' Now I know %s %s %s ' \
                    'For example %s and %s.' % (len(overlaps), types,
                                                simple_nlg("that", utterance['triple']['_predicate']['_label'],
@@ -1,4 +1,6 @@
-import cltl.reply_generation.prompts.response_processor as processor
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 
 # _statement_novelty
 # _entity_novelty
@@ -9,101 +11,172 @@ import cltl.reply_generation.prompts.response_processor as processor
 # _overlaps
 # _trust
 
-class Instruct():
-
-    def __init__(self, language="English"):
-        # type: () -> None
-        """
-        Generate natural language based on structured data
-
-        Parameters
-        ----------
-        """
-        self._language = language
-
-    def get_instruct_for_statement (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+# System instructions per prompt type, formatted with the language of the replies
+INSTRUCTIONS = {
+    "statement": "You are an intelligent assistant. \
          I will give you as input: a phrase, followed by a perspective, followed by \"that\" and a triple with a subject, predicate and object.\
-         You need to paraphrase the input in plain " + self._language + ". \
+         You need to paraphrase the input in plain {language}. \
          Only reply with the short paraphrase of the input and only use the subject and object from the triple in your reply as given. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-        }
-        return instruct
-
-    def get_instruct_for_answer (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "answer": "You are an intelligent assistant. \
          I will give you as input: the question, followed by the answer.\
-         You need to paraphrase the input in plain " + self._language + ". \
+         You need to paraphrase the input in plain {language}. \
          Only reply with the short paraphrase of the input and only use the subject and object from the triple in your reply as given. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-        }
-        return instruct
-
-    def get_instruct_for_no_answer (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "no_answer": "You are an intelligent assistant. \
          You were given a question but you do not have an answer from your memory.\
-         You are given the question as input and need to explain that you have no answer in plain " + self._language + ". \
+         You are given the question as input and need to explain that you have no answer in plain {language}. \
          Only reply with the short paraphrase of the input and only use the subject and object from the triple in your reply as given. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
-         The response should be just the paraphrased text and nothing else."
-        }
-        return instruct
-
-
-    def get_instruct_for_subject_gap (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "subject_gap": "You are an intelligent assistant. \
          I will give you as input: a triple with a subject, a predicate and a type of subject.\
-         You need to paraphrase the input in plain " + self._language + " as a question for the object. \
+         You need to paraphrase the input in plain {language} as a question for the object. \
          Use who for the type person, where for the type location, when for the type time and what for everything else. \
          Only reply with the short paraphrase of the input. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-               }
-        return instruct
-
-
-    def get_instruct_for_object_gap (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "object_gap": "You are an intelligent assistant. \
          I will give you as input: a triple with a subject, a predicate and a type of object.\
-         You need to paraphrase the input in plain  " + self._language + "  as a question for the object. \
+         You need to paraphrase the input in plain  {language}  as a question for the object. \
          Use who for the type person, where for the type location, when for the type time and what for everything else. \
          Only reply with the short paraphrase of the input. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-               }
-        return instruct
-
-    def get_instruct_for_novelty (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "novelty": "You are an intelligent assistant. \
          I will give you as input: a triple with a subject, a predicate and a type of object and a phrase.\
-         You need to paraphrase the input in plain  " + self._language + ". \
+         You need to paraphrase the input in plain  {language}. \
          Only reply with the short paraphrase of the input. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-               }
-        return instruct
-
-    def get_instruct_for_conflict (self):
-        instruct = {"role": "system", "content": "You are an intelligent assistant. \
+         The response should be just the paraphrased text and nothing else.",
+    "conflict": "You are an intelligent assistant. \
          I will give you as input: a triple with a subject, a predicate and a type of object and a phrase that expresses a conflict.\
-         You need to paraphrase the input in plain  " + self._language + ". \
+         You need to paraphrase the input in plain  {language}. \
          Only reply with the short paraphrase of the input. \
          When responding use the names from the triple and be specific. \
          Do not give an explanation. \
          Do not explain what the subject and object is. \
-         The response should be just the paraphrased text and nothing else."
-           }
-        return instruct
+         The response should be just the paraphrased text and nothing else.",
+}
+
+# Layout with a shared prefix: one system instruction per language for all prompt types, such that LLM servers that
+# cache the encoded prompt (llama.cpp, Ollama) reuse it across turns. The prompt type specific part of the instruction
+# is sent with the input of the turn.
+SHARED_INSTRUCTION = "You are an intelligent assistant. " \
+                     "Each message gives you a task, followed by the input for the task. " \
+                     "You need to paraphrase the input in plain {language}. " \
+                     "Only reply with the short paraphrase of the input and only use the subject and object from " \
+                     "the triple in your reply as given. " \
+                     "When responding use the names from the triple and be specific. " \
+                     "When asked for a question, use who for the type person, where for the type location, when " \
+                     "for the type time and what for everything else. " \
+                     "Do not give an explanation. " \
+                     "Do not explain what the subject and object is. " \
+                     "The response should be just the paraphrased text and nothing else."
+
+TASKS = {
+    "statement": "Paraphrase the input: a phrase, followed by a perspective, followed by \"that\" and a triple with "
+                 "a subject, predicate and object.",
+    "answer": "Paraphrase the input: the question, followed by the answer.",
+    "no_answer": "You were given a question but you do not have an answer from your memory. Explain that you have no "
+                 "answer to the question in the input.",
+    "subject_gap": "Paraphrase the input as a question for the object: a triple with a subject, a predicate and a "
+                   "type of subject.",
+    "object_gap": "Paraphrase the input as a question for the object: a triple with a subject, a predicate and a "
+                  "type of object.",
+    "novelty": "Paraphrase the input: a triple with a subject, a predicate and a type of object and a phrase.",
+    "conflict": "Paraphrase the input: a triple with a subject, a predicate and a type of object and a phrase that "
+                "expresses a conflict.",
+}
+
+
+def system_message(content):
+    """Immutable system message, the content is interned such that equal instructions share one string."""
+    return MappingProxyType({"role": "system", "content": sys.intern(content)})
+
+
+@lru_cache(maxsize=None)
+def instructions_for_language(language="English"):
+    """System messages for all prompt types in the given language, created once per language and shared by all
+    Instruct instances.
+
+    Parameters
+    ----------
+    language: str
+        Language of the replies
+
+    Returns
+    -------
+    Mapping[str, Mapping]
+        Immutable system message per prompt type in INSTRUCTIONS
+    """
+    return MappingProxyType({prompt_type: system_message(template.format(language=language))
+                             for prompt_type, template in INSTRUCTIONS.items()})
+
+
+@lru_cache(maxsize=None)
+def shared_instruction_for_language(language="English"):
+    """System message of the shared prefix layout in the given language, created once per language."""
+    return system_message(SHARED_INSTRUCTION.format(language=language))
+
+
+class Instruct():
+
+    def __init__(self, language="English"):
+        # type: () -> None
+        """
+        Generate natural language based on structured data
+
+        The instructions are immutable, copy them with dict(instruct) to make changes.
+
+        Parameters
+        ----------
+        """
+        self._language = language
+        self._instructions = instructions_for_language(language)
+        self._shared_instruction = shared_instruction_for_language(language)
+
+    def get_instruct(self, prompt_type):
+        return self._instructions[prompt_type]
+
+    def get_shared_instruct(self):
+        return self._shared_instruction
+
+    def get_task(self, prompt_type):
+        return TASKS[prompt_type]
+
+    def get_instruct_for_statement (self):
+        return self._instructions["statement"]
+
+    def get_instruct_for_answer (self):
+        return self._instructions["answer"]
+
+    def get_instruct_for_no_answer (self):
+        return self._instructions["no_answer"]
+
+
+    def get_instruct_for_subject_gap (self):
+        return self._instructions["subject_gap"]
+
+
+    def get_instruct_for_object_gap (self):
+        return self._instructions["object_gap"]
+
+    def get_instruct_for_novelty (self):
+        return self._instructions["novelty"]
+
+    def get_instruct_for_conflict (self):
+        return self._instructions["conflict"]
@@ -9,32 +9,50 @@ from cltl.reply_generation.prompts.instruct import Instruct
 # * _overlaps
 # * _trust
 
+# Prompt layouts: a system instruction per prompt type followed by the input, or one system instruction shared by
+# all prompt types followed by the prompt type specific task and the input
+INSTRUCTION_LAYOUT = "instruction"
+SHARED_PREFIX_LAYOUT = "shared_prefix"
+
 
 class PromptProcessor():
 
-    def __init__(self, language="English"):
+    def __init__(self, language="English", layout=INSTRUCTION_LAYOUT):
         # type: () -> None
         """
         Generate natural language based on structured data
 
         Parameters
         ----------
+        language: str
+            Language of the replies
+        layout: str
+            INSTRUCTION_LAYOUT or SHARED_PREFIX_LAYOUT. With the shared prefix layout all prompts of a language start
+            with the same system message, such that LLM servers that cache the encoded prompt only encode the turn
+            specific suffix.
         """
-
+        if layout not in (INSTRUCTION_LAYOUT, SHARED_PREFIX_LAYOUT):
+            raise ValueError("Unknown prompt layout: " + str(layout))
 
         self._instruct = Instruct(language)
+        self._layout = layout
+
+    def _prompt(self, prompt_type, content):
+        # Prompts are tuples of the shared, immutable instruction and the message with the content of the turn
+        if self._layout == SHARED_PREFIX_LAYOUT:
+            return self._instruct.get_shared_instruct(), \
+                {"role": "user", "content": self._instruct.get_task(prompt_type) + "\nInput: " + content}
+
+        return self._instruct.get_instruct(prompt_type), {"role": "system", "content": content}
 
     def get_no_answer_prompt(self, question):
-        prompt = [self._instruct.get_instruct_for_no_answer(), {"role": "system", "content": "I have no answer for this question"+question["utterance"]}]
-        return prompt
+        return self._prompt("no_answer", "I have no answer for this question"+question["utterance"])
 
     def get_answer_prompt(self, question, answer):
-        prompt = [self._instruct.get_instruct_for_answer(), {"role": "system", "content": answer}]
-        return prompt
+        return self._prompt("answer", answer)
 
     def get_thought_prompt(self, statement, thought):
-        prompt = [self._instruct.get_instruct_for_statement(), {"role": "system", "content": statement+thought}]
-        return prompt
+        return self._prompt("statement", statement+thought)
 
     def get_utterance_from_statement (self, statement):
         if "utterance" in statement:
@@ -92,7 +110,7 @@ class PromptProcessor():
         known_entity = thought["_known_entity"]["_label"]
         predicate = thought["_predicate"]["_label"]
         gap_type = thought["_entity"]["_types"]
-        gap_text =gap_type[0]+", ", predicate+", "+known_entity
+        gap_text = gap_type[0]+", "+predicate+", "+known_entity
         return gap_text
 
     def get_complement_gap_complement(self, thought):
@@ -139,7 +157,7 @@ class PromptProcessor():
       #  print("novelties", novelties)
         for novelty in novelties:
             input = statement_author + " claims " + statement_text + ". Also " + self.get_provenance_from_statement_novelty(novelty["_provenance"])
-            prompt = [self._instruct.get_instruct_for_novelty(), {"role": "system", "content": input}]
+            prompt = self._prompt("novelty", input)
             prompts.append(prompt)
 
         # @TODO
@@ -153,7 +171,7 @@ class PromptProcessor():
       #  print("conflicts", conflicts)
         for conflict in conflicts:
             input = statement_author + " claims " + statement_text + ". But " + self.get_negation_conflict(conflict)
-            prompt = [self._instruct.get_instruct_for_novelty(), {"role": "system", "content": input}]
+            prompt = self._prompt("novelty", input)
             prompts.append(prompt)
 
         # @TODO
@@ -167,14 +185,14 @@ class PromptProcessor():
         if gaps["_subject"]:
             for gap in gaps["_subject"]:
                 input = self.get_subject_gap_subject(gap)
-                prompt = [self._instruct.get_instruct_for_subject_gap(), {"role": "system", "content": input}]
+                prompt = self._prompt("subject_gap", input)
              #   print(prompt)
                 prompts.append(prompt)
 
             if gaps["_complement"]:
                 for gap in gaps["_complement"]:
                     input = self.get_subject_gap_complement(gap)
-                    prompt = [self._instruct.get_instruct_for_subject_gap(), {"role": "system", "content": input}]
+                    prompt = self._prompt("subject_gap", input)
               #      print(prompt)
 
                     prompts.append(prompt)
@@ -185,7 +203,7 @@ class PromptProcessor():
         if gaps["_subject"]:
             for gap in gaps["_subject"]:
                 input = self.get_complement_gap_subject(gap)
-                prompt = [self._instruct.get_instruct_for_subject_gap(), {"role": "system", "content": input}]
+                prompt = self._prompt("subject_gap", input)
                # print(prompt)
 
                 prompts.append(prompt)
@@ -193,7 +211,7 @@ class PromptProcessor():
             if gaps["_complement"]:
                 for gap in gaps["_complement"]:
                     input = self.get_complement_gap_complement(gap)
-                    prompt = [self._instruct.get_instruct_for_subject_gap(), {"role": "system", "content": input}]
+                    prompt = self._prompt("subject_gap", input)
                 #    print(prompt)
 
                     prompts.append(prompt)
@@ -6,36 +6,161 @@
     Date created: Nov. 11th, 2021
 """
 
-from cltl.commons.casefolding import (casefold_capsule)
+import time
 
 from cltl.reply_generation.lenka_replier import LenkaReplier
 from cltl.reply_generation.phrasers.simplenlg_phraser import SimplenlgPhraser
 from cltl.reply_generation.thought_selectors.rl_selector import UCB
+from cltl.reply_generation.utils.capsule_utils import casefolded
 from cltl.reply_generation.utils.thought_utils import thoughts_from_brain
 
-from rdflib import ConjunctiveGraph
-from rdflib.extras.external_graph_libs import rdflib_to_networkx_multidigraph
-
 
 # from cltl.dialogue_evaluation.metrics.ontology_measures import get_avg_population
 # from cltl.dialogue_evaluation.metrics.graph_measures import get_avg_degree, get_sparseness, get_shortest_path
 
 
+class BrainStateTracker(object):
+    def __init__(self, brain, refresh_interval=60):
+        """ Keep track of the size of the brain without querying it on every turn. The counts are read from the
+        brain at most once per refresh interval, in between they are updated from the brain response of each turn.
+
+        params
+        object brain: the brain (triple store)
+        float refresh_interval: maximum age in seconds of the counts read from the brain
+
+        returns: None
+        """
+        self._brain = brain
+        self._refresh_interval = refresh_interval
+
+        self._counts = None
+        self._refreshed = None
+        self._refreshed_triples = None
+        self._turns_since_refresh = 0
+        self._triples_per_turn = 0.0
+        self._last_turn = None
+
+    def snapshot(self):
+        """Current (estimated) totals of the brain, refreshed from the brain if they are older than the
+        refresh interval.
+
+        returns: dict with 'Total triples', 'Total claims', 'Total perspectives', 'Total conflicts' and
+                 'Total sources'. In between refreshes 'Total triples' is an estimate, the brain response does
+                 not contain the number of triples added for a statement.
+        """
+        if self._counts is None or time.monotonic() - self._refreshed >= self._refresh_interval:
+            self.refresh()
+
+        return dict(self._counts)
+
+    def refresh(self):
+        """Read the totals from the brain."""
+        counts = {
+            'Total triples': self._brain.count_triples(),
+            'Total claims': self._brain.count_statements(),
+            'Total perspectives': self._brain.count_perspectives(),
+            'Total conflicts': len(self._brain.get_all_negation_conflicts()),
+            'Total sources': self._brain.count_friends(),
+        }
+
+        # Calibrate the number of triples added per turn
+        if self._counts is not None and self._turns_since_refresh:
+            added = counts['Total triples'] - self._refreshed_triples
+            self._triples_per_turn = max(added / self._turns_since_refresh, 0.0)
+        elif counts['Total perspectives']:
+            self._triples_per_turn = counts['Total triples'] / counts['Total perspectives']
+
+        self._counts = counts
+        self._refreshed_triples = counts['Total triples']
+        self._refreshed = time.monotonic()
+        self._turns_since_refresh = 0
+
+    def update(self, brain_response):
+        """Update the totals with the knowledge added in the turn of the brain response. Repeated updates
+        for the same turn are ignored.
+
+        params
+        dict brain_response: output of the brain for a statement
+
+        returns: None
+        """
+        if self._counts is None or 'statement' not in brain_response:
+            return
+
+        turn = brain_response['statement'].get('turn')
+        if turn is not None and turn == self._last_turn:
+            return
+        self._last_turn = turn
+        self._turns_since_refresh += 1
+
+        thoughts = brain_response.get('thoughts') or {}
+        self._counts['Total perspectives'] += 1
+        # Estimate, calibrated at every refresh
+        self._counts['Total triples'] += self._triples_per_turn
+        if not thoughts.get('_statement_novelty'):
+            self._counts['Total claims'] += 1
+        if self._is_new_conflict(brain_response['statement'], thoughts.get('_negation_conflicts')):
+            self._counts['Total conflicts'] += 1
+
+    @staticmethod
+    def _is_new_conflict(statement, conflicts):
+        # The conflict is new if the statement is the first one with its polarity
+        if not conflicts:
+            return False
+
+        polarity = (statement.get('perspective') or {}).get('_polarity')
+        polarities = [conflict['_polarity_value'] for conflict in conflicts]
+
+        return polarities.count(polarity) == 1 and len(set(polarities)) > 1
+
+
 class BrainEvaluator(object):
-    def __init__(self, brain):
+    def __init__(self, brain, refresh_interval=None, exact_triples=False):
         """ Create an object to evaluate the state of the brain according to different graph metrics.
         The graph can be evaluated by a single given metric, or a full set of pre established metrics
+
+        If a refresh_interval (in seconds) is given, the brain is queried or exported at most once per interval,
+        in between the counts are tracked incrementally from the brain responses passed to update(). The tracked
+        number of triples is an estimate that is corrected on every refresh, with exact_triples the metrics based on
+        the number of triples query it from the brain on every evaluation.
         """
         self._brain = brain
+        self._refresh_interval = refresh_interval
+        self._exact_triples = exact_triples
+        self._tracker = BrainStateTracker(brain, refresh_interval) if refresh_interval is not None else None
+
+        self._graph = None
+        self._graph_exported = None
+
+    @property
+    def incremental(self):
+        """Whether the brain state is tracked from the brain responses passed to update()."""
+        return self._tracker is not None
+
+    def update(self, brain_response):
+        if self._tracker:
+            self._tracker.update(brain_response)
 
     def brain_as_graph(self):
+        if self._refresh_interval is not None and self._graph is not None \
+                and time.monotonic() - self._graph_exported < self._refresh_interval:
+            return self._graph
+
+        from rdflib import ConjunctiveGraph
+
         # Take brain from previous episodes
         graph = ConjunctiveGraph()
         graph.parse(data=self._brain._connection.export_repository(), format='trig')
 
+        if self._refresh_interval is not None:
+            self._graph = graph
+            self._graph_exported = time.monotonic()
+
         return graph
 
     def brain_as_netx(self):
+        from rdflib.extras.external_graph_libs import rdflib_to_networkx_multidigraph
+
         # Take brain from previous episodes
         netx = rdflib_to_networkx_multidigraph(self.brain_as_graph())
 
@@ -51,7 +176,21 @@ class BrainEvaluator(object):
         # elif metric == 'Shortest path':
         #     brain_state = get_shortest_path(self.brain_as_netx())
 
-        if metric == 'Total triples':
+        if self._tracker:
+            totals = self._tracker.snapshot()
+            if self._exact_triples and metric in ('Total triples', 'Ratio claims to triples'):
+                totals['Total triples'] = self._brain.count_triples()
+
+            if metric in totals:
+                brain_state = totals[metric]
+            elif metric == 'Ratio claims to triples':
+                brain_state = totals['Total claims'] / totals['Total triples']
+            elif metric == 'Ratio perspectives to claims':
+                brain_state = totals['Total perspectives'] / totals['Total claims']
+            elif metric == 'Ratio conflicts to claims':
+                brain_state = totals['Total conflicts'] / totals['Total claims']
+
+        elif metric == 'Total triples':
             brain_state = self._brain.count_triples()
         # elif metric == 'Average population':
         #     brain_state = get_avg_population(self.brain_as_graph())
@@ -85,16 +224,22 @@ class BrainEvaluator(object):
             'overlaps predicate-object': len(thoughts['_overlaps']['_complement'])
             if thoughts['_overlaps']['_complement'] else 0,
             'trust': thoughts['_trust'],
-
-            'Total triples': self._brain.count_triples(),
-            # 'Total classes': len(self._brain.get_classes()),
-            # 'Total predicates': len(self._brain.get_predicates()),
-            'Total claims': self._brain.count_statements(),
-            'Total perspectives': self._brain.count_perspectives(),
-            'Total conflicts': len(self._brain.get_all_negation_conflicts()),
-            'Total sources': self._brain.count_friends(),
         }
 
+        if self._tracker:
+            self._tracker.update(brain_response)
+            stats.update(self._tracker.snapshot())
+        else:
+            stats.update({
+                'Total triples': self._brain.count_triples(),
+                # 'Total classes': len(self._brain.get_classes()),
+                # 'Total predicates': len(self._brain.get_predicates()),
+                'Total claims': self._brain.count_statements(),
+                'Total perspectives': self._brain.count_perspectives(),
+                'Total conflicts': len(self._brain.get_all_negation_conflicts()),
+                'Total sources': self._brain.count_friends(),
+            })
+
         # Compute composite stats
         stats['Ratio claims to triples'] = stats['Total claims'] / stats['Total triples']
         stats['Ratio perspectives to triples'] = stats['Total perspectives'] / stats['Total triples']
@@ -106,7 +251,8 @@ class BrainEvaluator(object):
 
 
 class RLReplier(LenkaReplier):
-    def __init__(self, brain, savefile=None, reward="Total triples"):
+    def __init__(self, brain, savefile=None, reward="Total triples", refresh_interval=None, compact_interval=None,
+                 max_thoughts_per_category=None, top_k_thoughts=None, exact_triples=False):
         """Creates a reinforcement learning-based replier to respond to questions
         and statements by the user. Statements are replied to by phrasing a
         thought; Selection of the thoughts are learnt by the UCB algorithm.
@@ -115,23 +261,42 @@ class RLReplier(LenkaReplier):
         object brain: the brain (triple store)
         str savefile: file with stored utility values in JSON format
         str reward: type of function to evaluate the brain state
+        float refresh_interval: if set, the brain state is tracked incrementally from
+                                the brain responses passed to reward_thought and only
+                                queried from the brain once per interval (in seconds)
+        bool exact_triples: with a refresh_interval, query the number of triples from
+                            the brain for every reward instead of using the tracked
+                            estimate
+        int compact_interval: if set, every reward is persisted to a write-ahead log
+                              next to the savefile, which is compacted into the savefile
+                              every compact_interval rewards
+        int max_thoughts_per_category: if set, at most this many thoughts per thought
+                              type are extracted from the brain response
+        int top_k_thoughts: if set, only the top_k thoughts with the highest UCB score
+                            are considered for selection
 
         returns: None
         """
         super(RLReplier, self).__init__()
         self._thought_selector = UCB()
         self._thought_selector.load(savefile)
+        if savefile and compact_interval:
+            self._thought_selector.persist(savefile, compact_interval=compact_interval)
         self._log.debug(f"UCB RL Selector ready")
 
         self._phraser = SimplenlgPhraser()
         self._log.debug(f"SimpleNLG phraser ready")
 
-        self._state_evaluator = BrainEvaluator(brain)
+        self._state_evaluator = BrainEvaluator(brain, refresh_interval=refresh_interval,
+                                               exact_triples=exact_triples)
         self._log.debug(f"Brain state evaluator ready")
 
         self._reward = reward
         self._log.info(f"Reward: {self._reward}")
 
+        self._max_thoughts_per_category = max_thoughts_per_category
+        self._top_k_thoughts = top_k_thoughts
+
         self._last_thought = None
         self._state_history = []
         self._reward_history = [0]
@@ -144,14 +309,30 @@ class RLReplier(LenkaReplier):
     def reward_history(self):
         return self._reward_history
 
-    def reward_thought(self):
+    def conversation_state(self):
+        # The last thought is rewarded on the next turn
+        return self._last_thought
+
+    def restore_conversation_state(self, state):
+        self._last_thought = state
+
+    def reward_thought(self, brain_response=None):
         """Rewards the last thought phrased by the replier by updating its
         utility estimate with the relative improvement of the brain as
         a result of the user response (i.e. a reward).
 
+        params
+        dict brain_response: brain response to the user response, required
+                             to update the tracked brain state if the
+                             replier has a refresh_interval
+
         returns: None
         """
         self._log.info(f"Calculate reward")
+        if brain_response:
+            self._state_evaluator.update(brain_response)
+        elif self._state_evaluator.incremental:
+            raise ValueError("The brain response is required to reward a thought with a tracked brain state")
         brain_state = self._state_evaluator.evaluate_brain_state(self._reward)
 
         self._state_history.append(brain_state)
@@ -190,22 +371,19 @@ class RLReplier(LenkaReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['statement'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'statement')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Extract thoughts from brain response
-        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options)
+        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options,
+                                       max_per_category=self._max_thoughts_per_category,
+                                       top_k=self._top_k_thoughts, utility=self._thought_selector.scores)
 
         # Select thought
         self._last_thought = self._thought_selector.select(thoughts.keys())
         thought_type, thought_info = thoughts[self._last_thought]
         self._log.info(f"Chosen thought type: {thought_type}")
 
-        # Preprocess thought_info and utterance (triples)
-        thought_info = {"thought": thought_info}
-        thought_info = casefold_capsule(thought_info, format="natural")
-        thought_info = thought_info["thought"]
-
         # Generate reply
         reply = self._phraser.phrase_correct_thought(utterance, thought_type, thought_info)
 
@@ -234,23 +412,19 @@ class RLReplier(LenkaReplier):
         self._log.debug(f'Thoughts options: {thought_options}')
 
         # Casefold
-        utterance = casefold_capsule(brain_response['mention'], format='natural')
-        thoughts = casefold_capsule(brain_response['thoughts'], format='natural')
+        utterance = casefolded(brain_response, 'mention')
+        thoughts = casefolded(brain_response, 'thoughts')
 
         # Extract thoughts from brain response
-        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options)
+        thoughts = thoughts_from_brain(utterance, thoughts, filter=thought_options,
+                                       max_per_category=self._max_thoughts_per_category,
+                                       top_k=self._top_k_thoughts, utility=self._thought_selector.scores)
 
         # Select thought
         self._last_thought = self._thought_selector.select(thoughts.keys())
         thought_type, thought_info = thoughts[self._last_thought]
         self._log.info(f"Chosen thought type: {thought_type}")
 
-        # Preprocess thought_info and utterance (triples)
-        utterance = casefold_capsule(brain_response["statement"], format="natural")
-        thought_info = {"thought": thought_info}
-        thought_info = casefold_capsule(thought_info, format="natural")
-        thought_info = thought_info["thought"]
-
         # Generate reply
         reply = self._phraser.phrase_correct_thought(utterance, thought_type, thought_info)
 
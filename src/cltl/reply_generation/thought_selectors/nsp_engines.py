@@ -0,0 +1,205 @@
+""" Filename:     nsp_engines.py
+    Description:  Inference engines for the BERT next sentence prediction (NSP)
+                  model: full precision PyTorch, PyTorch with dynamically
+                  quantized int8 weights, and ONNX Runtime with fp32 or int8
+                  weights. The quantized engines run on CPU only.
+"""
+
+import logging
+import os
+
+from cltl.reply_generation.utils.model_registry import ModelRegistry, acquire_pretrained_model
+
+logger = logging.getLogger(__name__)
+
+FP32 = "fp32"
+INT8 = "int8"
+ONNX = "onnx"
+ONNX_INT8 = "onnx-int8"
+
+ENGINES = (FP32, INT8, ONNX, ONNX_INT8)
+
+
+class TorchEngine(object):
+    """Runs the NSP model in PyTorch, on CUDA if available. The model is shared through the model registry."""
+
+    tensor_type = "pt"
+
+    def __init__(self, filename):
+        """Loads the pretrained NSP model.
+
+        params
+        str filename:  path to a pretrained NSP BERT nsp_model
+
+        returns: None
+        """
+        import torch
+        from transformers import BertForNextSentencePrediction
+
+        self._device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
+        self._handle = acquire_pretrained_model(BertForNextSentencePrediction, filename, device=self._device.type)
+        self._model = self._handle.model
+
+    def logits(self, inputs):
+        """Computes the NSP logits of a tokenized batch.
+
+        params
+        dict inputs:  output of the tokenizer with return_tensors=tensor_type
+
+        returns: numpy array of shape (batch, 2)
+        """
+        import torch
+
+        inputs = {name: tensor.to(self._device) for name, tensor in inputs.items()}
+        with torch.inference_mode():
+            outputs = self._model(**inputs)
+
+        return outputs.logits.cpu().numpy()
+
+    def release(self):
+        self._model = None
+        self._handle.release()
+
+
+class QuantizedTorchEngine(TorchEngine):
+    """Runs the NSP model in PyTorch on CPU with the weights of the linear layers quantized to int8, the
+    activations are quantized dynamically per batch."""
+
+    def __init__(self, filename):
+        import torch
+
+        torch.backends.quantized.engine = _quantized_engine(torch)
+        self._device = torch.device("cpu")
+        self._handle = ModelRegistry.instance().acquire(QuantizedTorchEngine.__name__, filename,
+                                                        lambda: _quantized_model(filename), dtype="qint8",
+                                                        device="cpu")
+        self._model = self._handle.model
+
+
+def _quantized_model(filename):
+    import torch
+    from transformers import BertForNextSentencePrediction
+
+    # Quantization copies the model, the full precision model is only kept if it is used elsewhere
+    with acquire_pretrained_model(BertForNextSentencePrediction, filename, device="cpu") as handle:
+        return torch.quantization.quantize_dynamic(handle.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _quantized_engine(torch):
+    engines = torch.backends.quantized.supported_engines
+
+    return "fbgemm" if "fbgemm" in engines else next(engine for engine in engines if engine != "none")
+
+
+class OnnxEngine(object):
+    """Runs the NSP model in ONNX Runtime on CPU. The model is exported to ONNX next to the pretrained model the
+    first time it is used, and optionally quantized to int8 weights."""
+
+    tensor_type = "np"
+
+    def __init__(self, filename, quantize=False, onnx_path=None, threads=None):
+        """Loads the ONNX model, exporting the pretrained model if the ONNX file does not exist.
+
+        params
+        str filename:    path to a pretrained NSP BERT nsp_model
+        bool quantize:   quantize the weights of the ONNX model to int8
+        str onnx_path:   path of the ONNX model, by default next to the pretrained model
+        int threads:     number of threads of ONNX Runtime per forward pass
+
+        returns: None
+        """
+        import onnxruntime
+
+        onnx_path = onnx_path if onnx_path else onnx_model_path(filename)
+        if not os.path.exists(onnx_path):
+            export_onnx(filename, onnx_path)
+        if quantize:
+            quantized_path = os.path.splitext(onnx_path)[0] + ".int8.onnx"
+            if not os.path.exists(quantized_path):
+                quantize_onnx(onnx_path, quantized_path)
+            onnx_path = quantized_path
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+
+        # Sessions are shared through the model registry per number of threads
+        self._handle = ModelRegistry.instance().acquire(
+            f"InferenceSession(threads={threads})", onnx_path,
+            lambda: onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"]),
+            dtype="int8" if quantize else "float32", device="cpu")
+        self._session = self._handle.model
+        self._input_names = {model_input.name for model_input in self._session.get_inputs()}
+
+    def logits(self, inputs):
+        inputs = {name: array.astype("int64") for name, array in inputs.items() if name in self._input_names}
+
+        return self._session.run(["logits"], inputs)[0]
+
+    def release(self):
+        self._session = None
+        self._handle.release()
+
+
+def onnx_model_path(filename):
+    """Default path of the ONNX export of a pretrained model."""
+    if os.path.isdir(filename):
+        return os.path.join(filename, "nsp_model.onnx")
+
+    return filename + ".onnx"
+
+
+def export_onnx(filename, onnx_path, opset=14):
+    """Exports the pretrained NSP model to ONNX with dynamic batch and sequence dimensions.
+
+    params
+    str filename:   path to a pretrained NSP BERT nsp_model
+    str onnx_path:  path of the exported ONNX model
+    int opset:      ONNX opset version
+
+    returns: None
+    """
+    import torch
+    from transformers import BertForNextSentencePrediction
+
+    logger.info("Exporting NSP model %s to %s", filename, onnx_path)
+
+    # Sample inputs to trace the model, the dimensions are dynamic
+    sample = torch.ones((2, 8), dtype=torch.long)
+    names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with acquire_pretrained_model(BertForNextSentencePrediction, filename, device="cpu") as handle, torch.no_grad():
+        torch.onnx.export(handle.model, (sample, sample, torch.zeros_like(sample)), onnx_path, input_names=names,
+                          output_names=["logits"], dynamic_axes=dynamic_axes, opset_version=opset)
+
+
+def quantize_onnx(onnx_path, quantized_path):
+    """Quantizes the weights of an ONNX model to int8, the activations are quantized dynamically per batch."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info("Quantizing ONNX model %s to %s", onnx_path, quantized_path)
+    quantize_dynamic(onnx_path, quantized_path, weight_type=QuantType.QInt8)
+
+
+def create_engine(engine, filename, **kwargs):
+    """Creates the inference engine for a pretrained NSP model.
+
+    params
+    str engine:     one of ENGINES
+    str filename:   path to a pretrained NSP BERT nsp_model
+    kwargs:         options of the OnnxEngine (onnx_path, threads)
+
+    returns: engine with a logits(inputs) method, the tensor_type of its inputs and a
+             release() method that releases the shared model
+    """
+    if engine == FP32:
+        return TorchEngine(filename)
+    if engine == INT8:
+        return QuantizedTorchEngine(filename)
+    if engine in (ONNX, ONNX_INT8):
+        return OnnxEngine(filename, quantize=engine == ONNX_INT8, **kwargs)
+
+    raise ValueError(f"Unsupported NSP engine {engine}, expected one of {ENGINES}")
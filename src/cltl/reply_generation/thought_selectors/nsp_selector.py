@@ -6,29 +6,42 @@
 """
 
 import numpy as np
-import torch
-from transformers import (BertForNextSentencePrediction,
-                          BertTokenizer)
 
 from cltl.reply_generation.api import ThoughtSelector
+from cltl.reply_generation.thought_selectors.nsp_engines import FP32, create_engine
+from cltl.reply_generation.utils.batching import BatchScheduler
+from cltl.reply_generation.utils.instrumentation import timed
+from cltl.reply_generation.utils.model_registry import acquire_tokenizer
 
 
 class NSP(ThoughtSelector):
-    def __init__(self, filename):
+    def __init__(self, filename, batch_size=32, max_wait=None, max_batch=None, engine=FP32, **engine_options):
         """Initializes an instance of BERT for Next Sentence Prediction (NSP).
 
         params
-        str filename: path to a pretrained NSP BERT nsp_model
+        str filename:    path to a pretrained NSP BERT nsp_model
+        int batch_size:  maximum number of (context, response) pairs scored in one forward pass
+        float max_wait:  if set, pairs scored concurrently by multiple threads (e.g. turns of different
+                         scenarios) within max_wait seconds are scored in shared forward passes
+        int max_batch:   maximum number of pairs in a shared forward pass, defaults to batch_size
+        str engine:      inference engine of the model, full precision PyTorch ('fp32'), PyTorch
+                         with int8 weights ('int8') or ONNX Runtime ('onnx', 'onnx-int8'),
+                         see nsp_engines
+        engine_options:  options of the ONNX Runtime engines (onnx_path, threads)
 
         returns: None
         """
-        self.__tokenizer = BertTokenizer.from_pretrained("bert-base-uncased")
-        self.__model = BertForNextSentencePrediction.from_pretrained(filename)
+        from transformers import BertTokenizer
 
-        self.__device = (
-            torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
-        )
-        self.__model.to(self.__device)
+        self.__tokenizer_handle = acquire_tokenizer(BertTokenizer, "bert-base-uncased")
+        self.__tokenizer = self.__tokenizer_handle.model
+        self.__engine = create_engine(engine, filename, **engine_options)
+        self.__batch_size = batch_size
+
+        self.__scheduler = None
+        if max_wait is not None:
+            self.__scheduler = BatchScheduler(self.__score_batch, max_wait=max_wait,
+                                              max_batch=max_batch if max_batch else batch_size, name="nsp")
 
     def score_response(self, context, response):
         """Predicts for a (context, response) pair their likelihood according to
@@ -36,21 +49,58 @@ class NSP(ThoughtSelector):
 
         returns: Softmax likelihood
         """
+        return self.score_responses(context, [response])[0]
+
+    def score_responses(self, context, responses, batch_size=None):
+        """Predicts for each response the likelihood that it follows the context
+        according to the nsp_model. The pairs are scored in batches of at most
+        batch_size pairs, each padded once.
+
+        params
+        str context:     context of the responses, e.g. the last utterance
+        list responses:  responses to score
+        int batch_size:  overrides the batch size of the selector
+
+        returns: list of softmax likelihoods, in the order of the responses
+        """
+        pairs = [[context, response] for response in responses]
+        if self.__scheduler and not batch_size:
+            return self.__scheduler.map(pairs)
+
+        batch_size = batch_size if batch_size else self.__batch_size
+
+        scores = []
+        for start in range(0, len(pairs), batch_size):
+            scores.extend(self.__score_batch(pairs[start:start + batch_size]))
+
+        return scores
+
+    def __score_batch(self, batch):
+        """Scores a batch of [context, response] pairs in one forward pass, padded once.
+
+        returns: list of softmax likelihoods, in the order of the pairs
+        """
         X_batch = self.__tokenizer.batch_encode_plus(
-            [[context, response]], padding=True, truncation=True, return_tensors="pt"
+            batch, padding=True, truncation=True, return_tensors=self.__engine.tensor_type
         )
 
-        X_batch["input_ids"] = X_batch["input_ids"].to(self.__device)
-        X_batch["token_type_ids"] = X_batch["token_type_ids"].to(self.__device)
-        X_batch["attention_mask"] = X_batch["attention_mask"].to(self.__device)
-
         # Forward pass
-        outputs = self.__model(**X_batch)
-        logits = outputs.logits.detach().cpu().numpy()[0]
+        logits = self.__engine.logits(dict(X_batch))
 
         # Prob(is_next) using softmax
-        return np.exp(logits[0]) / np.sum(np.exp(logits))
+        return list(np.exp(logits[:, 0]) / np.sum(np.exp(logits), axis=1))
+
+    def release(self):
+        """Stops the batch scheduler and releases the shared model and tokenizer.
+
+        returns: None
+        """
+        if self.__scheduler:
+            self.__scheduler.stop()
+        self.__engine.release()
+        self.__tokenizer_handle.release()
 
+    @timed("select")
     def select(self, scores):
         scores.sort(key=lambda x: x[2], reverse=True)
 
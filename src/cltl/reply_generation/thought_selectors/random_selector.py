@@ -1,6 +1,7 @@
 import random
 
 from cltl.reply_generation.api import ThoughtSelector
+from cltl.reply_generation.utils.instrumentation import timed
 
 
 class RandomSelector(ThoughtSelector):
@@ -8,6 +9,7 @@ class RandomSelector(ThoughtSelector):
         self._randomness = randomness
         self._priority = {type: idx for idx, type in enumerate(priority)}
 
+    @timed("select")
     def select(self, thoughts):
         if random.random() < self._randomness:
             return random.choice(list(thoughts))
@@ -8,10 +8,14 @@
 import json
 import os
 import random
+from collections import OrderedDict
 
-import matplotlib.pyplot as plt
 import numpy as np
 from cltl.reply_generation.api import ThoughtSelector
+from cltl.reply_generation.utils.instrumentation import timed
+
+# Number of actions for which the element indices are cached
+ACTION_CACHE_SIZE = 4096
 
 
 class UCB(ThoughtSelector):
@@ -29,19 +33,37 @@ class UCB(ThoughtSelector):
         float Q:          stores the estimate of the expected reward for each action
         float N:          stores the number of updates performed on each action
 
+        The action elements are interned to indices into the contiguous Q and N
+        arrays when they are updated, the element indices of recently scored
+        and updated actions are cached.
+
+        Utilities can be persisted after every update with persist(), which
+        appends the updates to a write-ahead log next to the snapshot file and
+        periodically compacts the log into the snapshot.
+
         returns: UCB object
         """
-        self._Q = dict()
-        self._N = dict()
+        self._ids = dict()
+        self._elements = []
+        self._Q = np.zeros(64, dtype=np.float64)
+        self._N = np.zeros(64, dtype=np.int64)
+        self._actions = OrderedDict()
 
         self._t = 1
         self._c = c
         self._decay = c / tmax
 
+        self._seq = 0
+        self._filename = None
+        self._log_file = None
+        self._compact_interval = None
+        self._updates_since_compaction = 0
+
     # Utils
 
     def load(self, filename):
-        """Reads utility values from file.
+        """Reads utility values from file and replays the updates in the
+        write-ahead log of the file, if any.
 
         params
         str filename: filename of file with utilities.
@@ -51,44 +73,180 @@ class UCB(ThoughtSelector):
         if filename is None:
             return
 
-        if not os.path.isfile(filename):  # File exists?
+        log_filename = self._log_filename(filename)
+        if not os.path.isfile(filename) and not os.path.isfile(log_filename):  # File exists?
             print("WARNING %s does not yet exist" % filename)
             return
 
-        with open(filename, "r") as file:
-            data = json.load(file)
-            self._c = data["metadata"]["c"]
-            self._t = data["metadata"]["t"]
-            self._decay = data["metadata"]["decay"]
+        if os.path.isfile(filename):
+            with open(filename, "r") as file:
+                data = json.load(file)
+                self._c = data["metadata"]["c"]
+                self._t = data["metadata"]["t"]
+                self._decay = data["metadata"]["decay"]
+                self._seq = data["metadata"].get("seq", 0)
 
-            for action, values in data["data"].items():
-                self._Q[action] = values["value"]
-                self._N[action] = values["count"]
+                for action, values in data["data"].items():
+                    idx = self._intern(action)
+                    self._Q[idx] = values["value"]
+                    self._N[idx] = values["count"]
+
+        if os.path.isfile(log_filename):
+            self._replay(log_filename)
 
     def save(self, filename):
-        """Writes the value and uncertainty tables to a JSON file.
+        """Writes the value and uncertainty tables to a JSON file. The file is
+        written to a temporary file first and then renamed, such that the file
+        is never left behind partially written.
 
         params
         str filename: filename of the ouput file.
 
         returns: None
         """
-        # Format metadata (c, t, decay) and value estimates as JSON.
+        # Format metadata (c, t, decay, seq) and value estimates as JSON.
         data = {
-            "metadata": {"c": self._c, "t": self._t, "decay": self._decay},
+            "metadata": {"c": self._c, "t": self._t, "decay": self._decay, "seq": self._seq},
             "data": dict(),
         }
 
-        for action in self._Q.keys():
-            if self._N[action] > 0:
+        for idx, action in enumerate(self._elements):
+            if self._N[idx] > 0:
                 data["data"][action] = {
-                    "value": self._Q[action],
-                    "count": self._N[action],
-                    "uncertainty": self._uncertainty(action),
+                    "value": float(self._Q[idx]),
+                    "count": int(self._N[idx]),
+                    "uncertainty": float(self._uncertainty(action)),
                 }
         # Write to file
-        with open(filename, "w") as file:
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "w") as file:
             json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_filename, filename)
+
+    def persist(self, filename, compact_interval=100):
+        """Persists every subsequent update of the utilities to a write-ahead
+        log next to filename. Every compact_interval updates the log is
+        compacted into a snapshot at filename. Utilities persisted this way
+        are restored with load(filename).
+
+        params
+        str filename:         filename of the snapshot, the log is stored
+                              at filename + ".log"
+        int compact_interval: number of updates after which the log is
+                              compacted, None to never compact
+
+        returns: None
+        """
+        self.close()
+
+        self._filename = filename
+        self._compact_interval = compact_interval
+        self._updates_since_compaction = 0
+        self._log_file = open(self._log_filename(filename), "a")
+
+    def compact(self):
+        """Writes a snapshot of the utilities and truncates the write-ahead
+        log. Updates in the log that are already contained in the snapshot are
+        skipped when replaying the log, hence a crash between writing the
+        snapshot and truncating the log loses no updates.
+
+        returns: None
+        """
+        if self._filename is None:
+            return
+
+        self.save(self._filename)
+        self._log_file.close()
+        self._log_file = open(self._log_filename(self._filename), "w")
+        self._updates_since_compaction = 0
+
+    def close(self):
+        """Compacts and closes the write-ahead log, if utilities are persisted.
+
+        returns: None
+        """
+        if self._log_file is not None:
+            self.compact()
+            self._log_file.close()
+            self._log_file = None
+            self._filename = None
+
+    @staticmethod
+    def _log_filename(filename):
+        return filename + ".log"
+
+    def _replay(self, log_filename):
+        """Replays the updates in a write-ahead log that are not yet contained
+        in the loaded snapshot.
+
+        params
+        str log_filename: filename of the write-ahead log
+
+        returns: None
+        """
+        with open(log_filename, "r") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Incomplete last entry of an interrupted write
+                    print("WARNING Skipping corrupt entry in %s" % log_filename)
+                    continue
+
+                if entry["seq"] > self._seq:
+                    self._update(entry["action"], entry["reward"])
+                    self._seq = entry["seq"]
+
+    def _intern(self, elem):
+        """Returns the index of an action element in the value tables, unseen
+        elements are added with Q = 0 and N = 0.
+
+        params
+        str elem: an element of an action
+
+        returns: index of the element
+        """
+        idx = self._ids.get(elem)
+        if idx is None:
+            idx = len(self._elements)
+            if idx == len(self._Q):
+                self._Q = np.concatenate((self._Q, np.zeros_like(self._Q)))
+                self._N = np.concatenate((self._N, np.zeros_like(self._N)))
+            self._ids[elem] = idx
+            self._elements.append(elem)
+
+        return idx
+
+    def _action_ids(self, action, intern=True):
+        """Returns the indices of the elements of an action.
+
+        params
+        str action:  an action
+        bool intern: add unseen elements to the value tables, otherwise
+                     their index is -1
+
+        returns: array of element indices
+        """
+        ids = self._actions.get(action)
+        if ids is not None:
+            self._actions.move_to_end(action)
+            return ids
+
+        if intern:
+            ids = np.fromiter((self._intern(elem) for elem in action.split()), dtype=np.intp)
+        else:
+            ids = np.fromiter((self._ids.get(elem, -1) for elem in action.split()), dtype=np.intp)
+            if np.any(ids < 0):
+                # Not cached, the elements get an index once they are updated
+                return ids
+
+        self._actions[action] = ids
+        if len(self._actions) > ACTION_CACHE_SIZE:
+            self._actions.popitem(last=False)
+
+        return ids
 
     # Learning
 
@@ -101,8 +259,56 @@ class UCB(ThoughtSelector):
 
         returns:    UCB score of the action
         """
-        return self._c * np.sqrt(np.log(self._t) / self._N[action])
+        return self._c * np.sqrt(np.log(self._t) / self._N[self._ids[action]])
+
+    def _element_scores(self, ids):
+        """Computes the UCB score of the elements with the given indices at
+        once. Elements that were never updated score infinity, such that all
+        actions are sampled at least once.
+
+        params
+        array ids: element indices, -1 for elements not in the value tables
+
+        returns: array of element scores, in the order of the indices
+        """
+        Q, N = self._Q[ids], self._N[ids]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = Q + self._c * np.sqrt(np.log(self._t) / N)
+
+        return np.where((N == 0) | (ids < 0), np.inf, scores)
+
+    def scores(self, actions):
+        """Computes the UCB score of each action as the mean UCB score of
+        its elements.
 
+        params
+        list actions: List of actions to score
+
+        returns: array of action scores, in the order of the actions
+        """
+        actions = list(actions)
+        action_ids = [self._action_ids(action, intern=False) for action in actions]
+        if not actions:
+            return np.empty(0, dtype=np.float64)
+
+        # Score only the elements of the candidates
+        element_ids = np.unique(np.concatenate(action_ids))
+        element_scores = self._element_scores(element_ids)
+
+        # Average per group of actions with the same number of elements
+        scores = np.empty(len(actions), dtype=np.float64)
+        positions = dict()
+        for position, ids in enumerate(action_ids):
+            positions.setdefault(len(ids), []).append(position)
+        for length, group in positions.items():
+            index_matrix = np.array([action_ids[position] for position in group], dtype=np.intp)
+            index_matrix = index_matrix.reshape(len(group), length)
+            positions_matrix = np.searchsorted(element_ids, index_matrix)
+            scores[group] = np.mean(element_scores[positions_matrix], axis=1) if length else np.nan
+
+        return scores
+
+    @timed("select")
     def select(self, actions):
         """Selects an action from the set of available actions that maximizes
         the average observed reward, taking into account uncertainty.
@@ -112,34 +318,16 @@ class UCB(ThoughtSelector):
 
         returns: action
         """
-        action_scores = []
-        for action in actions:
-
-            # Compute UCB score for each element of the action
-            score = []
-            for elem in action.split():
-
-                # Add unseen elements to table
-                if elem not in self._Q:
-                    self._Q[elem] = 0
-                    self._N[elem] = 0
-
-                # Score action
-                if self._N[elem] == 0:
-                    score += [np.inf]  # ensures all actions are sampled at least once
-                else:
-                    score += [self._Q[elem] + self._uncertainty(elem)]
-
-            # Convert element-scores into action score
-            action_scores.append((action, np.mean(score)))
+        actions = list(actions)
+        action_scores = self.scores(actions)
 
         # Greedy selection
-        selected_action, _ = max(action_scores, key=lambda x: x[1])
-        return selected_action
+        return actions[int(np.argmax(action_scores))]
 
     def update_utility(self, action, reward):
         """Updates the action-value table (Q) by incrementally updating the
         reward estimate of the action elements with the observed reward.
+        If utilities are persisted, the update is appended to the log.
 
         params
         str action:    selected action (with elements elem that are scored)
@@ -147,10 +335,23 @@ class UCB(ThoughtSelector):
 
         returns: None
         """
+        self._update(action, reward)
+        self._seq += 1
+
+        if self._log_file is not None:
+            self._log_file.write(json.dumps({"seq": self._seq, "action": action, "reward": float(reward)}) + "\n")
+            self._log_file.flush()
+            os.fsync(self._log_file.fileno())
+
+            self._updates_since_compaction += 1
+            if self._compact_interval and self._updates_since_compaction >= self._compact_interval:
+                self.compact()
+
+    def _update(self, action, reward):
         # Update value estimates
-        for elem in action.split():
-            self._N[elem] += 1
-            self._Q[elem] = self._Q[elem] + (reward - self._Q[elem]) / self._N[elem]
+        for idx in self._action_ids(action):
+            self._N[idx] += 1
+            self._Q[idx] = self._Q[idx] + (reward - self._Q[idx]) / self._N[idx]
 
         # Update exploration constant
         self._t += 1
@@ -167,17 +368,19 @@ class UCB(ThoughtSelector):
 
         returns: None
         """
-        total_rewards = sum(self._N.values())  # empty value table?
+        import matplotlib.pyplot as plt
+
+        total_rewards = self._N.sum()  # empty value table?
         if total_rewards == 0:
             print("WARNING Cannot plot empty value table")
             return
 
         # Estimate value/uncertainty of actions
         a, q, u = [], [], []
-        for action in sorted(list(self._Q.keys())):
-            if self._N[action] > 0:
+        for action in sorted(self._elements):
+            if self._N[self._ids[action]] > 0:
                 a += [action]
-                q += [self._Q[action]]
+                q += [self._Q[self._ids[action]]]
                 u += [self._uncertainty(action)]
 
         # Reduce number of bars if > max_bars
@@ -0,0 +1,187 @@
+"""
+Coalescing of concurrent inference calls into batches.
+
+Repliers of concurrent turns (e.g. several scenarios served by one service) each call the model for their own inputs,
+while the models are most efficient on batches. A BatchScheduler collects the inputs submitted from multiple threads,
+and runs them through the model in one call as soon as the batch is full or the oldest input waited max_wait seconds:
+
+    scheduler = BatchScheduler(lambda inputs: model(inputs), max_wait=0.005, max_batch=32)
+    outputs = scheduler.map(inputs)
+
+If the batch function fails on a batch, the inputs of the batch are retried one by one, so that an invalid input
+only fails the call that submitted it.
+
+The fill rate of the batches (inputs per batch relative to max_batch) is recorded in the instrumentation as the
+counters batch_inputs and batch_capacity.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List
+
+from cltl.reply_generation.utils.instrumentation import count, timer
+
+logger = logging.getLogger(__name__)
+
+
+class BatchScheduler(object):
+    """Runs the inputs submitted within max_wait seconds, up to max_batch inputs, in one call of the batch function."""
+
+    def __init__(self, function: Callable[[List[Any]], List[Any]], max_wait: float = 0.005, max_batch: int = 32,
+                 name: str = None):
+        """
+        Parameters
+        ----------
+        function: Callable[[List[Any]], List[Any]]
+            Computes the outputs of a batch of inputs, in the order of the inputs
+        max_wait: float
+            Maximum time in seconds an input waits for other inputs to join its batch
+        max_batch: int
+            Maximum number of inputs per batch
+        name: str
+            Name of the scheduler in the instrumentation and logs
+        """
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be positive, was {max_batch}")
+
+        self._function = function
+        self._max_wait = max_wait
+        self._max_batch = max_batch
+        self._name = name if name else getattr(function, "__name__", "batch")
+
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._batches = 0
+        self._inputs = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"{self._name}-batch-scheduler", daemon=True)
+        self._thread.start()
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    @property
+    def max_batch(self) -> int:
+        return self._max_batch
+
+    @property
+    def fill_rate(self) -> float:
+        """Mean number of inputs per batch relative to max_batch, None if no batch ran yet."""
+        with self._condition:
+            return self._inputs / (self._batches * self._max_batch) if self._batches else None
+
+    def submit(self, input: Any) -> Future:
+        """Schedule the input for the next batch.
+
+        Returns
+        -------
+        Future
+            The output of the batch function for the input
+        """
+        return self.submit_all([input])[0]
+
+    def submit_all(self, inputs: Iterable[Any]) -> List[Future]:
+        futures = []
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError(f"Batch scheduler {self._name} is stopped")
+            for input in inputs:
+                future = Future()
+                self._pending.append((time.monotonic(), input, future))
+                futures.append(future)
+            self._condition.notify()
+
+        return futures
+
+    def map(self, inputs: Iterable[Any]) -> List[Any]:
+        """Compute the outputs of the inputs, batched with the inputs of concurrent callers. Blocks until all outputs
+        are available.
+        """
+        return [future.result() for future in self.submit_all(inputs)]
+
+    def stop(self):
+        """Stop the scheduler after the pending inputs are processed."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._process(batch)
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._pending:
+                if self._stopped:
+                    return None
+                self._condition.wait()
+
+            # Wait for the batch to fill up until the oldest input waited max_wait
+            deadline = self._pending[0][0] + self._max_wait
+            while len(self._pending) < self._max_batch and not self._stopped:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            size = min(len(self._pending), self._max_batch)
+            batch = [self._pending.popleft() for _ in range(size)]
+            self._batches += 1
+            self._inputs += size
+
+            return batch
+
+    def _process(self, batch):
+        # Skip inputs of cancelled calls
+        batch = [(input, future) for _, input, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        inputs, futures = zip(*batch)
+        count("batch_inputs", len(inputs), scheduler=self._name)
+        count("batch_capacity", self._max_batch, scheduler=self._name)
+        try:
+            outputs = self._call(list(inputs))
+        except Exception as e:
+            if len(batch) == 1:
+                logger.exception("Failed to process input in %s", self._name)
+                futures[0].set_exception(e)
+                return
+
+            # Retry the inputs one by one, only the callers of the failing inputs get the exception
+            logger.warning("Failed to process batch of %s inputs in %s, retry one by one: %s", len(inputs), self._name,
+                           e)
+            for input, future in batch:
+                self._process_single(input, future)
+            return
+
+        for future, output in zip(futures, outputs):
+            future.set_result(output)
+
+    def _process_single(self, input, future):
+        try:
+            output, = self._call([input])
+        except Exception as e:
+            logger.exception("Failed to process input in %s", self._name)
+            future.set_exception(e)
+            return
+
+        future.set_result(output)
+
+    def _call(self, inputs):
+        with timer("batch", scheduler=self._name):
+            outputs = self._function(inputs)
+        if len(outputs) != len(inputs):
+            raise ValueError(f"Batch function of {self._name} returned {len(outputs)} outputs "
+                             f"for {len(inputs)} inputs")
+
+        return outputs
@@ -0,0 +1,54 @@
+"""
+Latency budget for a single turn. The reply service opens a budget per event, repliers read the remaining time
+to bound blocking calls to language model backends.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+_DEADLINE = contextvars.ContextVar("reply_generation_deadline", default=None)
+
+
+@contextmanager
+def time_budget(seconds):
+    """Run the enclosed block with a deadline of `seconds` from now. Nested budgets can only shorten the deadline.
+
+    params
+    float seconds: available time in seconds, None for no budget
+
+    returns: None
+    """
+    if seconds is None:
+        yield
+        return
+
+    deadline = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    token = _DEADLINE.set(deadline if current is None else min(deadline, current))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_budget(default=None):
+    """Time left in the current budget in seconds.
+
+    params
+    float default: value returned if there is no budget
+
+    returns: remaining time in seconds, never negative
+    """
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return default
+
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def budget_exceeded():
+    """Whether the current budget ran out, always False if there is no budget."""
+    deadline = _DEADLINE.get()
+
+    return deadline is not None and time.monotonic() >= deadline
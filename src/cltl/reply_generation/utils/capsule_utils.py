@@ -0,0 +1,101 @@
+"""
+Casefolded views of brain responses, computed once per brain response and shared by all repliers.
+"""
+
+import copy
+import threading
+
+from cltl.commons.casefolding import casefold_text
+
+from cltl.reply_generation.utils.instrumentation import timer
+
+
+class FrozenCapsule(dict):
+    """Read-only capsule. Copies of a FrozenCapsule are plain, mutable dicts."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Casefolded capsules are read-only, copy them to make changes")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return FrozenCapsule, (dict(self),)
+
+
+def casefold_view(capsule, format='natural'):
+    """Casefold a capsule without modifying it.
+
+    The result is equal to casefold_capsule(copy.deepcopy(capsule), format), but nested dicts are FrozenCapsules and
+    lists are shared with the original capsule instead of being copied (casefold_capsule does not descend into lists).
+
+    Parameters
+    ----------
+    capsule: dict
+        Capsule to casefold
+    format: str
+        'triple' or 'natural'
+
+    Returns
+    -------
+    FrozenCapsule
+        Read-only casefolded capsule
+    """
+    return FrozenCapsule({key: casefold_view(value, format=format) if isinstance(value, dict)
+                          else casefold_text(value, format=format)
+                          for key, value in capsule.items()})
+
+
+class BrainResponse(dict):
+    """Brain response that caches the casefolded views of its capsules.
+
+    The service wraps each brain response of an event, such that the casefolding runs once per event instead of once
+    per replier.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(BrainResponse, self).__init__(*args, **kwargs)
+        self._views = dict()
+        self._lock = threading.Lock()
+
+    def casefolded(self, key, format='natural'):
+        with self._lock:
+            if (key, format) not in self._views:
+                with timer("casefold"):
+                    self._views[(key, format)] = casefold_view(self[key], format=format)
+
+            return self._views[(key, format)]
+
+    def __reduce__(self):
+        return BrainResponse, (dict(self),)
+
+
+def casefolded(brain_response, key, format='natural'):
+    """Casefolded view of the capsule at `key` of a brain response, cached if the brain response is a BrainResponse.
+
+    Parameters
+    ----------
+    brain_response: dict
+        Brain response
+    key: str
+        Capsule in the brain response, e.g. 'statement', 'mention', 'question' or 'thoughts'
+    format: str
+        'triple' or 'natural'
+
+    Returns
+    -------
+    FrozenCapsule
+        Read-only casefolded capsule
+    """
+    if isinstance(brain_response, BrainResponse):
+        return brain_response.casefolded(key, format=format)
+
+    with timer("casefold"):
+        return casefold_view(brain_response[key], format=format)
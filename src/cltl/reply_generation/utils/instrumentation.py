@@ -0,0 +1,277 @@
+"""
+Timers and counters for the stages of reply generation.
+
+Instrumentation is disabled by default, timers and counters then only check a flag and do nothing else. Enable it
+once per process, and export the collected metrics in the Prometheus text format or pass sinks that receive every
+observation:
+
+    metrics = enable()
+    ...
+    print(metrics.to_prometheus())
+
+Timers record the latency of a stage (casefold, thoughts, select, phrase, paraphrase, ...) in a histogram with the
+stage and the labels of the timer. The labels in PROPAGATED_LABELS also apply to the timers and counters nested in
+the timer, e.g. the replier label of the reply timer of the service is added to the stages of that replier. Other
+labels, e.g. the phase of the warm-up timer, only apply to the timer itself. Worker processes of the service have
+their own metrics.
+"""
+
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from typing import Callable, Mapping, Optional
+
+_LABELS = contextvars.ContextVar("reply_generation_labels", default=())
+
+# Histogram buckets in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STAGE_METRIC = "stage_seconds"
+
+# Labels of a timer that also apply to the timers and counters nested in it
+PROPAGATED_LABELS = frozenset({"replier", "utterance_type"})
+
+
+class Metrics(object):
+    """Latency histograms and counters, keyed by name and labels."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, sinks=()):
+        """
+        Parameters
+        ----------
+        buckets: Tuple[float]
+            Upper bounds of the histogram buckets in seconds
+        sinks: Iterable[Callable[[str, str, float, Mapping[str, str]], None]]
+            Called with the kind ('timer' or 'counter'), name, value and labels of every observation
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._sinks = list(sinks)
+        self._lock = threading.Lock()
+        self._histograms = dict()
+        self._counters = dict()
+
+    def add_sink(self, sink: Callable[[str, str, float, Mapping[str, str]], None]):
+        self._sinks.append(sink)
+
+    def observe(self, name: str, seconds: float, labels: tuple = ()):
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # Counts per bucket, followed by the count of observations above all buckets
+                histogram = self._histograms[key] = [[0] * (len(self._buckets) + 1), 0.0]
+            histogram[0][bisect.bisect_left(self._buckets, seconds)] += 1
+            histogram[1] += seconds
+
+        for sink in self._sinks:
+            sink("timer", name, seconds, dict(labels))
+
+    def increment(self, name: str, value: float = 1, labels: tuple = ()):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+        for sink in self._sinks:
+            sink("counter", name, value, dict(labels))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def summary(self) -> dict:
+        """Count, total and mean duration per timer and value per counter, keyed by name and labels.
+
+        Returns
+        -------
+        dict
+            {'timers': {(name, labels): {'count', 'sum', 'mean'}}, 'counters': {(name, labels): value}}
+        """
+        with self._lock:
+            timers = {key: {"count": sum(counts), "sum": total, "mean": total / sum(counts)}
+                      for key, (counts, total) in self._histograms.items()}
+
+            return {"timers": timers, "counters": dict(self._counters)}
+
+    def to_prometheus(self, prefix: str = "cltl_reply_generation") -> str:
+        """Metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix: str
+            Prefix of the metric names
+
+        Returns
+        -------
+        str
+            Timers as histograms <prefix>_<name>, counters as <prefix>_<name>_total
+        """
+        with self._lock:
+            histograms = sorted((key, (list(counts), total)) for key, (counts, total) in self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines = []
+        typed = set()
+        for (name, labels), (counts, total) in histograms:
+            metric = prefix + "_" + name
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            cumulative = 0
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{metric}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {total!r}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {cumulative}")
+
+        for (name, labels), value in counters:
+            metric = prefix + "_" + name + "_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_format_labels(labels)} {value!r}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + "}"
+
+
+_metrics = None
+
+
+def enable(metrics: Metrics = None) -> Metrics:
+    """Enable the instrumentation in this process.
+
+    Parameters
+    ----------
+    metrics: Metrics
+        Registry to record to, by default a new one
+
+    Returns
+    -------
+    Metrics
+        The registry the timers and counters record to
+    """
+    global _metrics
+    _metrics = metrics if metrics is not None else Metrics()
+
+    return _metrics
+
+
+def disable():
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[Metrics]:
+    """The registry of the enabled instrumentation, None if it is disabled."""
+    return _metrics
+
+
+class _NoOpTimer(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_OP_TIMER = _NoOpTimer()
+
+
+class _Timer(object):
+    def __init__(self, metrics, stage, labels):
+        self._metrics = metrics
+        self._stage = stage
+        self._labels = labels or {}
+
+    def __enter__(self):
+        labels = _LABELS.get()
+        # The stage is set last, such that it cannot be overridden by the labels
+        self._observed_labels = _merge(_merge(labels, self._labels), {"stage": self._stage})
+        self._token = _LABELS.set(_merge(labels, {name: value for name, value in self._labels.items()
+                                                  if name in PROPAGATED_LABELS}))
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self._start
+        _LABELS.reset(self._token)
+        self._metrics.observe(STAGE_METRIC, duration, self._observed_labels)
+
+        return False
+
+
+def _merge(labels, additional):
+    """Labels updated with the additional labels, sorted by name such that the same labels give the same key."""
+    if not additional:
+        return labels
+
+    merged = dict(labels)
+    merged.update((name, str(value)) for name, value in additional.items() if value is not None)
+
+    return tuple(sorted(merged.items()))
+
+
+def timer(stage: str, **labels):
+    """Context manager that records the duration of the enclosed block for `stage`.
+
+    The labels are added to the observation, the labels in PROPAGATED_LABELS also to all timers and counters nested
+    in the block. Without enabled instrumentation the timer does nothing.
+
+    Parameters
+    ----------
+    stage: str
+        Name of the stage
+    labels: str
+        Additional labels, e.g. replier or thought_type
+    """
+    if _metrics is None:
+        return _NO_OP_TIMER
+
+    return _Timer(_metrics, stage, labels)
+
+
+def count(name: str, value: float = 1, **labels):
+    """Increment the counter `name` with the labels of the enclosing timers and the given labels.
+
+    Parameters
+    ----------
+    name: str
+        Name of the counter
+    value: float
+        Increment
+    labels: str
+        Additional labels
+    """
+    if _metrics is None:
+        return
+
+    _metrics.increment(name, value, _merge(_LABELS.get(), labels))
+
+
+def timed(stage: str):
+    """Decorator that records the duration of each call of the function for `stage`, see timer()."""
+    def decorator(function):
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            if _metrics is None:
+                return function(*args, **kwargs)
+
+            with _Timer(_metrics, stage, None):
+                return function(*args, **kwargs)
+
+        return timed_function
+
+    return decorator
@@ -0,0 +1,209 @@
+"""
+Process wide registry of loaded transformer models and tokenizers.
+
+Each model is loaded once per (kind, model id, dtype, device) and shared by all components that acquire it, e.g.
+multiple repliers with an NSP selector, or a replier that is restarted in a test. Shared models are put in evaluation
+mode without gradients and must be treated as read-only. A model is unloaded when the last handle to it is released,
+either explicitly or when the handle is garbage collected:
+
+    with acquire_pretrained_model(BertForNextSentencePrediction, "bert-base-uncased", device="cpu") as handle:
+        logits = handle.model(**inputs).logits
+
+Models are only shared within a process, every worker process of the reply service loads its own copy of the
+weights.
+"""
+
+import gc
+import logging
+import sys
+import threading
+import weakref
+from typing import Any, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ModelHandle(object):
+    """Shared, read-only reference to a model of the registry. Release it when the model is not used anymore."""
+
+    def __init__(self, registry, key, model):
+        self._key = key
+        self._model = model
+        self._finalizer = weakref.finalize(self, registry._release, key)
+
+    @property
+    def model(self) -> Any:
+        if not self._finalizer.alive:
+            raise ValueError(f"Model {self._key} was released")
+
+        return self._model
+
+    @property
+    def key(self) -> Tuple:
+        return self._key
+
+    def release(self):
+        """Release the model, it is unloaded if no other handle uses it. Releasing a handle again has no effect."""
+        self._model = None
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+        return False
+
+
+class _Entry(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.model = None
+        self.users = 0
+
+
+class ModelRegistry(object):
+    """Loaded models with the number of handles that use them."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+
+            return cls._instance
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = dict()
+
+    def acquire(self, kind: str, model_id: str, load: Callable[[], Any], dtype: str = None,
+                device: str = None) -> ModelHandle:
+        """Get a handle to the model, load it if it is not loaded yet.
+
+        Concurrent calls for the same model load it once, other models can be loaded in parallel.
+
+        Parameters
+        ----------
+        kind: str
+            Kind of the model, e.g. the class it is loaded with
+        model_id: str
+            Name or path of the pretrained model
+        load: Callable[[], Any]
+            Loads the model
+        dtype: str
+            Data type of the weights
+        device: str
+            Device of the model
+
+        Returns
+        -------
+        ModelHandle
+            Handle to the shared model
+        """
+        key = (kind, model_id, dtype, str(device) if device is not None else None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            entry.users += 1
+
+        try:
+            with entry.lock:
+                if entry.model is None:
+                    logger.info("Loading model %s", key)
+                    entry.model = load()
+        except BaseException:
+            self._release(key)
+            raise
+
+        return ModelHandle(self, key, entry.model)
+
+    def _release(self, key):
+        with self._lock:
+            entry = self._entries[key]
+            entry.users -= 1
+            if entry.users > 0:
+                return
+            del self._entries[key]
+
+        logger.info("Unloading model %s", key)
+        entry.model = None
+        _free_memory()
+
+    def loaded(self) -> List[Tuple]:
+        """Keys of the loaded models."""
+        with self._lock:
+            return [key for key, entry in self._entries.items() if entry.model is not None]
+
+    def users(self, key: Tuple) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            return entry.users if entry else 0
+
+
+def _free_memory():
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def acquire_pretrained_model(model_class, model_id: str, dtype: str = None, device: str = None,
+                             safetensors: bool = True) -> ModelHandle:
+    """Get a handle to a pretrained transformers model from the registry.
+
+    Parameters
+    ----------
+    model_class:
+        transformers class to load the model with, e.g. AutoModelForSeq2SeqLM
+    model_id: str
+        Name or path of the pretrained model
+    dtype: str
+        torch data type of the weights, e.g. 'float16', by default the data type of the checkpoint
+    device: str
+        Device to load the model on, by default the CPU
+    safetensors: bool
+        Load the checkpoint in the safetensors format if it is available, which does not unpickle the weights
+
+    Returns
+    -------
+    ModelHandle
+        Handle to the shared model, in evaluation mode without gradients
+    """
+    return ModelRegistry.instance().acquire(model_class.__name__, model_id,
+                                            lambda: _load_pretrained(model_class, model_id, dtype, device, safetensors),
+                                            dtype=dtype, device=device)
+
+
+def acquire_tokenizer(tokenizer_class, model_id: str) -> ModelHandle:
+    """Get a handle to a pretrained transformers tokenizer from the registry."""
+    return ModelRegistry.instance().acquire(tokenizer_class.__name__, model_id,
+                                            lambda: tokenizer_class.from_pretrained(model_id))
+
+
+def _load_pretrained(model_class, model_id, dtype, device, safetensors):
+    import torch
+
+    options = {"torch_dtype": getattr(torch, dtype)} if dtype else {}
+
+    model = None
+    if safetensors:
+        try:
+            model = model_class.from_pretrained(model_id, use_safetensors=True, **options)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("No safetensors checkpoint for %s, loading the default checkpoint: %s", model_id, e)
+    if model is None:
+        model = model_class.from_pretrained(model_id, **options)
+
+    if device is not None:
+        model.to(device)
+    model.eval()
+    model.requires_grad_(False)
+
+    return model
@@ -0,0 +1,133 @@
+"""
+Cache for LLM paraphrases of template replies, keyed by the content of the request.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ParaphraseCache(object):
+    def __init__(self, max_size=1024, ttl=None, filename=None):
+        """In-memory LRU cache with an optional time-to-live and an optional SQLite file, such that entries
+        survive restarts. The file keeps the max_size most recently added entries, expired and older entries are
+        deleted when an entry is added.
+
+        params
+        int max_size:   maximum number of entries kept in memory and in the file
+        float ttl:      time in seconds after which entries expire, None to keep them forever
+        str filename:   SQLite database to persist the entries, None to only keep them in memory
+
+        returns: None
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+        self._db = None
+        if filename:
+            self._db = sqlite3.connect(filename, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS paraphrases "
+                             "(key TEXT PRIMARY KEY, paraphrase TEXT NOT NULL, created REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS paraphrases_created ON paraphrases (created)")
+            self._purge()
+            self._db.commit()
+
+    @staticmethod
+    def key(model, instruction, temperature, text):
+        """Content address of a paraphrase request."""
+        content = json.dumps([model, instruction, temperature, text], ensure_ascii=False)
+
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._store(key, entry)
+
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry[0]
+
+    def put(self, key, paraphrase):
+        entry = (paraphrase, time.time())
+        with self._lock:
+            self._store(key, entry)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO paraphrases VALUES (?, ?, ?)", (key,) + entry)
+                self._purge()
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM paraphrases")
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _load(self, key):
+        row = self._db.execute("SELECT paraphrase, created FROM paraphrases WHERE key = ?", (key,)).fetchone()
+
+        return tuple(row) if row else None
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM paraphrases WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _purge(self):
+        """Delete the expired entries and all but the max_size most recent entries from the file."""
+        if self._ttl is not None:
+            self._db.execute("DELETE FROM paraphrases WHERE created < ?", (time.time() - self._ttl,))
+        self._db.execute("DELETE FROM paraphrases WHERE key IN "
+                         "(SELECT key FROM paraphrases ORDER BY created DESC LIMIT -1 OFFSET ?)", (self._max_size,))
+
+    def _expired(self, entry):
+        return self._ttl is not None and time.time() - entry[1] > self._ttl
@@ -1,3 +1,27 @@
+from functools import lru_cache
+
+from cltl.commons.triple_helpers import filtered_types_names
+
+
+@lru_cache(maxsize=1024)
+def _filtered_types_names(types):
+    return filtered_types_names(types)
+
+
+def type_names(types):
+    """filtered_types_names memoized per tuple of types.
+
+    params
+    list types: entity types, may be None
+
+    returns: the types that are worth mentioning, joined with 'or'
+    """
+    if types is None:
+        return ''
+
+    return _filtered_types_names(tuple(types))
+
+
 def replace_pronouns(speaker, author=None, entity_label=None, role=None):
     if entity_label is None and author is None:
         return speaker
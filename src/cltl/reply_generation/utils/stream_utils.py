@@ -0,0 +1,53 @@
+"""
+Splitting of streamed text into sentence or clause sized parts.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+_SENTENCE_END = re.compile(r'[.!?]+(?=\s)')
+_CLAUSE_END = re.compile(r'[,;:]+(?=\s)')
+
+
+def _last_boundary(text, clauses, min_clause_length):
+    ends = [match.end() for match in _SENTENCE_END.finditer(text)]
+    if clauses:
+        ends += [match.end() for match in _CLAUSE_END.finditer(text) if match.end() >= min_clause_length]
+
+    return max(ends, default=None)
+
+
+def text_parts(tokens: Iterable[str], clauses: bool = True, min_clause_length: int = 20) -> Iterator[str]:
+    """Join streamed tokens and yield the text in parts as soon as a sentence or clause is complete.
+
+    The concatenation of the parts is equal to the concatenation of the tokens. Closing the generator closes the
+    token stream.
+
+    Parameters
+    ----------
+    tokens: Iterable[str]
+        Streamed text, e.g. the chunks of an LLM completion
+    clauses: bool
+        Split at clause boundaries (',', ';', ':') in addition to sentence boundaries
+    min_clause_length: int
+        Minimum length of a part that ends at a clause boundary
+
+    Returns
+    -------
+    Iterator[str]
+        Parts of the text
+    """
+    buffer = ""
+    try:
+        for token in tokens:
+            buffer += token
+            end = _last_boundary(buffer, clauses, min_clause_length)
+            if end:
+                yield buffer[:end]
+                buffer = buffer[end:]
+
+        if buffer:
+            yield buffer
+    finally:
+        if hasattr(tokens, "close"):
+            tokens.close()
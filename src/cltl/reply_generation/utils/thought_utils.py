@@ -7,7 +7,9 @@
 """
 
 import random
-from itertools import combinations
+from itertools import combinations, islice
+
+from cltl.reply_generation.utils.instrumentation import timed
 
 
 def clean_overlaps(overlaps):
@@ -22,177 +24,212 @@ def clean_overlaps(overlaps):
     return overlapss
 
 
-def thoughts_from_brain(utt, cap, filter=None):
-    """Takes a brain response capsule and extracts thoughts from it in the form of
-    a dictionary, e.g. {'object_gap person book':('_object_gap', thought_dict), ...}.
-    The information in the keys is used by the RLReplier to make a decision.
+def _trust_thoughts(utt, cap):
+    # Trust is always available
+    yield "_trust", ("trust", cap["_trust"])
+
+
+def _statement_novelty_thoughts(utt, cap):
+    # Any statement novelties? (can always be called!)
+    if cap["_statement_novelty"]:  # == previous claims!
+        yield "no_statement_novelty", ("_statement_novelty", cap["_statement_novelty"])
+    else:
+        yield "statement_novelty", ("_statement_novelty", cap["_statement_novelty"])
+
+
+def _overlap_thoughts(utt, cap):
+    # Any single overlap?, e.g. 'overlap animal'
+    if cap["_overlaps"]["_subject"]:
+        for overlap in cap["_overlaps"]["_subject"]:
+            overlap_name = "overlap -subj %s" % overlap["_entity"]["_types"][-1]
+            yield overlap_name, ("_overlaps", {"_subject": [overlap], "_complement": []})
+
+    if cap["_overlaps"]["_complement"]:
+        for overlap in cap["_overlaps"]["_complement"]:
+            overlap_name = "overlap -compl %s" % overlap["_entity"]["_types"][-1]
+            yield overlap_name, ("_overlaps", {"_subject": [], "_complement": [overlap]})
+
+    # Any pairs of overlaps?, e.g. 'overlap animal person'
+    if cap["_overlaps"]["_subject"]:
+        for overlaps in combinations(cap["_overlaps"]["_subject"], r=2):
+            entities = sorted(
+                [overlaps[0]["_entity"]["_types"][-1], overlaps[1]["_entity"]["_types"][-1]]
+            )
+            overlap_name = "overlap -subj %s %s" % (entities[0], entities[1])
+            yield overlap_name, ("_overlaps", {"_subject": overlaps, "_complement": []})
 
-    params
-    dict capsule: dict containing the input utterance, triples, perspectives
-                  and contextual information (e.g. location, speaker)
-    object typer: Typing object that maps a token to a type (a hypernym).
+    if cap["_overlaps"]["_complement"]:
+        for overlaps in combinations(cap["_overlaps"]["_complement"], r=2):
+            entities = sorted(
+                [overlaps[0]["_entity"]["_types"][-1], overlaps[1]["_entity"]["_types"][-1]]
+            )
+            overlap_name = "overlap -compl %s %s" % (entities[0], entities[1])
+            yield overlap_name, ("_overlaps", {"_subject": [], "_complement": overlaps})
 
-    returns:      dict mapping from thought names to (thought_type, thought_info)
-    """
 
-    # Trust is always available
-    thoughts = dict()
-    if "_trust" in filter:
-        thoughts["_trust"] = ("trust", cap["_trust"])
-
-    if "_statement_novelty" in filter:
-        # Any statement novelties? (can always be called!)
-        if cap["_statement_novelty"]:  # == previous claims!
-            thoughts["no_statement_novelty"] = (
-                "_statement_novelty",
-                cap["_statement_novelty"],
+def _entity_novelty_thoughts(utt, cap):
+    # Any entity novelties?
+    if cap["_entity_novelty"]["_subject"] == "True":
+        novelty_name = (
+                "entity_novelty -subj %s" % utt["triple"]["_subject"]["_types"][0]
+        )
+        novelty_info = {"_subject": True, "_complement": False}
+        yield novelty_name, ("_entity_novelty", novelty_info)
+
+    if cap["_entity_novelty"]["_complement"] == "True":
+        novelty_name = (
+                "entity_novelty -compl %s" % utt["triple"]["_complement"]["_types"][0]
+        )
+        novelty_info = {"_subject": False, "_complement": True}
+        yield novelty_name, ("_entity_novelty", novelty_info)
+
+
+def _subject_gap_thoughts(utt, cap):
+    # Any subject gaps?, e.g. 'subject_gap person animal'
+    if cap["_subject_gaps"]["_subject"]:
+        for gap in cap["_subject_gaps"]["_subject"]:
+            gap_name = "subject_gap -subj %s %s" % (
+                utt["triple"]["_subject"]["_types"][0],
+                gap["_entity"]["_types"][-1],
             )
-        else:
-            thoughts["statement_novelty"] = (
-                "_statement_novelty",
-                cap["_statement_novelty"],
+            yield gap_name, ("_subject_gaps", {"_subject": [gap], "_complement": []})
+
+    if cap["_subject_gaps"]["_complement"]:
+        for gap in cap["_subject_gaps"]["_complement"]:
+            gap_name = "subject_gap -compl %s %s" % (
+                utt["triple"]["_subject"]["_types"][0],
+                gap["_entity"]["_types"][-1],
             )
+            yield gap_name, ("_subject_gaps", {"_subject": [], "_complement": [gap]})
 
-    if "_overlaps" in filter:
-        # Any single overlap?, e.g. 'overlap animal'
-        if cap["_overlaps"]["_subject"]:
-            for overlap in cap["_overlaps"]["_subject"]:
-                overlap_name = "overlap -subj %s" % overlap["_entity"]["_types"][-1]
-                thoughts[overlap_name] = (
-                    "_overlaps",
-                    {"_subject": [overlap], "_complement": []},
-                )
-
-        if cap["_overlaps"]["_complement"]:
-            for overlap in cap["_overlaps"]["_complement"]:
-                overlap_name = "overlap -compl %s" % overlap["_entity"]["_types"][-1]
-                thoughts[overlap_name] = (
-                    "_overlaps",
-                    {"_subject": [], "_complement": [overlap]},
-                )
-
-        # Any pairs of overlaps?, e.g. 'overlap animal person'
-        if cap["_overlaps"]["_subject"]:
-            for overlaps in combinations(cap["_overlaps"]["_subject"], r=2):
-                entities = sorted(
-                    [overlaps[0]["_entity"]["_types"][-1], overlaps[1]["_entity"]["_types"][-1]]
-                )
-                overlap_name = "overlap -subj %s %s" % (entities[0], entities[1])
-                thoughts[overlap_name] = (
-                    "_overlaps",
-                    {"_subject": overlaps, "_complement": []},
-                )
-
-        if cap["_overlaps"]["_complement"]:
-            for overlaps in combinations(cap["_overlaps"]["_complement"], r=2):
-                entities = sorted(
-                    [overlaps[0]["_entity"]["_types"][-1], overlaps[1]["_entity"]["_types"][-1]]
-                )
-                overlap_name = "overlap -compl %s %s" % (entities[0], entities[1])
-                thoughts[overlap_name] = (
-                    "_overlaps",
-                    {"_subject": [], "_complement": overlaps},
-                )
-
-    if "_entity_novelty" in filter:
-        # Any entity novelties?
-        if cap["_entity_novelty"]["_subject"] == "True":
-            novelty_name = (
-                    "entity_novelty -subj %s" % utt["triple"]["_subject"]["_types"][0]
+
+def _complement_gap_thoughts(utt, cap):
+    # any object gaps?, e.g. 'object_gap person animal'
+    if cap["_complement_gaps"]["_subject"]:
+        for gap in cap["_complement_gaps"]["_subject"]:
+            gap_name = "object_gap -subj %s %s" % (
+                utt["triple"]["_complement"]["_types"][0],
+                gap["_entity"]["_types"][-1],
             )
-            novelty_info = {"_subject": True, "_complement": False}
-            thoughts[novelty_name] = ("_entity_novelty", novelty_info)
+            yield gap_name, ("_complement_gaps", {"_subject": [gap], "_complement": []})
 
-        if cap["_entity_novelty"]["_complement"] == "True":
-            novelty_name = (
-                    "entity_novelty -compl %s" % utt["triple"]["_complement"]["_types"][0]
+    if cap["_complement_gaps"]["_complement"]:
+        for gap in cap["_complement_gaps"]["_complement"]:
+            gap_name = "object_gap -compl %s %s" % (
+                utt["triple"]["_complement"]["_types"][0],
+                gap["_entity"]["_types"][-1],
             )
-            novelty_info = {"_subject": False, "_complement": True}
-            thoughts[novelty_name] = ("_entity_novelty", novelty_info)
-
-        # Alternative, if there are no novel entities
-        novelty_info = {"_subject": False, "_complement": False}
-        thoughts["entity_novelty -none"] = ("_entity_novelty", novelty_info)
-
-    if "_subject_gaps" in filter:
-        # Any subject gaps?, e.g. 'subject_gap person animal'
-        if cap["_subject_gaps"]["_subject"]:
-            for gap in cap["_subject_gaps"]["_subject"]:
-                gap_name = "subject_gap -subj %s %s" % (
-                    utt["triple"]["_subject"]["_types"][0],
-                    gap["_entity"]["_types"][-1],
-                )
-                thoughts[gap_name] = ("_subject_gaps", {"_subject": [gap], "_complement": []})
-
-        if cap["_subject_gaps"]["_complement"]:
-            for gap in cap["_subject_gaps"]["_complement"]:
-                gap_name = "subject_gap -compl %s %s" % (
-                    utt["triple"]["_subject"]["_types"][0],
-                    gap["_entity"]["_types"][-1],
-                )
-                thoughts[gap_name] = ("_subject_gaps", {"_subject": [], "_complement": [gap]})
-
-        # Alternative, if there is no subject gap
-        thoughts["subject_gap -none"] = (
-            "_subject_gaps",
-            {"_subject": [], "_complement": []},
-        )
+            yield gap_name, ("_complement_gaps", {"_subject": [], "_complement": [gap]})
+
+
+def _complement_conflict_thoughts(utt, cap):
+    # Any complement conflicts (cardinality conflict)?
+    if cap["_complement_conflict"]:
+        yield "complement_conflict", ("_complement_conflict", cap["_complement_conflict"][:1])
+
+
+def _negation_conflict_thoughts(utt, cap):
+    # A negation conflict?
+    if cap["_negation_conflicts"]:
+        positives = [
+            item
+            for item in cap["_negation_conflicts"]
+            if item["_polarity_value"] == "POSITIVE"
+        ]
+        negatives = [
+            item
+            for item in cap["_negation_conflicts"]
+            if item["_polarity_value"] == "NEGATIVE"
+        ]
+
+        if positives and negatives:
+            conflict_info = [random.choice(positives), random.choice(negatives)]
+            yield "negation_conflict", ("_negation_conflicts", conflict_info)
+
+
+# Thought categories in order of extraction, with the generator of their thoughts and
+# the alternative thought that is available if there is nothing else to say
+THOUGHT_CATEGORIES = [
+    ("_trust", _trust_thoughts, None),
+    ("_statement_novelty", _statement_novelty_thoughts, None),
+    ("_overlaps", _overlap_thoughts, None),
+    ("_entity_novelty", _entity_novelty_thoughts,
+     ("entity_novelty -none", "_entity_novelty", {"_subject": False, "_complement": False})),
+    ("_subject_gaps", _subject_gap_thoughts,
+     ("subject_gap -none", "_subject_gaps", {"_subject": [], "_complement": []})),
+    ("_complement_gaps", _complement_gap_thoughts,
+     ("object_gap -none", "_complement_gaps", {"_subject": [], "_complement": []})),
+    ("_complement_conflict", _complement_conflict_thoughts, None),
+    ("_negation_conflicts", _negation_conflict_thoughts, None),
+]
+
+
+def _capped(thoughts, max_thoughts):
+    """Passes on the first max_thoughts thoughts. Thoughts with the same name
+    count separately, such that generators with many duplicate names are not
+    consumed beyond the cap either."""
+    if max_thoughts is None:
+        yield from thoughts
+        return
+
+    yield from islice(thoughts, max_thoughts)
+
+
+def iter_thoughts_from_brain(utt, cap, filter=None, max_per_category=None):
+    """Lazily extracts thoughts from a brain response capsule, in the same order
+    and with the same names as thoughts_from_brain, but without scrambling.
+    Thoughts are only generated as far as they are consumed, e.g. pairs of
+    overlaps are not enumerated beyond the cap.
 
-    if "_complement_gaps" in filter:
-        # any object gaps?, e.g. 'object_gap person animal'
-        if cap["_complement_gaps"]["_subject"]:
-            for gap in cap["_complement_gaps"]["_subject"]:
-                gap_name = "object_gap -subj %s %s" % (
-                    utt["triple"]["_complement"]["_types"][0],
-                    gap["_entity"]["_types"][-1],
-                )
-                thoughts[gap_name] = (
-                    "_complement_gaps",
-                    {"_subject": [gap], "_complement": []},
-                )
-
-        if cap["_complement_gaps"]["_complement"]:
-            for gap in cap["_complement_gaps"]["_complement"]:
-                gap_name = "object_gap -compl %s %s" % (
-                    utt["triple"]["_complement"]["_types"][0],
-                    gap["_entity"]["_types"][-1],
-                )
-                thoughts[gap_name] = (
-                    "_complement_gaps",
-                    {"_subject": [], "_complement": [gap]},
-                )
-
-        # Alternative, if there is no object gap
-        thoughts["object_gap -none"] = (
-            "_complement_gaps",
-            {"_subject": [], "_complement": []},
-        )
+    params
+    dict utt:             casefolded utterance of the brain response
+    dict cap:             casefolded thoughts of the brain response
+    list filter:          thought types to extract
+    int max_per_category: maximum number of thoughts per thought type,
+                          including thoughts with the same name, the
+                          alternative thoughts (e.g. 'subject_gap -none')
+                          are always included
+
+    returns:              generator of (thought name, (thought_type, thought_info))
+    """
+    for category, thoughts, alternative in THOUGHT_CATEGORIES:
+        if category not in filter:
+            continue
+
+        yield from _capped(thoughts(utt, cap), max_per_category)
+
+        # Alternative, if there is nothing else
+        if alternative:
+            name, thought_type, thought_info = alternative
+            yield name, (thought_type, dict(thought_info))
 
-    if "_complement_conflict" in filter:
-        # Any complement conflicts (cardinality conflict)?
-        if cap["_complement_conflict"]:
-            thoughts["complement_conflict"] = (
-                "_complement_conflict",
-                cap["_complement_conflict"][:1],
-            )
 
-    if "_negation_conflicts" in filter:
-        # A negation conflict?
-        if cap["_negation_conflicts"]:
-            positives = [
-                item
-                for item in cap["_negation_conflicts"]
-                if item["_polarity_value"] == "POSITIVE"
-            ]
-            negatives = [
-                item
-                for item in cap["_negation_conflicts"]
-                if item["_polarity_value"] == "NEGATIVE"
-            ]
-
-            if positives and negatives:
-                conflict_info = [random.choice(positives), random.choice(negatives)]
-                thoughts["negation_conflict"] = ("_negation_conflicts", conflict_info)
+@timed("thoughts")
+def thoughts_from_brain(utt, cap, filter=None, max_per_category=None, top_k=None, utility=None):
+    """Takes a brain response capsule and extracts thoughts from it in the form of
+    a dictionary, e.g. {'object_gap person book':('_object_gap', thought_dict), ...}.
+    The information in the keys is used by the RLReplier to make a decision.
+
+    params
+    dict capsule: dict containing the input utterance, triples, perspectives
+                  and contextual information (e.g. location, speaker)
+    object typer: Typing object that maps a token to a type (a hypernym).
+    int max_per_category: maximum number of thoughts per thought type
+    int top_k:    if given with a utility, keep only the top_k thoughts with
+                  the highest utility
+    callable utility: maps a list of thought names to their utilities,
+                  e.g. UCB.scores
+
+    returns:      dict mapping from thought names to (thought_type, thought_info)
+    """
+    thoughts = dict(iter_thoughts_from_brain(utt, cap, filter=filter, max_per_category=max_per_category))
+
+    # Pre-filter on prior utility
+    if top_k and utility and len(thoughts) > top_k:
+        names = list(thoughts.keys())
+        utilities = utility(names)
+        best = sorted(sorted(range(len(names)), key=lambda i: utilities[i], reverse=True)[:top_k])
+        thoughts = {names[i]: thoughts[names[i]] for i in best}
 
     # Scramble to break ordering!
     thoughts = list(thoughts.items())
@@ -0,0 +1,195 @@
+"""
+Pool of worker processes that compute replies, such that CPU bound repliers (SimpleNLG realisation, thought extraction,
+NSP and GODEL inference) are not limited by the GIL of the service.
+
+Each worker creates its own repliers once at startup with a replier factory, a picklable callable without arguments
+that returns the list of repliers, e.g. a module level function. Pools are shared by all services with the same
+factory and number of processes, such that services for multiple concurrent scenarios on one host are served by the
+same workers. Brain responses are sent to the workers as compact JSON, reduced to the capsules the repliers need.
+
+Repliers that learn from the conversation (e.g. the RLReplier) keep their state per worker process.
+"""
+
+import json
+import logging
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List
+
+from cltl.commons.discrete import UtteranceType
+
+from cltl.reply_generation.api import BasicReplier
+from cltl.reply_generation.utils.budget import time_budget
+from cltl.reply_generation.utils.capsule_utils import BrainResponse
+from cltl.reply_generation.utils.instrumentation import count, timer
+
+logger = logging.getLogger(__name__)
+
+# Capsules of a brain response used by the repliers, per utterance type
+CAPSULE_KEYS = {
+    UtteranceType.STATEMENT: ('statement', 'thoughts'),
+    UtteranceType.QUESTION: ('question', 'response'),
+    UtteranceType.TEXT_MENTION: ('mention', 'thoughts'),
+}
+
+
+def get_reply(utterance_type: UtteranceType, replier: BasicReplier, response: dict, thought_options: List[str]):
+    with timer("reply", replier=replier.__class__.__name__, utterance_type=utterance_type.name):
+        reply = _get_reply(utterance_type, replier, response, thought_options)
+        count("replies", replied=bool(reply))
+
+    return reply
+
+
+def _get_reply(utterance_type, replier, response, thought_options):
+    if utterance_type == UtteranceType.STATEMENT:
+        return replier.reply_to_statement(response, persist=True, thought_options=thought_options)
+    if utterance_type == UtteranceType.QUESTION:
+        return replier.reply_to_question(response)
+    if utterance_type == UtteranceType.TEXT_MENTION:
+        return replier.reply_to_mention(response, persist=True)
+
+    return None
+
+
+def compact_capsule(utterance_type: UtteranceType, response: dict) -> str:
+    keys = CAPSULE_KEYS.get(utterance_type, tuple(response.keys()))
+
+    return json.dumps({key: response[key] for key in keys if key in response}, separators=(',', ':'))
+
+
+# Repliers of the worker process, created by the initializer of the pool
+_repliers = None
+
+
+def _initialize_worker(replier_factory):
+    global _repliers
+    _repliers = list(replier_factory())
+    logger.info("Initialized worker with repliers %s", [replier.__class__.__name__ for replier in _repliers])
+
+
+def _replier_count():
+    return len(_repliers)
+
+
+def _reply(replier_index, utterance_type, capsule, thought_options, budget):
+    with time_budget(budget):
+        return get_reply(utterance_type, _repliers[replier_index], BrainResponse(json.loads(capsule)),
+                         thought_options)
+
+
+def _warm_up(replier_index, utterance_type, capsule, thought_options):
+    replier = _repliers[replier_index]
+    with replier.preserved_state():
+        return get_reply(utterance_type, replier, BrainResponse(json.loads(capsule)), thought_options)
+
+
+def _llamalize(replier_index, text, budget):
+    with time_budget(budget):
+        return _repliers[replier_index].llamalize_reply(text)
+
+
+class ReplierPool(object):
+    """Worker processes with their own instances of the repliers."""
+
+    _shared = dict()
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, replier_factory: Callable[[], List[BasicReplier]], processes: int):
+        """Get the pool for the replier factory, create it if it does not exist yet.
+
+        Parameters
+        ----------
+        replier_factory: Callable[[], List[BasicReplier]]
+            Picklable callable that creates the repliers in the worker processes
+        processes: int
+            Number of worker processes
+
+        Returns
+        -------
+        ReplierPool
+            Pool shared with all other services with the same factory and number of processes, release it with
+            release() when it is not used anymore.
+        """
+        key = (replier_factory, processes)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(replier_factory, processes)
+            pool = cls._shared[key]
+            pool._users += 1
+
+            return pool
+
+    def __init__(self, replier_factory: Callable[[], List[BasicReplier]], processes: int):
+        self._key = (replier_factory, processes)
+        self._users = 0
+        self._replier_count = None
+        self._futures = weakref.WeakSet()
+        # Spawn the workers, forking the service would copy its threads and locks
+        self._executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=_initialize_worker, initargs=(replier_factory,))
+
+    def release(self):
+        with self._shared_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            if self._shared.get(self._key) is self:
+                del self._shared[self._key]
+
+        # Cancel pending replies, shutdown(cancel_futures=True) requires Python 3.9
+        for future in list(self._futures):
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    @property
+    def replier_count(self) -> int:
+        """Number of repliers in the workers, blocks until the first worker is initialized."""
+        if self._replier_count is None:
+            self._replier_count = self._executor.submit(_replier_count).result()
+
+        return self._replier_count
+
+    def reply(self, utterance_type: UtteranceType, replier_index: int, response: dict, thought_options: List[str],
+              budget: float = None) -> Future:
+        """Compute the reply of a replier in a worker process.
+
+        Parameters
+        ----------
+        utterance_type: UtteranceType
+            Type of the utterance the brain response belongs to
+        replier_index: int
+            Index of the replier in the list created by the replier factory
+        response: dict
+            JSON brain response
+        thought_options: List[str]
+            Thought types to consider for statements
+        budget: float
+            Time budget of the reply in seconds
+
+        Returns
+        -------
+        Future
+            The reply
+        """
+        return self._submit(_reply, replier_index, utterance_type, compact_capsule(utterance_type, response),
+                            thought_options, budget)
+
+    def warm_up(self, utterance_type: UtteranceType, replier_index: int, response: dict,
+                thought_options: List[str]) -> Future:
+        """Compute a reply in a worker process without changing the conversation state of the replier, see
+        reply() for the parameters."""
+        return self._submit(_warm_up, replier_index, utterance_type, compact_capsule(utterance_type, response),
+                            thought_options)
+
+    def llamalize(self, replier_index: int, text: str, budget: float = None) -> Future:
+        return self._submit(_llamalize, replier_index, text, budget)
+
+    def _submit(self, fn, *args):
+        future = self._executor.submit(fn, *args)
+        self._futures.add(future)
+
+        return future
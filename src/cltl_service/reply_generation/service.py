@@ -1,28 +1,42 @@
+import contextvars
+import copy
 import logging
 import random
-from typing import List, Iterable, Tuple
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
+from typing import TYPE_CHECKING, Callable, List, Iterable, Tuple
 
-from cltl.brain.utils.helper_functions import brain_response_to_json
-from cltl.combot.event.emissor import TextSignalEvent
 from cltl.combot.infra.config import ConfigurationManager
 from cltl.combot.infra.event import Event, EventBus
 from cltl.combot.infra.resource import ResourceManager
 from cltl.combot.infra.time_util import timestamp_now
 from cltl.combot.infra.topic_worker import TopicWorker
 from cltl.commons.discrete import UtteranceType
-from cltl_service.emissordata.client import EmissorDataClient
-from emissor.representation.scenario import TextSignal
+from cltl_service.reply_generation.process_pool import ReplierPool, get_reply
+from cltl_service.reply_generation.warmup import load_warmup_capsules
 
-from cltl.reply_generation.api import BasicReplier
+from cltl.reply_generation.api import BasicReplier, Phraser
+from cltl.reply_generation.phrasers.pattern_phraser import PatternPhraser
+from cltl.reply_generation.utils.capsule_utils import BrainResponse, casefolded
+from cltl.reply_generation.utils.budget import budget_exceeded, time_budget, remaining_budget
+from cltl.reply_generation.utils import instrumentation
+from cltl.reply_generation.utils.instrumentation import count, timed, timer
+
+if TYPE_CHECKING:
+    # Imported for type checking only, emissor loads rdflib
+    from cltl_service.emissordata.client import EmissorDataClient
 
 logger = logging.getLogger(__name__)
 
 
 class ReplyGenerationService:
     @classmethod
-    def from_config(cls, repliers: List[BasicReplier], emissor_data: EmissorDataClient, event_bus: EventBus,
+    def from_config(cls, repliers: List[BasicReplier], emissor_data: "EmissorDataClient", event_bus: EventBus,
                     resource_manager: ResourceManager,
-                    config_manager: ConfigurationManager):
+                    config_manager: ConfigurationManager,
+                    replier_factory: Callable[[], List[BasicReplier]] = None):
         config = config_manager.get_config("cltl.reply_generation")
         thought_options = config.get("thought_options", multi=True) \
             if "thought_options" in config \
@@ -31,17 +45,81 @@ class ReplyGenerationService:
         utterance_types = [UtteranceType[t.upper()] for t in config.get("utterance_types", multi=True)] \
             if "utterance_types" in config \
             else [UtteranceType.QUESTION, UtteranceType.STATEMENT, UtteranceType.TEXT_MENTION]
+        max_workers = config.get_int("max_workers") if "max_workers" in config else None
+        reply_timeout = config.get_float("reply_timeout") if "reply_timeout" in config else None
+        processes = config.get_int("processes") if "processes" in config else None
+        stream_replies = config.get_boolean("stream_replies") if "stream_replies" in config else False
+        metrics = config.get_boolean("metrics") if "metrics" in config else False
+        warmup_per_type = config.get_int("warmup_per_type") if "warmup_per_type" in config else 2
+        warmup_capsules = load_warmup_capsules(config.get("warmup_data", multi=True), warmup_per_type) \
+            if "warmup_data" in config else None
+        warmup_rounds = config.get_int("warmup_rounds") if "warmup_rounds" in config else 2
 
         return cls(config.get("topic_input"), config.get("topic_output"),
                    config.get("intentions", multi=True), config.get("topic_intention"),
-                   repliers, utterance_types, thought_options, emissor_data, event_bus, resource_manager)
+                   repliers, utterance_types, thought_options, emissor_data, event_bus, resource_manager,
+                   max_workers=max_workers, reply_timeout=reply_timeout,
+                   processes=processes, replier_factory=replier_factory, stream_replies=stream_replies,
+                   metrics=metrics, warmup_capsules=warmup_capsules, warmup_rounds=warmup_rounds)
 
     def __init__(self, input_topic: str, output_topic: str, intentions: Iterable[str], intention_topic: str,
                  repliers: List[BasicReplier], utterance_types: List[UtteranceType], thought_options: List[str],
-                 emissor_data: EmissorDataClient, event_bus: EventBus, resource_manager: ResourceManager):
+                 emissor_data: "EmissorDataClient", event_bus: EventBus, resource_manager: ResourceManager,
+                 max_workers: int = None, reply_timeout: float = None,
+                 processes: int = None, replier_factory: Callable[[], List[BasicReplier]] = None,
+                 stream_replies: bool = False, metrics: bool = False, warmup_capsules: List[dict] = None,
+                 warmup_rounds: int = 2):
+        """
+        Parameters
+        ----------
+        max_workers: int
+            If larger than one, candidate replies are computed concurrently on a thread pool of this size,
+            otherwise the candidates are tried one after another.
+        reply_timeout: float
+            Time budget in seconds per event. The budget is passed down to the repliers, if it runs out
+            a cheap pattern based reply is published instead. Replies that exceed the budget are not
+            interrupted, they finish in the background without delaying the following events.
+        processes: int
+            If set, replies are computed on a pool of this many worker processes, candidate replies are computed
+            concurrently. The pool is shared with other services using the same replier_factory.
+        replier_factory: Callable[[], List[BasicReplier]]
+            Picklable callable that creates the repliers in each worker process, required if processes is set.
+            The repliers passed to the service are not used in that case and can be empty.
+        stream_replies: bool
+            Publish the reply in sentence or clause sized parts as soon as they are generated, each as a
+            TextSignalEvent, followed by a SignalStopped event without text that refers to the signal of the
+            last part. Candidate replies are tried one after another.
+        metrics: bool
+            Enable the instrumentation of the reply generation stages in this process, see
+            cltl.reply_generation.utils.instrumentation. The metrics are available from the metrics property.
+        warmup_capsules: List[dict]
+            JSON brain responses that are replied to by every replier when the service is started, before it
+            processes events, see cltl_service.reply_generation.warmup. The repliers are warmed up concurrently,
+            the warm-up replies do not change the conversation state of the repliers.
+        warmup_rounds: int
+            Number of passes over the warm-up capsules. The latency per reply is recorded in the instrumentation
+            as stage 'warmup' with phase 'cold' for the first pass and 'warm' for the following passes.
+        """
+        if processes and not replier_factory:
+            raise ValueError("A replier_factory is required to compute replies in worker processes")
+        if processes and stream_replies:
+            raise ValueError("Streaming replies is not supported for replies computed in worker processes")
+
         self._repliers = repliers
         self._utterance_types = utterance_types
         self._thought_options = thought_options
+        self._max_workers = max_workers
+        self._reply_timeout = reply_timeout
+        self._executor = None
+        self._futures = weakref.WeakSet()
+        self._processes = processes
+        self._replier_factory = replier_factory
+        self._pool = None
+        self._stream_replies = stream_replies
+        self._fallback_phraser = PatternPhraser()
+        self._metrics = (instrumentation.get_metrics() or instrumentation.enable()) if metrics else None
+        self._warmup_capsules = warmup_capsules
+        self._warmup_rounds = warmup_rounds
 
         self._emissor_data = emissor_data
         self._event_bus = event_bus
@@ -57,7 +135,22 @@ class ReplyGenerationService:
     def app(self):
         return None
 
+    @property
+    def metrics(self) -> instrumentation.Metrics:
+        """Metrics of the reply generation stages if enabled, export them e.g. with metrics.to_prometheus()."""
+        return self._metrics
+
     def start(self, timeout=30):
+        if self._processes:
+            self._pool = ReplierPool.acquire(self._replier_factory, self._processes)
+            logger.info("Started reply generation with %s repliers in %s worker processes",
+                        self._pool.replier_count, self._processes)
+        elif self._concurrent:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix=self.__class__.__name__)
+
+        self._warm_up()
+
         self._topic_worker = TopicWorker([self._input_topic], self._event_bus, provides=[self._output_topic],
                                          resource_manager=self._resource_manager, processor=self._process,
                                          intentions=self._intentions, intention_topic=self._intention_topic,
@@ -72,42 +165,324 @@ class ReplyGenerationService:
         self._topic_worker.await_stop()
         self._topic_worker = None
 
+        if self._executor:
+            # Cancel pending candidates, shutdown(cancel_futures=True) requires Python 3.9
+            for future in list(self._futures):
+                future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._pool:
+            self._pool.release()
+            self._pool = None
+
+    def _warm_up(self):
+        """Reply to the warm-up capsules with every replier, the repliers are warmed up concurrently."""
+        if not self._warmup_capsules or not self._warmup_rounds:
+            return
+
+        capsules = [(self._get_utterance_type(capsule), capsule) for capsule in self._warmup_capsules]
+        capsules = [(utterance_type, capsule) for utterance_type, capsule in capsules
+                    if utterance_type in self._utterance_types]
+
+        # In the worker processes the repliers are referred to by their index
+        repliers = range(self._pool.replier_count) if self._pool else self._repliers
+        if not capsules or not repliers:
+            return
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(repliers), thread_name_prefix="ReplierWarmUp") as executor:
+            list(executor.map(lambda replier: self._warm_up_replier(replier, capsules), repliers))
+        logger.info("Warmed up %s repliers with %s capsules in %.2fs",
+                    len(repliers), len(capsules), time.perf_counter() - start)
+
+    def _warm_up_replier(self, replier, capsules):
+        name = f"worker replier {replier}" if self._pool else replier.__class__.__name__
+        durations = []
+        for index in range(self._warmup_rounds):
+            phase = "cold" if index == 0 else "warm"
+            start = time.perf_counter()
+            for utterance_type, capsule in capsules:
+                with timer("warmup", phase=phase, replier=name, utterance_type=utterance_type.name):
+                    try:
+                        self._warm_up_reply(utterance_type, replier, capsule)
+                    except Exception:
+                        logger.warning("Failed to warm up %s with %s", name, capsule, exc_info=True)
+            durations.append(time.perf_counter() - start)
+
+        logger.info("Warmed up %s: cold %.3fs, warm %.3fs per reply", name, durations[0] / len(capsules),
+                    sum(durations[1:]) / (len(capsules) * (len(durations) - 1)) if len(durations) > 1 else 0.0)
+
+    def _warm_up_reply(self, utterance_type, replier, capsule):
+        if self._pool:
+            # Once per worker process, the tasks are not guaranteed to be distributed evenly over the workers
+            futures = [self._pool.warm_up(utterance_type, replier, capsule, self._thought_options)
+                       for _ in range(self._processes)]
+            wait(futures)
+            for future in futures:
+                future.result()
+        else:
+            # Repliers modify and cache on the brain response
+            with replier.preserved_state():
+                self._get_reply(utterance_type, replier, BrainResponse(copy.deepcopy(capsule)))
+
+    @property
+    def _concurrent(self):
+        return self._max_workers is not None and self._max_workers > 1
+
     def _process(self, event: Event[List[dict]]):
-        response = None
-        for brain_response in event.payload:
-            if 'text_response' in brain_response:
-                for replier in self._repliers:
-                    #print('brain_response:', brain_response)
-                    text = brain_response['text_response']
-                    response = replier.llamalize_reply(text)
-                    break
-        if not response:
-            brain_responses = [brain_response_to_json(brain_response) for brain_response in event.payload]
-            response = self._best_response(brain_responses)
+        with timer("turn"), time_budget(self._reply_timeout):
+            if self._stream_replies and not any('text_response' in response for response in event.payload):
+                self._publish_reply_parts(event.payload)
+                return
+
+            response = self._process_responses(event.payload)
+
         if response:
             extractor_event = self._create_payload(response)
             self._event_bus.publish(self._output_topic, Event.for_payload(extractor_event))
             logger.debug("Created reply: %s", extractor_event.signal.text)
 
+    def _process_responses(self, payload):
+        response = None
+        for brain_response in payload:
+            if 'text_response' in brain_response and (self._pool or self._repliers):
+                response = self._llamalize_within_budget(brain_response['text_response'])
+        if not response:
+            # Imported on first use, importing the brain loads rdflib
+            from cltl.brain.utils.helper_functions import brain_response_to_json
+
+            # Casefolded capsules are cached on the brain responses and shared by all repliers
+            brain_responses = [BrainResponse(brain_response_to_json(brain_response)) for brain_response in payload]
+            if self._executor or self._pool or self._reply_timeout:
+                response = self._best_response_within_budget(brain_responses)
+            else:
+                response = self._best_response(brain_responses)
+
+        return response
+
+    def _publish_reply_parts(self, payload):
+        """Publish the parts of the best reply as soon as they are generated, followed by a SignalStopped event
+        that marks the end of the reply. The marker has no text, its signal has the id of the last part."""
+        from cltl.brain.utils.helper_functions import brain_response_to_json
+
+        brain_responses = [BrainResponse(brain_response_to_json(brain_response)) for brain_response in payload]
+
+        parts = []
+        last_signal_id = None
+        for part in self._stream_best_response(brain_responses):
+            parts.append(part)
+            if part.strip():
+                last_signal_id = self._publish_part(part.strip())
+
+        response = "".join(parts).strip()
+        if not response and budget_exceeded():
+            logger.warning("Reply generation exceeded the budget of %ss, use fallback reply", self._reply_timeout)
+            response = self._fallback_response(brain_responses)
+            last_signal_id = self._publish_part(response)
+
+        if response:
+            self._event_bus.publish(self._output_topic,
+                                    Event.for_payload(self._create_stopped_payload(last_signal_id)))
+            logger.debug("Created streamed reply: %s", response)
+
+    def _publish_part(self, part):
+        """Publish a part of the reply, returns the id of its signal."""
+        extractor_event = self._create_payload(part)
+        self._event_bus.publish(self._output_topic, Event.for_payload(extractor_event))
+
+        return extractor_event.signal.id
+
+    def _stream_best_response(self, brain_responses):
+        """Stream the parts of the first non-empty reply in priority order."""
+        for utterance_type, replier, response in self._ordered_candidates(brain_responses, self._repliers):
+            replied = False
+            for part in self._stream_reply(utterance_type, replier, response):
+                replied = True
+                yield part
+
+            if replied or budget_exceeded():
+                return
+
+    def _stream_reply(self, utterance_type, replier, response):
+        if utterance_type == UtteranceType.STATEMENT:
+            return replier.stream_reply_to_statement(response, persist=True, thought_options=self._thought_options)
+        if utterance_type == UtteranceType.QUESTION:
+            return replier.stream_reply_to_question(response)
+        if utterance_type == UtteranceType.TEXT_MENTION:
+            return replier.stream_reply_to_mention(response, persist=True)
+
+        return iter(())
+
+    def _best_response_within_budget(self, brain_responses):
+        try:
+            if self._concurrent or self._pool:
+                return self._best_response(brain_responses)
+
+            return self._run_in_thread(self._best_response, brain_responses).result(timeout=remaining_budget())
+        except TimeoutError:
+            logger.warning("Reply generation exceeded the budget of %ss, use fallback reply", self._reply_timeout)
+            return self._fallback_response(brain_responses)
+
+    def _llamalize_within_budget(self, text):
+        """Paraphrase the text with the first replier, the text is used as it is if the budget runs out."""
+        try:
+            if self._pool:
+                return self._pool.llamalize(0, text, remaining_budget()).result(timeout=remaining_budget())
+            if self._reply_timeout:
+                return self._run_in_thread(self._repliers[0].llamalize_reply, text).result(timeout=remaining_budget())
+
+            return self._repliers[0].llamalize_reply(text)
+        except TimeoutError:
+            logger.warning("Paraphrasing exceeded the budget of %ss, use the text response", self._reply_timeout)
+            count("fallback_replies")
+            return text
+
+    def _fallback_response(self, brain_responses):
+        """Phrase the cheapest available reply with the pattern phraser, without selecting thoughts or calling
+        a language model."""
+        count("fallback_replies")
+        for brain_response in brain_responses:
+            key = 'statement' if brain_response.get('statement') else 'mention'
+            if not brain_response.get(key) or not brain_response.get('thoughts'):
+                continue
+
+            try:
+                utterance = casefolded(brain_response, key)
+                thoughts = casefolded(brain_response, 'thoughts')
+                reply = self._fallback_phraser.phrase_correct_thought(utterance, '_entity_novelty',
+                                                                      thoughts.get('_entity_novelty'))
+                if reply:
+                    return reply
+            except (KeyError, TypeError):
+                logger.debug("Failed to phrase fallback for %s", brain_response, exc_info=True)
+
+        return Phraser.phrase_fallback()
+
+    def _run_in_thread(self, fn, *args) -> Future:
+        """Run fn on a new thread in a copy of the current context. Replies that exceeded the budget keep running,
+        a thread per event ensures they cannot delay the replies to the following events."""
+        future = Future()
+        context = contextvars.copy_context()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(context.run(fn, *args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"{self.__class__.__name__}-reply", daemon=True).start()
+
+        return future
+
+    def _submit(self, fn, *args):
+        # Run in a copy of the current context to pass the time budget on to the repliers
+        future = self._executor.submit(contextvars.copy_context().run, fn, *args)
+        self._futures.add(future)
+
+        return future
+
     def _best_response(self, brain_responses):
         # logger.debug("Brain responses: %s", brain_responses)
 
-        # Prioritize replies by utterance type first, then by replier, then choose random
-        typed_responses = [(self._get_utterance_type(response), response) for response in brain_responses]
-        typed_responses = filter(lambda x: x[0] in self._utterance_types, typed_responses)
-
-        ordered_responses = [(utt_type, replier, response)
-                             for utt_type, response in self._ordered_by_type(typed_responses)
-                             for replier in self._repliers]
+        # In the worker processes the repliers are referred to by their index
+        repliers = range(self._pool.replier_count) if self._pool else self._repliers
+        ordered_responses = self._ordered_candidates(brain_responses, repliers)
         #  logger.debug("Ordered responses: %s", ordered_responses)
 
         if not ordered_responses:
             logger.debug("No responses for %s", brain_responses)
             return None
 
+        if self._pool:
+            return self._concurrent_reply(ordered_responses)
+        if self._concurrent and self._executor:
+            return self._concurrent_replier_reply(ordered_responses)
+
         replies = map(self._get_reply, *zip(*ordered_responses))
         return next(filter(None, replies), None)
 
+    def _ordered_candidates(self, brain_responses, repliers):
+        # Prioritize replies by utterance type first, then by replier, then choose random
+        typed_responses = [(self._get_utterance_type(response), response) for response in brain_responses]
+        typed_responses = filter(lambda x: x[0] in self._utterance_types, typed_responses)
+
+        return [(utt_type, replier, response)
+                for utt_type, response in self._ordered_by_type(typed_responses)
+                for replier in repliers]
+
+    def _concurrent_reply(self, ordered_responses):
+        """Compute all candidate replies on the process pool and return the first non-empty reply in priority order.
+        The worker processes have their own instances of the repliers.
+
+        A reply is only returned once all candidates with a higher priority finished without a reply,
+        pending candidates with a lower priority are cancelled.
+        """
+        futures = [self._submit_reply(*candidate) for candidate in ordered_responses]
+        try:
+            for future in futures:
+                reply = future.result(timeout=remaining_budget())
+                if reply:
+                    return reply
+
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _submit_reply(self, utterance_type, replier, response):
+        return self._pool.reply(utterance_type, replier, response, self._thought_options, remaining_budget())
+
+    def _concurrent_replier_reply(self, ordered_responses):
+        """Compute the candidate replies of the repliers concurrently on the thread pool and return the first
+        non-empty reply in priority order.
+
+        The candidates of a replier are tried one after another in priority order in a single task, such that a
+        replier is never used concurrently. Only the replier of the returned reply keeps the conversation state of
+        its reply, the other repliers are restored to their state before the event.
+        """
+        candidates = dict()
+        for position, (utterance_type, replier, response) in enumerate(ordered_responses):
+            candidates.setdefault(replier, []).append((position, utterance_type, response))
+        futures = {replier: self._submit(self._replier_reply, replier, replier_candidates)
+                   for replier, replier_candidates in candidates.items()}
+
+        try:
+            for position, (_, replier, _) in enumerate(ordered_responses):
+                reply_position, reply, state = futures[replier].result(timeout=remaining_budget())
+                if reply_position == position:
+                    replier.restore_conversation_state(state)
+                    return reply
+
+            return None
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+    def _replier_reply(self, replier, candidates):
+        """Try the candidates of a replier in priority order and restore the conversation state of the replier.
+
+        Returns
+        -------
+        Tuple[int, str, object]
+            Position of the first candidate with a reply, the reply and the conversation state of the replier after
+            the reply, (None, None, None) if there is no reply
+        """
+        state = replier.conversation_state()
+        try:
+            for position, utterance_type, response in candidates:
+                reply = self._get_reply(utterance_type, replier, response)
+                if reply:
+                    return position, reply, replier.conversation_state()
+                if budget_exceeded():
+                    break
+
+            return None, None, None
+        finally:
+            replier.restore_conversation_state(state)
+
     def _ordered_by_type(self, typed_responses: Tuple[UtteranceType, str]) -> Tuple[UtteranceType, str]:
         randomized = list(typed_responses)
         random.shuffle(randomized)
@@ -118,14 +493,7 @@ class ReplyGenerationService:
         return self._utterance_types.index(utterance_response[0])
 
     def _get_reply(self, utterance_type, replier, response):
-        if utterance_type == UtteranceType.STATEMENT:
-            return replier.reply_to_statement(response, persist=True, thought_options=self._thought_options)
-        if utterance_type == UtteranceType.QUESTION:
-            return replier.reply_to_question(response)
-        if utterance_type == UtteranceType.TEXT_MENTION:
-            return replier.reply_to_mention(response, persist=True)
-
-        return None
+        return get_reply(utterance_type, replier, response, self._thought_options)
 
     def _get_utterance_type(self, brain_response):
         if 'statement' in brain_response:
@@ -147,8 +515,23 @@ class ReplyGenerationService:
         except:
             return None
 
+    @timed("create_payload")
     def _create_payload(self, response):
+        # Imported on first use, importing emissor loads rdflib
+        from cltl.combot.event.emissor import TextSignalEvent
+        from emissor.representation.scenario import TextSignal
+
         scenario_id = self._emissor_data.get_current_scenario_id()
         signal = TextSignal.for_scenario(scenario_id, timestamp_now(), timestamp_now(), None, response)
 
         return TextSignalEvent.for_agent(signal)
+
+    def _create_stopped_payload(self, signal_id):
+        from cltl.combot.event.emissor import SignalStopped
+        from emissor.representation.scenario import Modality, TextSignal
+
+        # Refers to the signal with the last part of the reply, without text the reply is not repeated
+        scenario_id = self._emissor_data.get_current_scenario_id()
+        signal = TextSignal.for_scenario(scenario_id, timestamp_now(), timestamp_now(), None, signal_id=signal_id)
+
+        return SignalStopped(SignalStopped.__name__, Modality.TEXT, signal)
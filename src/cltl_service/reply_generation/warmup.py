@@ -0,0 +1,52 @@
+"""
+Representative brain responses to warm up the repliers before the service handles the first turn.
+
+The first reply of a replier pays for loading models (Ollama loads the model on the first request, NSP and GODEL
+initialize their kernels lazily) and for evaluating the prompt prefix of llama.cpp. The service replays a few brain
+responses per utterance type, e.g. from the JSON files in examples/data, through every replier before it starts
+processing events.
+"""
+
+import json
+import logging
+from typing import Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# Keys of the brain response that determine its utterance type
+UTTERANCE_KEYS = ('statement', 'question', 'mention')
+
+
+def load_warmup_capsules(paths: Iterable[str], per_type: int = 2) -> List[dict]:
+    """Load the first brain responses per utterance type from JSON files with a list of brain responses.
+
+    Parameters
+    ----------
+    paths: Iterable[str]
+        Paths of the JSON files
+    per_type: int
+        Maximum number of brain responses per utterance type
+
+    Returns
+    -------
+    List[dict]
+        JSON brain responses
+    """
+    selected = {key: [] for key in UTTERANCE_KEYS}
+    for path in paths:
+        try:
+            with open(path) as file:
+                capsules = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load warm-up capsules from %s: %s", path, e)
+            continue
+
+        for capsule in capsules:
+            key = next((key for key in UTTERANCE_KEYS if capsule.get(key)), None)
+            if key and len(selected[key]) < per_type:
+                selected[key].append(capsule)
+
+    capsules = [capsule for key in UTTERANCE_KEYS for capsule in selected[key]]
+    logger.info("Loaded %s warm-up capsules from %s", len(capsules), paths)
+
+    return capsules
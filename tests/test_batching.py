@@ -0,0 +1,95 @@
+import threading
+import unittest
+
+from cltl.reply_generation.utils.batching import BatchScheduler
+
+
+class RecordingFunction:
+    """Doubles the inputs and records the batches, fails on the input `invalid`."""
+
+    def __init__(self, invalid=None):
+        self.invalid = invalid
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def __call__(self, inputs):
+        with self._lock:
+            self.batches.append(list(inputs))
+        if self.invalid in inputs:
+            raise ValueError(f"Invalid input {self.invalid}")
+
+        return [2 * input for input in inputs]
+
+
+class BatchSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.function = RecordingFunction(invalid=-1)
+
+    def scheduler(self, **kwargs):
+        scheduler = BatchScheduler(self.function, **kwargs)
+        self.addCleanup(scheduler.stop)
+
+        return scheduler
+
+    def test_coalesce_concurrent_inputs(self):
+        scheduler = self.scheduler(max_wait=1.0, max_batch=4)
+
+        futures = [scheduler.submit(input) for input in range(4)]
+
+        self.assertEqual([0, 2, 4, 6], [future.result(timeout=5) for future in futures])
+        self.assertEqual([[0, 1, 2, 3]], self.function.batches)
+        self.assertEqual(1.0, scheduler.fill_rate)
+
+    def test_coalesce_inputs_of_threads(self):
+        scheduler = self.scheduler(max_wait=1.0, max_batch=4)
+        outputs = dict()
+
+        def call(inputs):
+            outputs[tuple(inputs)] = scheduler.map(inputs)
+
+        threads = [threading.Thread(target=call, args=(inputs,)) for inputs in ([1, 2], [3, 4])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual({(1, 2): [2, 4], (3, 4): [6, 8]}, outputs)
+        self.assertEqual(1, len(self.function.batches))
+        self.assertCountEqual([1, 2, 3, 4], self.function.batches[0])
+
+    def test_split_at_max_batch(self):
+        scheduler = self.scheduler(max_wait=0.05, max_batch=2)
+
+        self.assertEqual([2, 4, 6, 8, 10], scheduler.map([1, 2, 3, 4, 5]))
+        self.assertEqual([[1, 2], [3, 4], [5]], self.function.batches)
+        self.assertEqual(5 / 6, scheduler.fill_rate)
+
+    def test_isolate_errors(self):
+        scheduler = self.scheduler(max_wait=1.0, max_batch=4)
+
+        futures = scheduler.submit_all([1, -1, 3])
+
+        self.assertEqual(2, futures[0].result(timeout=5))
+        with self.assertRaises(ValueError):
+            futures[1].result(timeout=5)
+        self.assertEqual(6, futures[2].result(timeout=5))
+        # The failing batch is retried one input at a time
+        self.assertEqual([[1, -1, 3], [1], [-1], [3]], self.function.batches)
+
+    def test_invalid_number_of_outputs(self):
+        scheduler = BatchScheduler(lambda inputs: [], max_wait=0.01, max_batch=4)
+        self.addCleanup(scheduler.stop)
+
+        with self.assertRaises(ValueError):
+            scheduler.map([1, 2])
+
+    def test_submit_after_stop(self):
+        scheduler = self.scheduler()
+        scheduler.stop()
+
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Budgets in milliseconds
+BUDGETS = {
+    "cltl.reply_generation.lenka_replier": 150,
+    "cltl_service.reply_generation.service": 750,
+}
+
+# Optional backends that must only be loaded when the replier or method that needs them is used
+HEAVY_MODULES = ("torch", "transformers", "matplotlib", "httpx", "ollama", "langchain_ollama", "openai", "rdflib")
+
+REPEAT = 3
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def import_time(module):
+    """Import the module in a fresh interpreter with `python -X importtime`.
+
+    returns: cumulative import time of the module in milliseconds and the heavy modules that were loaded
+    """
+    check = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", check], env=env, capture_output=True,
+                            text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = None
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            cumulative = int(line.split("|")[1]) / 1000
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+
+    return cumulative, loaded
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_time(self):
+        for module, budget in BUDGETS.items():
+            with self.subTest(module=module):
+                try:
+                    timings = [import_time(module) for _ in range(REPEAT)]
+                except ImportError as e:
+                    self.skipTest(f"{module} cannot be imported in this environment: {e}")
+
+                duration = min(cumulative for cumulative, _ in timings)
+                self.assertLessEqual(duration, budget, f"{module} takes {duration:.1f} ms to import")
+
+    def test_no_heavy_modules(self):
+        for module in BUDGETS:
+            with self.subTest(module=module):
+                try:
+                    _, loaded = import_time(module)
+                except ImportError as e:
+                    self.skipTest(f"{module} cannot be imported in this environment: {e}")
+
+                self.assertEqual([], loaded, f"importing {module} loads {', '.join(loaded)}")
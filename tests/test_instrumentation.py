@@ -0,0 +1,45 @@
+import unittest
+
+from cltl.reply_generation.utils import instrumentation
+from cltl.reply_generation.utils.instrumentation import STAGE_METRIC, count, timer
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.metrics = instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def timer_labels(self):
+        return {labels for name, labels in self.metrics.summary()["timers"] if name == STAGE_METRIC}
+
+    def test_labels_are_sorted(self):
+        with timer("reply", utterance_type="STATEMENT", replier="Replier"):
+            pass
+        with timer("reply", replier="Replier", utterance_type="STATEMENT"):
+            pass
+
+        self.assertEqual({(("replier", "Replier"), ("stage", "reply"), ("utterance_type", "STATEMENT"))},
+                         self.timer_labels())
+
+    def test_only_propagated_labels_are_inherited(self):
+        with timer("warmup", phase="cold", replier="Replier"):
+            with timer("phrase", thought_type="_trust"):
+                count("replies", replied=True)
+
+        self.assertIn((("phase", "cold"), ("replier", "Replier"), ("stage", "warmup")), self.timer_labels())
+        self.assertIn((("replier", "Replier"), ("stage", "phrase"), ("thought_type", "_trust")), self.timer_labels())
+        self.assertEqual({("replies", (("replied", "True"), ("replier", "Replier"))): 1},
+                         self.metrics.summary()["counters"])
+
+    def test_stage_is_not_inherited(self):
+        with timer("turn"):
+            with timer("reply", replier="Replier"):
+                pass
+
+        self.assertEqual({(("stage", "turn"),), (("replier", "Replier"), ("stage", "reply"))}, self.timer_labels())
+
+
+if __name__ == '__main__':
+    unittest.main()
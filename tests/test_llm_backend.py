@@ -0,0 +1,108 @@
+import importlib.util
+import os
+import time
+import unittest
+
+from cltl.reply_generation.backends.llm_backend import OllamaBackend, OpenAIBackend
+
+
+def _load_fake_llm_server():
+    path = os.path.join(os.path.dirname(__file__), "..", "examples", "fake_llm_server.py")
+    spec = importlib.util.spec_from_file_location("fake_llm_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+fake_llm_server = _load_fake_llm_server()
+
+MESSAGES = [{"role": "user", "content": "hello there"}]
+
+
+class RecordingHandler(fake_llm_server.FakeLLMHandler):
+    """Records the last message of the requests that were answered completely or closed by the client."""
+
+    def reply_tokens(self, request):
+        self.content = request["messages"][-1]["content"]
+
+        return super().reply_tokens(request)
+
+    def do_POST(self):
+        try:
+            super().do_POST()
+            self.server.completed.append(self.content)
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.closed.append(self.content)
+
+
+class OpenAIBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.server = fake_llm_server.serve(token_latency=0.01, prefill_latency=0.01, handler=RecordingHandler)
+        self.server.completed = []
+        self.server.closed = []
+        self.backend = self.create_backend(f"http://localhost:{self.server.server_port}")
+
+    def tearDown(self):
+        self.backend.close()
+        self.server.shutdown()
+
+    def create_backend(self, url):
+        return OpenAIBackend(url + "/v1")
+
+    def wait_for_requests(self, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while len(self.server.completed) + len(self.server.closed) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_chat_sync(self):
+        reply = self.backend.chat_sync("fake", MESSAGES, timeout=5)
+
+        self.assertEqual("In other words: hello there", reply)
+
+    def test_stream_chat_sync(self):
+        chunks = list(self.backend.stream_chat_sync("fake", MESSAGES, timeout=5))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("In other words: hello there", "".join(chunks).strip())
+
+    def test_stream_chat_sync_close(self):
+        long_content = " ".join(["word"] * 100)
+        chunks = self.backend.stream_chat_sync("fake", [{"role": "user", "content": long_content}], timeout=5)
+        self.assertEqual("In ", next(chunks))
+        chunks.close()
+
+        self.wait_for_requests(1)
+        self.assertEqual([long_content], self.server.closed)
+
+    def test_first_stream_chat_sync(self):
+        # The prefill latency of the long prompt delays its completion
+        long_content = " ".join(["word"] * 50)
+        prompts = [[{"role": "user", "content": long_content}], [{"role": "user", "content": "short prompt"}]]
+
+        reply = "".join(self.backend.first_stream_chat_sync("fake", prompts, timeout=5)).strip()
+
+        self.assertEqual("In other words: short prompt", reply)
+        self.wait_for_requests(2)
+        self.assertEqual(["short prompt"], self.server.completed)
+        self.assertEqual([long_content], self.server.closed)
+
+
+class OllamaBackendTest(OpenAIBackendTest):
+    def create_backend(self, url):
+        return OllamaBackend(url)
+
+
+class SharedBackendTest(unittest.TestCase):
+    def test_shared_per_options(self):
+        backend = OllamaBackend.shared("http://localhost:11434", keep_alive="5m")
+
+        self.assertIs(backend, OllamaBackend.shared("http://localhost:11434/", keep_alive="5m"))
+        self.assertIsNot(backend, OllamaBackend.shared("http://localhost:11434", keep_alive="30m"))
+        self.assertIsNot(backend, OllamaBackend.shared("http://localhost:11434", keep_alive="5m", timeout=10.0))
+        self.assertIsNot(OpenAIBackend.shared("http://localhost:11434", timeout=10.0),
+                         OpenAIBackend.shared("http://localhost:11434", timeout=20.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from cltl.reply_generation.utils.paraphrase_cache import ParaphraseCache
+
+
+class ParaphraseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "paraphrases.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def rows(self):
+        with sqlite3.connect(self.filename) as db:
+            return [key for key, in db.execute("SELECT key FROM paraphrases ORDER BY created")]
+
+    def test_lru_eviction(self):
+        cache = ParaphraseCache(max_size=2)
+        cache.put("a", "paraphrase a")
+        cache.put("b", "paraphrase b")
+        self.assertEqual("paraphrase a", cache.get("a"))
+        cache.put("c", "paraphrase c")
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual("paraphrase a", cache.get("a"))
+        self.assertEqual("paraphrase c", cache.get("c"))
+        self.assertEqual((3, 1), (cache.hits, cache.misses))
+
+    def test_ttl_expiry(self):
+        cache = ParaphraseCache(ttl=0.05, filename=self.filename)
+        cache.put("a", "paraphrase a")
+        self.assertEqual("paraphrase a", cache.get("a"))
+
+        time.sleep(0.1)
+        cache.put("b", "paraphrase b")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual("paraphrase b", cache.get("b"))
+        self.assertEqual(["b"], self.rows())
+        cache.close()
+
+    def test_reopen_persisted_cache(self):
+        cache = ParaphraseCache(filename=self.filename)
+        cache.put("a", "paraphrase a")
+        cache.close()
+
+        cache = ParaphraseCache(filename=self.filename)
+        self.assertEqual(0, len(cache))
+        self.assertEqual("paraphrase a", cache.get("a"))
+        self.assertEqual(1, cache.hits)
+        cache.close()
+
+    def test_persisted_size_is_bounded(self):
+        cache = ParaphraseCache(max_size=2, filename=self.filename)
+        for key in ("a", "b", "c"):
+            cache.put(key, "paraphrase " + key)
+            time.sleep(0.01)
+        cache.close()
+
+        self.assertEqual(["b", "c"], self.rows())
+
+        cache = ParaphraseCache(max_size=1, filename=self.filename)
+        cache.close()
+
+        self.assertEqual(["c"], self.rows())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from collections import Counter
+
+from cltl.reply_generation.rl_replier import RLReplier
+
+
+class CountingBrain(object):
+    """Brain that counts the queries, every statement adds 10 triples."""
+
+    def __init__(self):
+        self.queries = Counter()
+        self.statements = 1
+
+    def count_triples(self):
+        self.queries['count_triples'] += 1
+        return 10 * self.statements
+
+    def count_statements(self):
+        self.queries['count_statements'] += 1
+        return self.statements
+
+    def count_perspectives(self):
+        self.queries['count_perspectives'] += 1
+        return self.statements
+
+    def get_all_negation_conflicts(self):
+        self.queries['get_all_negation_conflicts'] += 1
+        return []
+
+    def count_friends(self):
+        self.queries['count_friends'] += 1
+        return 1
+
+
+def brain_response(turn):
+    return {'statement': {'turn': turn, 'triple': {}}, 'thoughts': {}}
+
+
+class RewardQueriesTest(unittest.TestCase):
+    def setUp(self):
+        self.brain = CountingBrain()
+
+    def reward_turns(self, replier, turns):
+        for turn in range(turns):
+            self.brain.statements += 1
+            replier.reward_thought(brain_response(turn))
+
+    def test_tracked_rewards_do_not_query_the_brain(self):
+        replier = RLReplier(self.brain, refresh_interval=3600)
+        self.reward_turns(replier, 1)
+        initial_queries = sum(self.brain.queries.values())
+
+        self.reward_turns(replier, 10)
+
+        self.assertEqual(initial_queries, sum(self.brain.queries.values()))
+        self.assertEqual(11, len(replier.state_history))
+
+    def test_exact_triples_query_the_triples_only(self):
+        replier = RLReplier(self.brain, refresh_interval=3600, exact_triples=True)
+        self.reward_turns(replier, 1)
+        initial_queries = Counter(self.brain.queries)
+
+        self.reward_turns(replier, 10)
+
+        self.assertEqual({'count_triples': 10}, self.brain.queries - initial_queries)
+        self.assertEqual(10 * self.brain.statements, replier.state_history[-1])
+
+    def test_untracked_rewards_query_the_brain(self):
+        replier = RLReplier(self.brain)
+
+        self.reward_turns(replier, 10)
+
+        self.assertEqual({'count_triples': 10}, self.brain.queries)
+
+    def test_brain_response_is_required_if_tracked(self):
+        replier = RLReplier(self.brain, refresh_interval=3600)
+
+        with self.assertRaises(ValueError):
+            replier.reward_thought()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cltl.combot.event.emissor import SignalStopped, TextSignalEvent
+from cltl.combot.infra.event import Event
+from cltl.commons.discrete import UtteranceType
+
+from cltl.reply_generation.api import BasicReplier
+from cltl.reply_generation.rl_replier import RLReplier
+from cltl_service.reply_generation.service import ReplyGenerationService
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "examples", "data")
+
+
+def statement(utterance):
+    return {'statement': {'utterance': utterance, 'utterance_type': UtteranceType.STATEMENT.name}, 'thoughts': {}}
+
+
+class SlowReplier(BasicReplier):
+    """Returns the first reply after `delay` seconds, all following replies immediately."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self._delay = delay
+        self.finished = threading.Event()
+        self.calls = 0
+
+    def reply_to_statement(self, brain_response, persist=False, thought_options=None):
+        return self._reply(f"Reply to {brain_response['statement']['utterance']}")
+
+    def llamalize_reply(self, text_response):
+        return self._reply(f"Paraphrase of {text_response}")
+
+    def _reply(self, reply):
+        self.calls += 1
+        if self.calls == 1:
+            time.sleep(self._delay)
+            self.finished.set()
+
+        return reply
+
+
+class ReplyTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.replier = SlowReplier(delay=2.0)
+        self.event_bus = MagicMock()
+        emissor_data = MagicMock()
+        emissor_data.get_current_scenario_id.return_value = "scenario"
+
+        self.service = ReplyGenerationService("input", "output", [], "intention", [self.replier],
+                                              [UtteranceType.STATEMENT], [], emissor_data, self.event_bus, None,
+                                              reply_timeout=0.5)
+
+    def tearDown(self):
+        self.replier.finished.wait(5)
+
+    def published_replies(self):
+        return [call.args[1].payload.signal.text for call in self.event_bus.publish.call_args_list]
+
+    def test_reply_after_timeout(self):
+        start = time.monotonic()
+        self.service._process(Event.for_payload([statement("the first statement")]))
+        self.service._process(Event.for_payload([statement("the second statement")]))
+        duration = time.monotonic() - start
+
+        replies = self.published_replies()
+        self.assertEqual(2, len(replies))
+        self.assertNotEqual("Reply to the first statement", replies[0])
+        self.assertEqual("Reply to the second statement", replies[1])
+        # The second event is not delayed by the reply to the first event that is still running
+        self.assertFalse(self.replier.finished.is_set())
+        self.assertLess(duration, 1.5)
+
+    def test_text_response_after_timeout(self):
+        self.service._process(Event.for_payload([{'text_response': "the first text"}]))
+        self.service._process(Event.for_payload([{'text_response': "the second text"}]))
+
+        self.assertEqual(["the first text", "Paraphrase of the second text"], self.published_replies())
+        self.assertFalse(self.replier.finished.is_set())
+
+
+class RecordingRLReplier(RLReplier):
+    """Records the thought of each reply, replies to `slow_utterance` after a delay."""
+
+    def __init__(self, slow_utterance=None):
+        super().__init__(None)
+        self._slow_utterance = slow_utterance
+        self.thoughts = dict()
+
+    def reply_to_statement(self, brain_response, persist=False, thought_options=None):
+        if brain_response['statement']['utterance'] == self._slow_utterance:
+            time.sleep(0.2)
+
+        reply = super().reply_to_statement(brain_response, persist=persist, thought_options=thought_options)
+        self.thoughts[reply] = self._last_thought
+
+        return reply
+
+
+class ConcurrentReplyStateTest(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(DATA_DIR, "basic-statements-responses.json")) as file:
+            self.responses = json.load(file)[:2]
+        self.first, self.second = [response['statement']['utterance'] for response in self.responses]
+
+        # The lower priority candidate of the second response finishes last
+        self.replier = RecordingRLReplier(slow_utterance=self.second)
+        self.other_replier = RecordingRLReplier()
+        self.event_bus = MagicMock()
+        emissor_data = MagicMock()
+        emissor_data.get_current_scenario_id.return_value = "scenario"
+
+        self.service = ReplyGenerationService("input", "output", [], "intention", [self.replier, self.other_replier],
+                                              [UtteranceType.STATEMENT], ['_entity_novelty', '_complement_gaps'],
+                                              emissor_data, self.event_bus, None, max_workers=4)
+        with patch("cltl_service.reply_generation.service.TopicWorker"):
+            self.service.start()
+
+    def tearDown(self):
+        with patch.object(self.service, "_topic_worker"):
+            self.service.stop()
+
+    def test_state_of_published_reply(self):
+        # Keep the order of the brain responses
+        with patch("cltl_service.reply_generation.service.random.shuffle"):
+            self.service._process(Event.for_payload(self.responses))
+        # Wait for the candidates that were not published
+        self.service._executor.shutdown(wait=True)
+
+        replies = [call.args[1].payload.signal.text for call in self.event_bus.publish.call_args_list]
+        self.assertEqual(1, len(replies))
+        self.assertEqual(self.replier.thoughts[replies[0]], self.replier._last_thought)
+        # The reply of the other replier is not published
+        self.assertIsNone(self.other_replier._last_thought)
+
+
+class StreamingReplier(BasicReplier):
+    def stream_reply_to_statement(self, brain_response, persist=False, thought_options=None):
+        yield "Hello there. "
+        yield "How are you?"
+
+
+class StreamedReplyTest(unittest.TestCase):
+    def setUp(self):
+        self.event_bus = MagicMock()
+        emissor_data = MagicMock()
+        emissor_data.get_current_scenario_id.return_value = "scenario"
+
+        self.service = ReplyGenerationService("input", "output", [], "intention", [StreamingReplier()],
+                                              [UtteranceType.STATEMENT], [], emissor_data, self.event_bus, None,
+                                              stream_replies=True)
+
+    def test_published_events(self):
+        self.service._process(Event.for_payload([statement("the statement")]))
+
+        topics = [call.args[0] for call in self.event_bus.publish.call_args_list]
+        payloads = [call.args[1].payload for call in self.event_bus.publish.call_args_list]
+        self.assertEqual(["output"] * 3, topics)
+        self.assertEqual([TextSignalEvent, TextSignalEvent, SignalStopped], [type(payload) for payload in payloads])
+        self.assertEqual(["Hello there.", "How are you?"], [payload.signal.text for payload in payloads[:2]])
+        # The stop marker refers to the last part and does not repeat the reply
+        self.assertEqual(payloads[1].signal.id, payloads[2].signal.id)
+        self.assertEqual("", payloads[2].signal.text)
+
+
+if __name__ == '__main__':
+    unittest.main()